@@ -0,0 +1,302 @@
+"""
+Local stand-in for the Options.tools API.
+
+Serves synthetic options chains, flows, SEC filings and entry analyses over
+HTTP/1.1 keep-alive from a background thread, with configurable payload sizes
+and response latency. Payloads are deterministic for a given ticker and are
+encoded once, so the server's own cost stays out of the measurements.
+
+Run standalone with:
+    python benchmarks/mock_server.py --port 8000 --latency 0.02 --chain-size spy
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# (expirations, strikes per expiration); "spy" is roughly a full SPY chain
+CHAIN_SIZES: Dict[str, Tuple[int, int]] = {
+    "small": (2, 10),
+    "medium": (8, 50),
+    "large": (20, 120),
+    "spy": (32, 200),
+}
+
+SENTIMENTS = ("bullish", "bearish", "neutral")
+FILING_TYPES = ("10-K", "10-Q", "8-K", "4", "13F-HR")
+AS_OF = datetime(2025, 1, 15, 15, 30)
+
+
+def _rng(ticker: str, kind: str) -> random.Random:
+    return random.Random(zlib.crc32(f"{ticker}:{kind}".encode()))
+
+
+def make_chain(ticker: str, size: str = "medium", spot: Optional[float] = None) -> Dict[str, Any]:
+    """Synthetic options chain with call and put contracts at every strike"""
+    expirations, strikes = CHAIN_SIZES[size]
+    rng = _rng(ticker, "chain")
+    spot = spot or round(rng.uniform(20, 600), 2)
+    step = max(0.5, round(spot * 0.005, 1))
+    first_strike = round(spot - step * strikes / 2, 1)
+    options: List[Dict[str, Any]] = []
+    for e in range(expirations):
+        expiration = (AS_OF.date() + timedelta(days=7 * (e + 1))).isoformat()
+        for s in range(strikes):
+            strike = round(first_strike + s * step, 2)
+            moneyness = (spot - strike) / spot
+            for option_type in ("call", "put"):
+                intrinsic = max(0.0, spot - strike if option_type == "call" else strike - spot)
+                mid = round(intrinsic + spot * 0.02 * rng.random() + 0.05, 2)
+                delta = max(-1.0, min(1.0, 0.5 + moneyness * 5))
+                options.append({
+                    "strike": strike,
+                    "expiration": expiration,
+                    "type": option_type,
+                    "bid": round(mid * 0.98, 2),
+                    "ask": round(mid * 1.02, 2),
+                    "last": mid,
+                    "volume": rng.randint(0, 5000),
+                    "open_interest": rng.randint(0, 50000),
+                    "implied_volatility": round(rng.uniform(0.1, 0.8), 4),
+                    "delta": round(delta if option_type == "call" else delta - 1, 4),
+                    "gamma": round(rng.uniform(0, 0.05), 4),
+                    "theta": round(-rng.uniform(0, 0.5), 4),
+                    "vega": round(rng.uniform(0, 0.3), 4),
+                })
+    return {"ticker": ticker, "spot_price": spot, "timestamp": AS_OF.isoformat() + "Z", "options": options}
+
+
+def make_flow(ticker: str, orders: int = 200) -> Dict[str, Any]:
+    """Synthetic options flow with consistent premium totals"""
+    rng = _rng(ticker, "flow")
+    items = []
+    for i in range(orders):
+        sentiment = rng.choice(SENTIMENTS)
+        items.append({
+            "timestamp": (AS_OF - timedelta(seconds=orders - i)).isoformat(),
+            "ticker": ticker,
+            "strike": round(rng.uniform(50, 500), 0),
+            "expiration": (AS_OF.date() + timedelta(days=rng.randint(1, 90))).isoformat(),
+            "type": rng.choice(("call", "put")),
+            "size": rng.randint(1, 2000),
+            "premium": round(rng.uniform(1e3, 5e6), 2),
+            "is_sweep": rng.random() < 0.2,
+            "is_unusual": rng.random() < 0.1,
+            "sentiment": sentiment,
+        })
+    return {
+        "ticker": ticker,
+        "timeframe": "1d",
+        "orders": items,
+        "total_premium": sum(o["premium"] for o in items),
+        "bullish_premium": sum(o["premium"] for o in items if o["sentiment"] == "bullish"),
+        "bearish_premium": sum(o["premium"] for o in items if o["sentiment"] == "bearish"),
+        "unusual_count": sum(o["is_unusual"] for o in items),
+    }
+
+
+def make_filings(ticker: str, count: int = 10, sections: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+    """Synthetic SEC filings, newest first, each with a parsed_data payload"""
+    filings = []
+    for i in range(offset, offset + count):
+        rng = _rng(ticker, f"filings:{i}")
+        filed = date(2025, 1, 15) - timedelta(days=9 * i)
+        filings.append({
+            "ticker": ticker,
+            "filing_type": rng.choice(FILING_TYPES),
+            "filing_date": filed.isoformat(),
+            "accession_number": f"0000{zlib.crc32(ticker.encode()):010d}-{filed:%y}-{i:06d}",
+            "url": f"https://www.sec.gov/Archives/edgar/data/{ticker}/{i}",
+            "parsed_data": {
+                f"section_{s}": {"text": "x" * rng.randint(50, 400), "value": rng.random()}
+                for s in range(sections)
+            },
+        })
+    return filings
+
+
+def make_entry_analysis(ticker: str) -> Dict[str, Any]:
+    rng = _rng(ticker, "entry")
+    return {
+        "ticker": ticker,
+        "timestamp": AS_OF.isoformat(),
+        "signals": [
+            {"type": rng.choice(("buy", "sell", "hold")), "strength": rng.uniform(0, 100),
+             "reason": "synthetic", "confidence": rng.random()}
+            for _ in range(5)
+        ],
+        "recommended_action": "hold",
+        "risk_score": rng.uniform(0, 10),
+        "expected_return": rng.uniform(-0.1, 0.2),
+        "stop_loss": None,
+        "take_profit": None,
+    }
+
+
+class MockServer:
+    """
+    Threaded mock API server.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind; 0 picks a free port (see url)
+        latency: Seconds added before every response
+        jitter: Extra uniformly random latency, in seconds
+        chain_size: Default chain size (a key of CHAIN_SIZES); requests may
+            override it with a "size" query parameter
+        flow_orders: Orders per flow response
+        filings: Total filings per ticker, paged with the "limit" and "offset" parameters
+
+    Example:
+        >>> with MockServer(latency=0.01) as server:
+        ...     client = OptionsToolsClient("key", base_url=server.url)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        chain_size: str = "medium",
+        flow_orders: int = 200,
+        filings: int = 10
+    ):
+        if chain_size not in CHAIN_SIZES:
+            raise ValueError(f"Unknown chain size: {chain_size}")
+        self.latency = latency
+        self.jitter = jitter
+        self.chain_size = chain_size
+        self.flow_orders = flow_orders
+        self.filings = filings
+        self.requests = 0
+        self._bodies: Dict[Tuple, bytes] = {}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="options-tools-mock", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def prime(self, tickers: List[str]):
+        """Generate and encode every payload for tickers up front"""
+        for ticker in tickers:
+            for resource in ("options/chain", "options/flow", "sec/filings", "analysis/entry"):
+                self.body(f"/api/v1/{resource}/{ticker}", {})
+
+    def body(self, path: str, query: Dict[str, List[str]]) -> Optional[bytes]:
+        """Encoded response body for a request path, or None if unknown"""
+        parts = path.strip("/").split("/")
+        if parts[:2] != ["api", "v1"] or len(parts) < 4:
+            return None
+        resource, ticker = "/".join(parts[2:4]), parts[-1].upper()
+        size = query.get("size", [self.chain_size])[0]
+        offset = min(int(query.get("offset", [0])[0]), self.filings)
+        limit = min(int(query.get("limit", [self.filings])[0]), self.filings - offset)
+        key = (resource, ticker, size, limit, offset)
+        with self._lock:
+            cached = self._bodies.get(key)
+        if cached is not None:
+            return cached
+
+        if resource == "options/chain" and size in CHAIN_SIZES:
+            data: Any = make_chain(ticker, size)
+        elif resource == "options/flow":
+            data = make_flow(ticker, self.flow_orders)
+        elif resource == "sec/filings":
+            data = make_filings(ticker, limit, offset=offset)
+        elif resource == "analysis/entry":
+            data = make_entry_analysis(ticker)
+        else:
+            return None
+        encoded = json.dumps({"status": "success", "data": data}).encode()
+        with self._lock:
+            self._bodies[key] = encoded
+        return encoded
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                delay = server.latency + (random.uniform(0, server.jitter) if server.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+                url = urlsplit(self.path)
+                if url.path == "/health":
+                    body: Optional[bytes] = b'{"status": "healthy"}'
+                else:
+                    body = server.body(url.path, parse_qs(url.query))
+                if body is None:
+                    self._send(404, b'{"detail": "Not found"}')
+                else:
+                    self._send(200, body)
+
+            def _send(self, status: int, body: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a mock Options.tools API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency in seconds")
+    parser.add_argument("--chain-size", choices=sorted(CHAIN_SIZES), default="medium")
+    parser.add_argument("--flow-orders", type=int, default=200)
+    parser.add_argument("--filings", type=int, default=10)
+    args = parser.parse_args()
+
+    server = MockServer(
+        args.host, args.port, args.latency, args.jitter,
+        args.chain_size, args.flow_orders, args.filings
+    )
+    print(f"Serving mock Options.tools API on {server.url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
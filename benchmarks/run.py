@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Options.tools client benchmarks.
+
+Starts a local mock server (see mock_server.py) and measures:
+
+- parse: cost of turning decoded chain JSON into models, for chain sizes from
+  small to a full SPY chain (validated, trusted and columnar construction)
+- async: throughput and latency of concurrent OptionsToolsClient requests
+- sync: throughput and latency of sequential OptionsTools requests
+- batch: wall time of batch calls over many tickers
+
+The mock server runs in-process by default, where it shares the GIL with the
+client. For more faithful network numbers start it separately and pass --url:
+
+    python benchmarks/mock_server.py --port 8000 --latency 0.005 &
+    python benchmarks/run.py --url http://127.0.0.1:8000
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py --only parse --sizes small spy
+    python benchmarks/run.py --latency 0.02 --requests 500 --concurrency 50 --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from options_tools.client.client import OptionsTools, OptionsToolsClient
+from options_tools.utils.serialization import json_loads
+from options_tools.models.construct import construct
+from options_tools.models.responses import OptionsChain
+
+try:
+    from options_tools.models.columnar import ColumnarOptionsChain
+    import numpy  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    ColumnarOptionsChain = None
+
+from mock_server import CHAIN_SIZES, MockServer, make_chain
+
+SUITES = ("parse", "async", "sync", "batch")
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """Throughput and latency percentiles (milliseconds) for a run"""
+    latencies = sorted(latencies)
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    """Fastest of repeat timed calls, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_parse(sizes: List[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for size in sizes:
+        payload = json.dumps({"status": "success", "data": make_chain("SPY", size)}).encode()
+        data = json_loads(payload)["data"]
+        result = {
+            "contracts": len(data["options"]),
+            "bytes": len(payload),
+            "decode_ms": best_of(lambda: json_loads(payload), repeat) * 1000,
+            "validate_ms": best_of(lambda: OptionsChain(**data), repeat) * 1000,
+            "construct_ms": best_of(lambda: construct(OptionsChain, data), repeat) * 1000,
+        }
+        if ColumnarOptionsChain is not None:
+            result["columnar_ms"] = best_of(lambda: ColumnarOptionsChain.from_dict(data), repeat) * 1000
+        results[size] = result
+    return results
+
+
+async def _async_run(url: str, requests: int, concurrency: int, trust_server: bool) -> Dict[str, float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    async with OptionsToolsClient(
+        "benchmark", base_url=url, max_connections=concurrency, max_keepalive_connections=concurrency,
+        trust_server=trust_server, coalesce_requests=False
+    ) as client:
+        await client.warm_up(min(concurrency, 10))
+
+        async def one(i: int):
+            async with semaphore:
+                started = time.perf_counter()
+                await client.get_options_chain(f"T{i % 50}", use_cache=False)
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+    return summarize(latencies, elapsed)
+
+
+def bench_async(url: str, requests: int, concurrency: int) -> Dict[str, Dict[str, float]]:
+    return {
+        "validated": asyncio.run(_async_run(url, requests, concurrency, False)),
+        "trusted": asyncio.run(_async_run(url, requests, concurrency, True)),
+    }
+
+
+def bench_sync(url: str, requests: int) -> Dict[str, Dict[str, float]]:
+    latencies = []
+    with OptionsTools("benchmark", base_url=url) as client:
+        client.get_options_chain("WARM")
+        started = time.perf_counter()
+        for i in range(requests):
+            call_started = time.perf_counter()
+            client.get_options_chain(f"T{i % 50}", use_cache=False)
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+    return {"sequential": summarize(latencies, elapsed)}
+
+
+async def _batch_run(url: str, tickers: List[str], concurrency: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    async with OptionsToolsClient(
+        "benchmark", base_url=url, max_concurrency=concurrency, coalesce_requests=False
+    ) as client:
+        for name, method in (
+            ("chains", client.get_options_chains),
+            ("flows", client.get_options_flows),
+            ("entry_analyses", client.get_entry_analyses),
+        ):
+            started = time.perf_counter()
+            batch = await method(tickers, use_cache=False)
+            elapsed = time.perf_counter() - started
+            results[name] = {
+                "tickers": len(tickers),
+                "errors": sum(not r.ok for r in batch.values()),
+                "seconds": elapsed,
+                "tickers_per_second": len(tickers) / elapsed,
+            }
+    return results
+
+
+def bench_batch(url: str, tickers: int, concurrency: int) -> Dict[str, Dict[str, float]]:
+    return asyncio.run(_batch_run(url, [f"T{i}" for i in range(tickers)], concurrency))
+
+
+def print_table(title: str, rows: Dict[str, Dict[str, float]]):
+    print(f"\n{title}")
+    columns = list(next(iter(rows.values())))
+    widths = [max(12, len(c)) + 2 for c in columns]
+    print(f"  {'':<16}" + "".join(f"{c:>{w}}" for c, w in zip(columns, widths)))
+    for name, row in rows.items():
+        cells = "".join(
+            f"{row[c]:>{w}.2f}" if isinstance(row[c], float) else f"{row[c]:>{w}}"
+            for c, w in zip(columns, widths)
+        )
+        print(f"  {name:<16}{cells}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the Options.tools client against a local mock server")
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--sizes", nargs="+", choices=list(CHAIN_SIZES), default=list(CHAIN_SIZES))
+    parser.add_argument("--chain-size", choices=list(CHAIN_SIZES), default="medium",
+                        help="chain size served for network benchmarks")
+    parser.add_argument("--latency", type=float, default=0.005, help="server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random server latency in seconds")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--tickers", type=int, default=100, help="tickers per batch call")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per parse measurement")
+    parser.add_argument("--url", help="use an already running mock server instead of starting one")
+    parser.add_argument("--json", metavar="PATH", help="also write results to a JSON file")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Any] = {}
+    if "parse" in args.only:
+        results["parse"] = bench_parse(args.sizes, args.repeat)
+        print_table("Chain parsing (ms, best of %d)" % args.repeat, results["parse"])
+
+    network = [suite for suite in args.only if suite != "parse"]
+    if network:
+        server = None
+        url = args.url
+        if url is None:
+            server = MockServer(latency=args.latency, jitter=args.jitter, chain_size=args.chain_size)
+            server.prime([f"T{i}" for i in range(max(50, args.tickers))] + ["WARM"])
+            url = server.start().url
+        try:
+            if "async" in network:
+                results["async"] = bench_async(url, args.requests, args.concurrency)
+                print_table(f"Async client, concurrency {args.concurrency}", results["async"])
+            if "sync" in network:
+                results["sync"] = bench_sync(url, args.requests)
+                print_table("Sync client", results["sync"])
+            if "batch" in network:
+                results["batch"] = bench_batch(url, args.tickers, args.concurrency)
+                print_table(f"Batch calls, concurrency {args.concurrency}", results["batch"])
+        finally:
+            if server is not None:
+                server.stop()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,25 +9,90 @@ __version__ = "1.0.0"
 __author__ = "Hasan Mohammad"
 __email__ = "contact@options.tools"
 
-from .client.client import OptionsTools, OptionsToolsClient
+from typing import TYPE_CHECKING
+
 from .utils.exceptions import (
     OptionsToolsError,
     AuthenticationError,
     RateLimitError,
-    ValidationError
+    ValidationError,
+    ReplayMissError,
+    CircuitOpenError
 )
 
+if TYPE_CHECKING:
+    from .client.client import OptionsTools, OptionsToolsClient, BatchResult
+    from .client.cache import ResponseCache
+    from .client.metrics import RequestObserver, RequestEvent, LatencyHistogram
+    from .client.replay import RecordReplayTransport
+    from .client.resilience import HedgePolicy, CircuitBreaker
+    from .client.quota import QuotaScheduler, request_priority
+    from .models.diff import ChainDiff, diff_chains
+    from .storage.sec_filings import SECFilingStore
+    from .storage.chain_snapshots import ChainSnapshotStore
+
+# Public names resolved on first access, so importing the package (e.g. just
+# for an exception class or __version__) doesn't load httpx, pydantic or numpy
+_LAZY_IMPORTS = {
+    "OptionsTools": ".client.client",
+    "OptionsToolsClient": ".client.client",
+    "BatchResult": ".client.client",
+    "ResponseCache": ".client.cache",
+    "RequestObserver": ".client.metrics",
+    "RequestEvent": ".client.metrics",
+    "LatencyHistogram": ".client.metrics",
+    "RecordReplayTransport": ".client.replay",
+    "HedgePolicy": ".client.resilience",
+    "CircuitBreaker": ".client.resilience",
+    "QuotaScheduler": ".client.quota",
+    "request_priority": ".client.quota",
+    "ChainDiff": ".models.diff",
+    "diff_chains": ".models.diff",
+    "SECFilingStore": ".storage.sec_filings",
+    "ChainSnapshotStore": ".storage.chain_snapshots",
+}
+
 __all__ = [
     "OptionsTools",
     "OptionsToolsClient",
+    "BatchResult",
+    "ResponseCache",
+    "RequestObserver",
+    "RequestEvent",
+    "LatencyHistogram",
+    "RecordReplayTransport",
+    "HedgePolicy",
+    "CircuitBreaker",
+    "QuotaScheduler",
+    "request_priority",
+    "ChainDiff",
+    "diff_chains",
+    "SECFilingStore",
+    "ChainSnapshotStore",
     "OptionsToolsError",
     "AuthenticationError",
     "RateLimitError",
     "ValidationError",
+    "ReplayMissError",
+    "CircuitOpenError",
 ]
 
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 # Convenience function for quick setup
-def create_client(api_key: str, **kwargs) -> OptionsTools:
+def create_client(api_key: str, **kwargs) -> "OptionsTools":
     """
     Create an Options.tools client instance.
     
@@ -43,4 +108,5 @@ def create_client(api_key: str, **kwargs) -> OptionsTools:
         >>> client = options_tools.create_client("your_api_key")
         >>> chain = client.get_options_chain("AAPL")
     """
+    from .client.client import OptionsTools
     return OptionsTools(api_key, **kwargs)
\ No newline at end of file
@@ -0,0 +1,6 @@
+from .black_scholes import (
+    BlackScholesEngine,
+    bs_price,
+    bs_greeks,
+    implied_volatility,
+)
@@ -0,0 +1,264 @@
+"""
+Vectorized Black-Scholes pricing, Greeks and implied volatility.
+
+Every function takes NumPy arrays (or scalars that broadcast) so a whole chain
+is priced in one call. Greeks follow the same conventions as the API, which
+computes them with py_vollib: theta is per calendar day, vega and rho are per
+1 percentage point move in volatility and rates.
+
+Requires numpy (pip install options-tools[numpy]).
+"""
+
+from datetime import datetime, timezone
+from typing import Optional, Dict, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    from scipy.special import ndtr as _ndtr
+except ImportError:  # pragma: no cover - optional dependency
+    _ndtr = None
+
+from ..models.columnar import ColumnarOptionsChain, _require_numpy
+from ..models.responses import OptionsChain
+
+SECONDS_PER_YEAR = 365.0 * 24 * 60 * 60
+# Floor on time to expiry so expiring contracts don't divide by zero (one minute)
+MIN_TIME = 60.0 / SECONDS_PER_YEAR
+MIN_VOL = 1e-4
+MAX_VOL = 5.0
+
+
+def norm_pdf(x):
+    return np.exp(-0.5 * x * x) / np.sqrt(2 * np.pi)
+
+
+def norm_cdf(x):
+    if _ndtr is not None:
+        return _ndtr(x)
+    # Chebyshev fit to erfc (Numerical Recipes), fractional error below 1.2e-7
+    z = np.abs(x) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.5 * z)
+    poly = -z * z - 1.26551223 + t * (1.00002368 + t * (0.37409196 + t * (0.09678418 + t * (
+        -0.18628806 + t * (0.27886807 + t * (-1.13520398 + t * (1.48851587 + t * (
+            -0.82215223 + t * 0.17087277))))))))
+    half_erfc = 0.5 * t * np.exp(poly)
+    return np.where(x >= 0, 1.0 - half_erfc, half_erfc)
+
+
+def _d1_d2(spot, strike, t, vol, rate, dividend_yield):
+    sqrt_t = np.sqrt(t)
+    vol_sqrt_t = vol * sqrt_t
+    d1 = (np.log(spot / strike) + (rate - dividend_yield + 0.5 * vol * vol) * t) / vol_sqrt_t
+    return d1, d1 - vol_sqrt_t
+
+
+def bs_price(spot, strike, t, vol, rate=0.0, dividend_yield=0.0, is_call=True):
+    """Black-Scholes-Merton option value"""
+    _require_numpy()
+    spot, strike, vol = np.asarray(spot, float), np.asarray(strike, float), np.asarray(vol, float)
+    t = np.maximum(np.asarray(t, float), MIN_TIME)
+    d1, d2 = _d1_d2(spot, strike, t, vol, rate, dividend_yield)
+    spot_df = spot * np.exp(-dividend_yield * t)
+    strike_df = strike * np.exp(-rate * t)
+    call = spot_df * norm_cdf(d1) - strike_df * norm_cdf(d2)
+    put = strike_df * norm_cdf(-d2) - spot_df * norm_cdf(-d1)
+    return np.where(is_call, call, put)
+
+
+def bs_greeks(spot, strike, t, vol, rate=0.0, dividend_yield=0.0, is_call=True) -> Dict[str, "np.ndarray"]:
+    """
+    Black-Scholes-Merton Greeks.
+
+    Returns:
+        Dict with price, delta, gamma, theta (per day), vega (per 1 vol point)
+        and rho (per 1 rate point)
+    """
+    _require_numpy()
+    spot, strike, vol = np.asarray(spot, float), np.asarray(strike, float), np.asarray(vol, float)
+    t = np.maximum(np.asarray(t, float), MIN_TIME)
+    sqrt_t = np.sqrt(t)
+    d1, d2 = _d1_d2(spot, strike, t, vol, rate, dividend_yield)
+    q_df = np.exp(-dividend_yield * t)
+    r_df = np.exp(-rate * t)
+    pdf_d1 = norm_pdf(d1)
+    cdf_d1, cdf_d2 = norm_cdf(d1), norm_cdf(d2)
+    cdf_md1, cdf_md2 = 1.0 - cdf_d1, 1.0 - cdf_d2
+
+    decay = -spot * q_df * pdf_d1 * vol / (2 * sqrt_t)
+    call_theta = decay - rate * strike * r_df * cdf_d2 + dividend_yield * spot * q_df * cdf_d1
+    put_theta = decay + rate * strike * r_df * cdf_md2 - dividend_yield * spot * q_df * cdf_md1
+
+    return {
+        "price": np.where(
+            is_call,
+            spot * q_df * cdf_d1 - strike * r_df * cdf_d2,
+            strike * r_df * cdf_md2 - spot * q_df * cdf_md1
+        ),
+        "delta": np.where(is_call, q_df * cdf_d1, -q_df * cdf_md1),
+        "gamma": q_df * pdf_d1 / (spot * vol * sqrt_t),
+        "theta": np.where(is_call, call_theta, put_theta) / 365.0,
+        "vega": spot * q_df * pdf_d1 * sqrt_t / 100.0,
+        "rho": np.where(is_call, strike * t * r_df * cdf_d2, -strike * t * r_df * cdf_md2) / 100.0,
+    }
+
+
+def implied_volatility(
+    price,
+    spot,
+    strike,
+    t,
+    rate=0.0,
+    dividend_yield=0.0,
+    is_call=True,
+    tol: float = 1e-6,
+    max_iter: int = 100
+):
+    """
+    Solve for Black-Scholes volatility for every contract at once.
+
+    Uses Newton steps safeguarded by a per-contract bisection bracket, so
+    contracts with tiny vega still converge. Prices outside the no-arbitrage
+    bounds give NaN.
+    """
+    _require_numpy()
+    price, spot, strike, t, is_call = np.broadcast_arrays(
+        np.asarray(price, float), np.asarray(spot, float), np.asarray(strike, float),
+        np.maximum(np.asarray(t, float), MIN_TIME), np.asarray(is_call, bool)
+    )
+    spot_df = spot * np.exp(-dividend_yield * t)
+    strike_df = strike * np.exp(-rate * t)
+    lower = np.where(is_call, np.maximum(spot_df - strike_df, 0.0), np.maximum(strike_df - spot_df, 0.0))
+    upper = np.where(is_call, spot_df, strike_df)
+    valid = np.isfinite(price) & (price > lower) & (price < upper)
+
+    lo = np.full(price.shape, MIN_VOL)
+    hi = np.full(price.shape, MAX_VOL)
+    # Brenner-Subrahmanyam starting point
+    vol = np.clip(np.sqrt(2 * np.pi / t) * price / np.where(spot > 0, spot, np.nan), 0.05, 1.0)
+    vol = np.where(np.isfinite(vol), vol, 0.3)
+    done = ~valid
+
+    for _ in range(max_iter):
+        d1, _d2 = _d1_d2(spot, strike, t, vol, rate, dividend_yield)
+        diff = bs_price(spot, strike, t, vol, rate, dividend_yield, is_call) - price
+        done |= np.abs(diff) < tol
+        if done.all():
+            break
+        hi = np.where(diff > 0, vol, hi)
+        lo = np.where(diff < 0, vol, lo)
+        vega = spot_df * norm_pdf(d1) * np.sqrt(t)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            step = vol - diff / vega
+        bisect = ~np.isfinite(step) | (step <= lo) | (step >= hi)
+        vol = np.where(done, vol, np.where(bisect, 0.5 * (lo + hi), step))
+
+    return np.where(valid, vol, np.nan)
+
+
+def _as_columnar(chain: Union[ColumnarOptionsChain, OptionsChain]) -> ColumnarOptionsChain:
+    if isinstance(chain, ColumnarOptionsChain):
+        return chain
+    return ColumnarOptionsChain.from_chain(chain)
+
+
+class BlackScholesEngine:
+    """
+    Chain-level Black-Scholes calculations.
+
+    Args:
+        rate: Continuously compounded risk-free rate
+        dividend_yield: Continuous dividend yield
+        expiry_hour_utc: Hour of the expiration day (UTC) at which contracts
+            expire; 20.0 is the 4pm New York close during daylight time
+    """
+
+    def __init__(self, rate: float = 0.0, dividend_yield: float = 0.0, expiry_hour_utc: float = 20.0):
+        _require_numpy()
+        self.rate = rate
+        self.dividend_yield = dividend_yield
+        self.expiry_hour_utc = expiry_hour_utc
+
+    def time_to_expiry(self, chain: ColumnarOptionsChain, valuation_time: Optional[datetime] = None):
+        """Year fractions from valuation_time (default: chain timestamp) to each expiry"""
+        valuation_time = valuation_time or chain.timestamp
+        if valuation_time.tzinfo is not None:
+            valuation_time = valuation_time.astimezone(timezone.utc).replace(tzinfo=None)
+        now = np.datetime64(valuation_time, "s")
+        expiry = chain.expiration.astype("datetime64[s]") + np.timedelta64(int(self.expiry_hour_utc * 3600), "s")
+        return np.maximum((expiry - now).astype(np.float64) / SECONDS_PER_YEAR, MIN_TIME)
+
+    def _inputs(self, chain, spot, vol, valuation_time):
+        chain = _as_columnar(chain)
+        spot = chain.spot_price if spot is None else spot
+        vol = chain.implied_volatility if vol is None else vol
+        return chain, spot, vol, self.time_to_expiry(chain, valuation_time)
+
+    def price(
+        self,
+        chain: Union[ColumnarOptionsChain, OptionsChain],
+        spot: Optional[float] = None,
+        vol=None,
+        valuation_time: Optional[datetime] = None
+    ):
+        """Theoretical value of every contract (vol defaults to each contract's IV)"""
+        chain, spot, vol, t = self._inputs(chain, spot, vol, valuation_time)
+        return bs_price(spot, chain.strike, t, vol, self.rate, self.dividend_yield, chain.is_call)
+
+    def greeks(
+        self,
+        chain: Union[ColumnarOptionsChain, OptionsChain],
+        spot: Optional[float] = None,
+        vol=None,
+        valuation_time: Optional[datetime] = None
+    ) -> Dict[str, "np.ndarray"]:
+        chain, spot, vol, t = self._inputs(chain, spot, vol, valuation_time)
+        return bs_greeks(spot, chain.strike, t, vol, self.rate, self.dividend_yield, chain.is_call)
+
+    def implied_vol(
+        self,
+        chain: Union[ColumnarOptionsChain, OptionsChain],
+        prices=None,
+        spot: Optional[float] = None,
+        valuation_time: Optional[datetime] = None
+    ):
+        """IV of every contract from prices (default: bid/ask mid, falling back to last)"""
+        chain = _as_columnar(chain)
+        if prices is None:
+            mid = (chain.bid + chain.ask) / 2
+            prices = np.where(np.isnan(mid), chain.last, mid)
+        spot = chain.spot_price if spot is None else spot
+        t = self.time_to_expiry(chain, valuation_time)
+        return implied_volatility(
+            prices, spot, chain.strike, t, self.rate, self.dividend_yield, chain.is_call
+        )
+
+    def reprice(
+        self,
+        chain: Union[ColumnarOptionsChain, OptionsChain],
+        spot: Optional[float] = None,
+        vol=None,
+        valuation_time: Optional[datetime] = None
+    ) -> ColumnarOptionsChain:
+        """
+        Copy of the chain with Greeks recomputed for a new spot, vol or time.
+
+        The theoretical value is added as a theoretical_price column.
+        """
+        chain, spot, vol, t = self._inputs(chain, spot, vol, valuation_time)
+        result = bs_greeks(spot, chain.strike, t, vol, self.rate, self.dividend_yield, chain.is_call)
+        columns = chain.columns
+        columns["implied_volatility"] = np.broadcast_to(np.asarray(vol, float), len(chain)).copy()
+        for name in ("delta", "gamma", "theta", "vega"):
+            columns[name] = result[name]
+        columns["theoretical_price"] = result["price"]
+        return ColumnarOptionsChain(
+            chain.ticker,
+            float(spot),
+            valuation_time or chain.timestamp,
+            columns,
+            {name: chain.mask(name) for name in ("volume", "open_interest")}
+        )
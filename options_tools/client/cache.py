@@ -0,0 +1,153 @@
+"""
+In-memory TTL cache for API responses.
+
+Entries are keyed by HTTP method, endpoint and normalized query parameters.
+Each endpoint family has its own time-to-live and the cache is bounded by
+entry count, evicting the least recently used entry first.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, Hashable
+
+# Seconds each endpoint family stays fresh, matched by longest prefix
+DEFAULT_TTLS: Dict[str, float] = {
+    "/options/chain": 5.0,
+    "/options/flow": 5.0,
+    "/analysis/entry": 60.0,
+    "/sec/filings": 6 * 60 * 60.0,
+    "/sec/company": 24 * 60 * 60.0,
+    "/account/usage": 30.0,
+}
+
+MISSING = object()
+
+CacheKey = Tuple[Hashable, ...]
+
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _normalize(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    return str(value)
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache with per-endpoint TTLs.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        ttls: Endpoint prefix to TTL in seconds, merged over DEFAULT_TTLS.
+            A TTL of 0 disables caching for that endpoint.
+        default_ttl: TTL for endpoints not matching any prefix
+        stale_ttl: Seconds expired entries are kept for get_stale
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0.0,
+        stale_ttl: float = 0.0
+    ):
+        self.maxsize = maxsize
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: "OrderedDict[CacheKey, Tuple[float, str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+        return (method.upper(), endpoint, _normalize(params or {}))
+
+    def ttl_for(self, endpoint: str) -> float:
+        best = None
+        for prefix in self.ttls:
+            if endpoint.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.ttls[best] if best is not None else self.default_ttl
+
+    def get(self, key: CacheKey) -> Any:
+        """Return the cached value or MISSING if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[2]
+                if entry[0] + self.stale_ttl <= time.monotonic():
+                    del self._entries[key]
+            self.misses += 1
+            return MISSING
+
+    def get_stale(self, key: CacheKey) -> Any:
+        """Return the cached value even if expired (within stale_ttl), or MISSING"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] + self.stale_ttl <= time.monotonic():
+                return MISSING
+            return entry[2]
+
+    def set(self, key: CacheKey, value: Any):
+        endpoint = key[1]
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, endpoint, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            endpoint: Endpoint or endpoint prefix to drop, e.g. "/options/chain/SPY".
+                Drops everything when omitted.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if endpoint is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key, entry in self._entries.items() if entry[1].startswith(endpoint)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        self.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,42 +1,163 @@
+import asyncio
+import threading
+import time
 import httpx
-from typing import Optional, Dict, Any, List
-from datetime import datetime, date
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Iterable, AsyncIterator, Iterator, NamedTuple, Sequence, Union, Type, TypeVar
+from datetime import datetime, date, timedelta
 from ..models.responses import (
     OptionsChain, OptionsFlow, SECFiling, 
     AnalysisResult, PortfolioOptimization
 )
+from ..models.construct import construct
+from ..models.compact import CompactSECFiling
+from ..models.diff import ChainDiff, ChainState, DIFF_FIELDS, diff_chains
 from ..utils.exceptions import (
     OptionsToolsError, AuthenticationError, 
-    RateLimitError, ValidationError
+    RateLimitError, ValidationError, CircuitOpenError, DataNotFoundError,
+    ServerError, NetworkError
 )
+from .rate_limit import RateLimiter, backoff_delay, parse_retry_after
+from .cache import ResponseCache, MISSING
+from .singleflight import SingleFlight
+from .streaming import FlowStream
+from .codecs import accept_encoding, accept_header, decode_body, json_dumps, option_records
+from .conditional import ValidatorStore
+from .metrics import RequestEvent, RequestObserver, notify
+from .resilience import HedgePolicy, CircuitBreaker, IDEMPOTENT_METHODS, CLOSED
+from .quota import QuotaScheduler, current_priority, request_priority
+from .exits import Position, PositionResult, Evaluation, split_book, bulk_items, missing_result
+from ..storage.sec_filings import SECFilingStore
 import logging
 
+if TYPE_CHECKING:
+    # numpy-backed; imported where used so that loading the client doesn't load numpy
+    from ..models.columnar import ColumnarOptionsChain
+    from ..storage.chain_snapshots import ChainSnapshotStore
+
 logger = logging.getLogger(__name__)
 
+M = TypeVar("M")
+
+# Errors a later attempt may not hit; anything else (bad key, bad request,
+# missing recording) would fail the same way every time
+TRANSIENT_ERRORS = (RateLimitError, ServerError, NetworkError, CircuitOpenError, httpx.TransportError)
+
+# Client methods that can be fanned out over a list of tickers
+BATCH_METHODS = (
+    "get_options_chain", "get_options_chain_columnar", "get_options_flow",
+    "get_entry_analysis", "get_sec_filings"
+)
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one ticker in a batch call: either a result or the error it raised"""
+    ticker: str
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class OptionsToolsClient:
     def __init__(
         self, 
         api_key: str,
         base_url: str = "https://api.options.tools",
         timeout: float = 30.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        max_concurrency: int = 10,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        max_rate_limit_wait: float = 60.0,
+        cache: Union[bool, ResponseCache, None] = None,
+        filing_store: Union[str, SECFilingStore, None] = None,
+        snapshot_store: Union[str, "ChainSnapshotStore", None] = None,
+        coalesce_requests: bool = True,
+        trust_server: bool = False,
+        response_format: str = "json",
+        conditional_requests: bool = False,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        warm_connections: int = 0,
+        observers: Optional[Iterable[RequestObserver]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        hedge: Union[bool, HedgePolicy, None] = None,
+        circuit_breaker: Union[bool, CircuitBreaker, None] = None,
+        quota: Union[bool, QuotaScheduler, None] = None
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.rate_limiter = RateLimiter(rate_limit, burst=rate_limit_burst)
+        if cache is True:
+            cache = ResponseCache()
+        self.cache: Optional[ResponseCache] = cache if isinstance(cache, ResponseCache) else None
+        if isinstance(filing_store, str):
+            filing_store = SECFilingStore(filing_store)
+        self.filing_store: Optional[SECFilingStore] = filing_store
+        if isinstance(snapshot_store, str):
+            from ..storage.chain_snapshots import ChainSnapshotStore
+            snapshot_store = ChainSnapshotStore(snapshot_store)
+        self.snapshot_store: Optional["ChainSnapshotStore"] = snapshot_store
+        self.coalesce_requests = coalesce_requests
+        self.trust_server = trust_server
+        self.response_format = response_format
+        accept_header(response_format)
+        self.validators: Optional[ValidatorStore] = ValidatorStore() if conditional_requests else None
+        self._inflight = SingleFlight()
+        # Opened on entering `async with` (or when OptionsTools starts its loop);
+        # a client used without either must call warm_up() itself
+        self.warm_connections = warm_connections
+        self.observers: List[RequestObserver] = list(observers or [])
+        # Whether the API has a bulk exit analysis endpoint; None until first tried
+        self._bulk_exit_analysis: Optional[bool] = None
+        if hedge is True:
+            hedge = HedgePolicy()
+        self.hedge: Optional[HedgePolicy] = hedge if isinstance(hedge, HedgePolicy) else None
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self.circuit_breaker: Optional[CircuitBreaker] = (
+            circuit_breaker if isinstance(circuit_breaker, CircuitBreaker) else None
+        )
+        if self.circuit_breaker is not None and self.cache is not None:
+            # Keep expired responses around to serve while a circuit is open
+            self.cache.stale_ttl = max(self.cache.stale_ttl, self.circuit_breaker.stale_ttl)
+        if quota is True:
+            quota = QuotaScheduler()
+        self.quota: Optional[QuotaScheduler] = quota if isinstance(quota, QuotaScheduler) else None
+        if self.quota is not None:
+            self.quota.bind(lambda: self.get_api_usage(use_cache=False))
         
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             headers={
                 "X-API-Key": self.api_key,
                 "Content-Type": "application/json",
+                "Accept-Encoding": accept_encoding(),
                 "User-Agent": "options-tools-python/1.0.0"
             },
-            timeout=httpx.Timeout(timeout)
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            http2=http2,
+            # A custom transport (e.g. RecordReplayTransport) replaces the
+            # connection pool, so http2 and the limits above don't apply to it
+            transport=transport
         )
     
     async def __aenter__(self):
+        if self.warm_connections:
+            await self.warm_up(self.warm_connections)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -50,55 +171,348 @@ class OptionsToolsClient:
         method: str, 
         endpoint: str, 
         params: Optional[Dict] = None,
-        json: Optional[Dict] = None
+        json: Optional[Dict] = None,
+        use_cache: bool = True,
+        delta: bool = False
     ) -> Dict[str, Any]:
+        cache_key = None
+        if self.cache is not None and method == "GET":
+            cache_key = self.cache.make_key(method, endpoint, params)
+            if use_cache:
+                cached = self.cache.get(cache_key)
+                if cached is not MISSING:
+                    notify(self.observers, "on_cache_hit", method, endpoint)
+                    return cached
+
+        async def fetch():
+            data = await self._send(method, endpoint, params=params, json=json, delta=delta)
+            if cache_key is not None:
+                self.cache.set(cache_key, data)
+            return data
+
+        try:
+            # Identical concurrent GETs share a single in-flight request
+            if self.coalesce_requests and method == "GET":
+                key = cache_key or ResponseCache.make_key(method, endpoint, params)
+                return await self._inflight.do(key, fetch)
+            return await fetch()
+        except OptionsToolsError as e:
+            if isinstance(e, (AuthenticationError, ValidationError, RateLimitError, DataNotFoundError)):
+                raise
+            # Fall back to an expired response while the endpoint's circuit is open
+            stale = self._stale_response(cache_key, method, endpoint)
+            if stale is MISSING:
+                raise
+            return stale
+
+    def _stale_response(self, cache_key, method: str, endpoint: str) -> Any:
+        breaker = self.circuit_breaker
+        if cache_key is None or breaker is None or breaker.state(endpoint) == CLOSED:
+            return MISSING
+        stale = self.cache.get_stale(cache_key)
+        if stale is not MISSING:
+            logger.warning("Serving a stale response for %s while its circuit is open", endpoint)
+            notify(self.observers, "on_stale_response", method, endpoint)
+        return stale
+
+    def _build(self, model: Type[M], data: Dict[str, Any], endpoint: Optional[str] = None) -> M:
+        started = time.perf_counter()
+        # Skip pydantic validation when the server is trusted
+        if self.trust_server:
+            result = construct(model, data)
+        else:
+            result = model(**data)
+        if self.observers and endpoint is not None:
+            notify(self.observers, "on_validate", endpoint, model.__name__, time.perf_counter() - started)
+        return result
+
+    async def request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        as_bytes: bool = False
+    ) -> Union[bytes, Dict[str, Any], List[Any]]:
+        """
+        Call an API endpoint without building response models.
+
+        Args:
+            method: HTTP method
+            endpoint: Path below /api/v1, e.g. "/options/chain/SPY"
+            params: Query parameters
+            json: JSON body
+            as_bytes: Return the undecoded response body instead of its data
+
+        Returns:
+            The decoded "data" payload, or the raw body bytes when as_bytes is set
+        """
+        if as_bytes:
+            return await self._send(method, endpoint, params=params, json=json, decode=False)
+        return await self._request(method, endpoint, params=params, json=json)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        decode: bool = True,
+        delta: bool = False
+    ) -> Any:
         url = f"/api/v1{endpoint}"
+        validator_key = None
+        if self.validators is not None and method == "GET" and decode:
+            validator_key = ResponseCache.make_key(method, endpoint, params)
         
+        breaker = self.circuit_breaker
         for attempt in range(self.max_retries):
+            last_attempt = attempt >= self.max_retries - 1
+            if breaker is not None and not breaker.allow(endpoint):
+                raise CircuitOpenError(
+                    f"Circuit open for {endpoint}", retry_after=breaker.retry_after(endpoint)
+                )
+            event = RequestEvent(method, endpoint, attempt)
+            if self.quota is not None:
+                event.queue_wait = await self.quota.acquire(endpoint)
+            event.queue_wait += await self.rate_limiter.acquire()
+            if event.queue_wait > 0:
+                notify(self.observers, "on_rate_limit_wait", endpoint, event.queue_wait)
+            notify(self.observers, "on_request_start", method, endpoint, attempt)
+            retry_delay = None
+            started = time.perf_counter()
             try:
-                response = await self.client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json
+                headers = {"Accept": accept_header(
+                    self.response_format, columnar=endpoint.startswith("/options/chain/")
+                )}
+                conditional_headers = {}
+                if validator_key is not None:
+                    conditional_headers = self.validators.request_headers(validator_key, delta=delta)
+                response = await self._fetch(
+                    method, endpoint, url, params, json, dict(headers, **conditional_headers)
+                )
+                not_modified = None
+                if response.status_code == 304 and validator_key is not None:
+                    not_modified = self.validators.not_modified_data(validator_key)
+                    if not_modified is None:
+                        # The stored response was evicted while the request was in
+                        # flight; ask once more for the full body
+                        logger.debug("No stored response for 304 on %s, refetching", endpoint)
+                        if self.quota is not None:
+                            event.queue_wait += await self.quota.acquire(endpoint)
+                        event.queue_wait += await self.rate_limiter.acquire()
+                        response = await self._fetch(method, endpoint, url, params, json, headers)
+                event.network_time = time.perf_counter() - started
+                event.status = response.status_code
+                if breaker is not None:
+                    if response.status_code >= 500:
+                        breaker.record_failure(endpoint)
+                    else:
+                        breaker.record_success(endpoint)
+                event.bytes = len(response.content)
+                self.rate_limiter.on_response(
+                    response.status_code, response.headers, max_pause=self.max_rate_limit_wait
                 )
+                if self.quota is not None and response.status_code == 429:
+                    self.quota.mark_stale()
                 
                 if response.status_code == 401:
                     raise AuthenticationError("Invalid API key")
                 elif response.status_code == 429:
-                    raise RateLimitError("Rate limit exceeded")
-                elif response.status_code == 400:
-                    raise ValidationError(response.json().get("detail", "Validation error"))
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if last_attempt or (retry_after or 0) > self.max_rate_limit_wait:
+                        raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
+                    # Only hold the shared limiter when this request is going to wait and retry
+                    self.rate_limiter.pause(retry_after if retry_after is not None else backoff_delay(attempt))
+                    retry_delay = self.rate_limiter.paused_for
+                    logger.debug("Rate limited on %s, retrying (attempt %d)", endpoint, attempt + 1)
+                    continue
+                elif response.status_code in (400, 422):
+                    error = decode_body(response.content, response.headers.get("Content-Type"))
+                    detail = error.get("detail") if isinstance(error, dict) else None
+                    raise ValidationError(str(detail) if detail else "Validation error")
+                elif response.status_code == 404:
+                    raise DataNotFoundError(f"Not found: {endpoint}")
                 elif response.status_code >= 500:
-                    if attempt < self.max_retries - 1:
+                    if not last_attempt:
+                        retry_delay = backoff_delay(attempt)
                         continue
-                    raise OptionsToolsError(f"Server error: {response.status_code}")
+                    raise ServerError(f"Server error: {response.status_code}")
                 
-                response.raise_for_status()
-                data = response.json()
+                if not_modified is not None:
+                    return not_modified
+                if response.status_code == 304:
+                    raise OptionsToolsError(f"Not modified, but no stored response for {endpoint}")
                 
-                if data.get("status") == "error":
-                    raise OptionsToolsError(data.get("error", {}).get("message", "Unknown error"))
+                response.raise_for_status()
+                if not decode:
+                    return response.content
+                decode_started = time.perf_counter()
+                data = decode_body(response.content, response.headers.get("Content-Type"))
                 
-                return data.get("data", data)
+                if isinstance(data, dict):
+                    if data.get("status") == "error":
+                        raise OptionsToolsError(data.get("error", {}).get("message", "Unknown error"))
+                    data = data.get("data", data)
+                if validator_key is not None:
+                    data = self.validators.update(validator_key, response.status_code, response.headers, data)
+                event.decode_time = time.perf_counter() - decode_started
+                return data
                 
-            except httpx.TimeoutException:
-                if attempt < self.max_retries - 1:
+            except httpx.TimeoutException as e:
+                event.error = e
+                if breaker is not None:
+                    breaker.record_failure(endpoint)
+                if not last_attempt:
+                    retry_delay = backoff_delay(attempt)
                     continue
-                raise OptionsToolsError("Request timeout")
+                raise NetworkError("Request timeout")
             except httpx.RequestError as e:
-                if attempt < self.max_retries - 1:
+                event.error = e
+                if breaker is not None:
+                    breaker.record_failure(endpoint)
+                if not last_attempt:
+                    retry_delay = backoff_delay(attempt)
                     continue
-                raise OptionsToolsError(f"Request failed: {str(e)}")
+                raise NetworkError(f"Request failed: {str(e)}")
+            except Exception as e:
+                event.error = e
+                raise
+            finally:
+                if not event.network_time:
+                    event.network_time = time.perf_counter() - started
+                notify(self.observers, "on_request_end", event)
+                if retry_delay is not None:
+                    notify(self.observers, "on_retry", event, retry_delay)
+                    if retry_delay > 0 and event.status != 429:
+                        await asyncio.sleep(retry_delay)
     
+    async def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict],
+        json: Optional[Dict],
+        headers: Dict[str, str]
+    ) -> httpx.Response:
+        async def send(hedged: bool) -> httpx.Response:
+            if hedged:
+                # The hedge is a request of its own as far as the server's limits go
+                if self.quota is not None:
+                    self.quota.consume()
+                await self.rate_limiter.acquire()
+            return await self.client.request(method=method, url=url, params=params, json=json, headers=headers)
+
+        # Only idempotent requests can safely be sent twice
+        if self.hedge is None or method not in IDEMPOTENT_METHODS:
+            return await send(False)
+        return await self.hedge.run(
+            endpoint, send,
+            usable=lambda response: response.status_code < 500,
+            on_hedge=lambda delay: notify(self.observers, "on_hedge", method, endpoint, delay)
+        )
+
     # Options Methods
     async def get_options_chain(
         self, 
         ticker: str,
         expiration: Optional[date] = None,
         strike: Optional[float] = None,
-        option_type: Optional[str] = None
+        option_type: Optional[str] = None,
+        use_cache: bool = True,
+        delta: bool = False
     ) -> OptionsChain:
+        params = self._chain_params(ticker, expiration, strike, option_type)
+        data = await self._request(
+            "GET", f"/options/chain/{ticker}", params=params, use_cache=use_cache, delta=delta
+        )
+        if "options" in data:
+            data = dict(data, options=option_records(data["options"]))
+        chain = self._build(OptionsChain, data, f"/options/chain/{ticker}")
+        await self._store_snapshot(chain, filtered=len(params) > 1)
+        return chain
+    
+    async def get_options_chain_columnar(
+        self, 
+        ticker: str,
+        expiration: Optional[date] = None,
+        strike: Optional[float] = None,
+        option_type: Optional[str] = None,
+        use_cache: bool = True,
+        delta: bool = False
+    ) -> "ColumnarOptionsChain":
+        from ..models.columnar import ColumnarOptionsChain
+        params = self._chain_params(ticker, expiration, strike, option_type)
+        data = await self._request(
+            "GET", f"/options/chain/{ticker}", params=params, use_cache=use_cache, delta=delta
+        )
+        chain = ColumnarOptionsChain.from_dict(data)
+        await self._store_snapshot(chain, filtered=len(params) > 1)
+        return chain
+    
+    async def watch_options_chain(
+        self,
+        ticker: str,
+        interval: float = 5.0,
+        fields: Sequence[str] = DIFF_FIELDS,
+        tolerances: Optional[Dict[str, float]] = None,
+        include_initial: bool = True,
+        columnar: bool = False,
+        **kwargs
+    ) -> AsyncIterator[ChainDiff]:
+        """
+        Poll a chain and yield only what changed since the previous poll.
+
+        Polls that change nothing yield nothing. Each poll bypasses the
+        response cache. A poll that fails for a reason that may pass (rate
+        limiting, a server or network error, an open circuit) is logged and
+        skipped, and the next poll is diffed against the last chain received.
+        Any other error ends the watch.
+
+        Args:
+            ticker: Stock symbol
+            interval: Seconds between the starts of consecutive polls
+            fields: Contract fields to compare
+            tolerances: Per-field changes to ignore (see diff_chains)
+            include_initial: Yield the first snapshot as a diff with every
+                contract added
+            columnar: Fetch with get_options_chain_columnar (requires numpy)
+            **kwargs: Extra arguments for the chain request, e.g. expiration
+        """
+        fetch = self.get_options_chain_columnar if columnar else self.get_options_chain
+        loop = asyncio.get_running_loop()
+        previous: Optional[ChainState] = None
+        while True:
+            started = loop.time()
+            try:
+                chain = await fetch(ticker, use_cache=False, **kwargs)
+            except TRANSIENT_ERRORS as e:
+                logger.warning("Polling the %s chain failed, retrying on the next poll: %s", ticker, e)
+                chain = None
+            if chain is not None:
+                state = ChainState(chain, fields)
+                if previous is not None or include_initial:
+                    diff = diff_chains(previous, state, tolerances=tolerances)
+                    if diff:
+                        yield diff
+                previous = state
+            await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+    async def _store_snapshot(self, chain: Union[OptionsChain, "ColumnarOptionsChain"], filtered: bool = False):
+        # Archive full fetched chains; repeats of a cached chain are skipped by the
+        # store. Filtered chains are left out, or one could take the slot of the
+        # full chain with the same timestamp.
+        if self.snapshot_store is not None and not filtered:
+            await asyncio.get_running_loop().run_in_executor(None, self.snapshot_store.append, chain)
+    
+    @staticmethod
+    def _chain_params(
+        ticker: str,
+        expiration: Optional[date],
+        strike: Optional[float],
+        option_type: Optional[str]
+    ) -> Dict[str, Any]:
         params = {"ticker": ticker.upper()}
         if expiration:
             params["expiration"] = expiration.isoformat()
@@ -106,16 +520,15 @@ class OptionsToolsClient:
             params["strike"] = strike
         if option_type:
             params["type"] = option_type
-        
-        data = await self._request("GET", f"/options/chain/{ticker}", params=params)
-        return OptionsChain(**data)
+        return params
     
     async def get_options_flow(
         self,
         ticker: str,
         timeframe: str = "1d",
         min_premium: Optional[float] = None,
-        unusual_only: bool = False
+        unusual_only: bool = False,
+        use_cache: bool = True
     ) -> OptionsFlow:
         params = {
             "timeframe": timeframe,
@@ -124,36 +537,161 @@ class OptionsToolsClient:
         if min_premium:
             params["min_premium"] = min_premium
         
-        data = await self._request("GET", f"/options/flow/{ticker}", params=params)
-        return OptionsFlow(**data)
+        data = await self._request("GET", f"/options/flow/{ticker}", params=params, use_cache=use_cache)
+        return self._build(OptionsFlow, data, f"/options/flow/{ticker}")
+    
+    def stream_options_flow(
+        self,
+        ticker: str,
+        min_premium: Optional[float] = None,
+        unusual_only: bool = False,
+        window: Optional[timedelta] = timedelta(minutes=15),
+        max_reconnects: Optional[int] = None
+    ) -> FlowStream:
+        """
+        Subscribe to live flow for a ticker.
+
+        Returns an async iterator of FlowOrders that reconnects and resumes
+        automatically; its `aggregates` hold rolling-window premium totals.
+        """
+        return FlowStream(
+            self, ticker,
+            min_premium=min_premium,
+            unusual_only=unusual_only,
+            window=window,
+            max_reconnects=max_reconnects
+        )
     
     # SEC Methods
     async def get_sec_filings(
         self,
         ticker: str,
         filing_type: Optional[str] = None,
-        limit: int = 10
+        limit: int = 10,
+        use_cache: bool = True
     ) -> List[SECFiling]:
         params = {"limit": limit}
         if filing_type:
             params["filing_type"] = filing_type
         
-        data = await self._request("GET", f"/sec/filings/{ticker}", params=params)
-        return [SECFiling(**filing) for filing in data]
+        if self.filing_store is not None:
+            return await self._get_stored_sec_filings(ticker, filing_type, limit, params, use_cache)
+        
+        data = await self._request("GET", f"/sec/filings/{ticker}", params=params, use_cache=use_cache)
+        return [self._build(SECFiling, filing, f"/sec/filings/{ticker}") for filing in data]
+    
+    async def iter_sec_filings(
+        self,
+        ticker: str,
+        filing_type: Optional[str] = None,
+        page_size: int = 100,
+        max_filings: Optional[int] = None,
+        compact_parsed_data: bool = False,
+        use_cache: bool = False
+    ) -> AsyncIterator[SECFiling]:
+        """
+        Page through a ticker's filings, newest first.
+
+        The next page is requested while the current one is being consumed,
+        so at most two pages are held in memory at a time.
+
+        Args:
+            ticker: Stock symbol
+            filing_type: Only return filings of this type, e.g. "10-K"
+            page_size: Filings requested per page
+            max_filings: Stop after this many filings (default: all)
+            compact_parsed_data: Yield CompactSECFilings, which hold
+                parsed_data as compact JSON until it is accessed. For keeping
+                many filings in memory; it adds encoding time per filing
+            use_cache: Serve pages from the response cache when available
+        """
+        endpoint = f"/sec/filings/{ticker}"
+
+        def fetch_page(offset: int):
+            limit = page_size if max_filings is None else min(page_size, max_filings - offset)
+            params = {"limit": limit, "offset": offset}
+            if filing_type:
+                params["filing_type"] = filing_type
+            return asyncio.ensure_future(self._request("GET", endpoint, params=params, use_cache=use_cache)), limit
+
+        seen = set()
+        offset = 0
+        pending, limit = fetch_page(offset)
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                offset += len(page)
+                # Filings published mid-iteration shift later pages; skip repeats
+                fresh = []
+                for data in page:
+                    accession_number = data.get("accession_number")
+                    if accession_number not in seen:
+                        seen.add(accession_number)
+                        fresh.append(data)
+                # A short page is the last one, and so is a page of repeats: a
+                # server that ignores offset returns the first page again
+                if fresh and len(page) >= limit and (max_filings is None or offset < max_filings):
+                    pending, limit = fetch_page(offset)
+                for data in fresh:
+                    if compact_parsed_data:
+                        yield self._build_compact_filing(data, endpoint)
+                    else:
+                        yield self._build(SECFiling, data, endpoint)
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    def _build_compact_filing(self, data: Dict[str, Any], endpoint: str) -> CompactSECFiling:
+        # Copy into an exact-size bytes object; orjson's output keeps its spare buffer capacity
+        raw = bytes(memoryview(json_dumps(data.get("parsed_data") or {})))
+        filing = self._build(CompactSECFiling, dict(data, parsed_data={}), endpoint)
+        filing.compact_parsed_data(raw)
+        return filing
+    
+    async def _get_stored_sec_filings(
+        self,
+        ticker: str,
+        filing_type: Optional[str],
+        limit: int,
+        params: Dict[str, Any],
+        use_cache: bool
+    ) -> List[SECFiling]:
+        store = self.filing_store
+        loop = asyncio.get_running_loop()
+        
+        # Only ask for filings newer than the stored ones if the store already
+        # holds at least as much history as this call wants
+        full_fetch = await loop.run_in_executor(None, store.coverage, ticker, filing_type) < limit
+        if not full_fetch:
+            latest = await loop.run_in_executor(None, store.latest_filing_date, ticker, filing_type)
+            if latest is not None:
+                params["since"] = latest.isoformat()
+        
+        data = await self._request("GET", f"/sec/filings/{ticker}", params=params, use_cache=use_cache)
+        known = await loop.run_in_executor(None, store.known_accessions, ticker)
+        new_filings = [self._build(SECFiling, filing, f"/sec/filings/{ticker}") for filing in data if filing.get("accession_number") not in known]
+        
+        await loop.run_in_executor(None, store.add, new_filings)
+        if full_fetch:
+            await loop.run_in_executor(None, store.mark_coverage, ticker, filing_type, limit)
+        return await loop.run_in_executor(None, store.list, ticker, filing_type, limit)
     
     # Analysis Methods
     async def get_entry_analysis(
         self,
         ticker: str,
         capital: Optional[float] = None,
-        risk_tolerance: str = "moderate"
+        risk_tolerance: str = "moderate",
+        use_cache: bool = True
     ) -> AnalysisResult:
         params = {"risk_tolerance": risk_tolerance}
         if capital:
             params["capital"] = capital
         
-        data = await self._request("GET", f"/analysis/entry/{ticker}", params=params)
-        return AnalysisResult(**data)
+        data = await self._request("GET", f"/analysis/entry/{ticker}", params=params, use_cache=use_cache)
+        return self._build(AnalysisResult, data, f"/analysis/entry/{ticker}")
     
     async def get_exit_analysis(
         self,
@@ -167,8 +705,138 @@ class OptionsToolsClient:
         }
         
         data = await self._request("POST", f"/analysis/exit/{ticker}", json=json_data)
-        return AnalysisResult(**data)
+        return self._build(AnalysisResult, data, f"/analysis/exit/{ticker}")
     
+    async def get_exit_analyses(
+        self,
+        positions: Iterable[Union[Position, Dict[str, Any]]],
+        previous: Optional[Dict[str, PositionResult]] = None,
+        max_age: Optional[float] = None,
+        chunk_size: int = 100,
+        max_concurrency: Optional[int] = None,
+        bulk: bool = False
+    ) -> Dict[str, PositionResult]:
+        """
+        Exit analysis for a whole book of positions.
+
+        Positions are sent as concurrent single-position requests, or with
+        bulk=True in chunks to POST /analysis/exit/batch. The first bulk call
+        checks that the endpoint exists and falls back to single requests if
+        it doesn't.
+
+        Args:
+            positions: Positions (or dicts with id, ticker, entry_price and position)
+            previous: Results of an earlier call; positions whose inputs are
+                unchanged reuse their previous result instead of being re-sent
+            max_age: Re-evaluate previous results older than this many seconds
+            chunk_size: Positions per bulk request
+            max_concurrency: Maximum requests in flight (defaults to the client setting)
+            bulk: Use the bulk endpoint when the API has one
+
+        Returns:
+            PositionResult per position id, in book order. Errors are returned
+            on the result instead of aborting the batch.
+        """
+        pending, fingerprints, results = split_book(positions, previous, max_age)
+        if pending:
+            limit = max(1, max_concurrency or self.max_concurrency)
+            evaluated = None
+            if bulk and self._bulk_exit_analysis is not False:
+                evaluated = await self._bulk_exit_analyses(pending, max(1, chunk_size), limit)
+            if evaluated is None:
+                evaluated = await self._single_exit_analyses(pending, limit)
+            now = time.time()
+            for position in pending:
+                result, error = evaluated[position.id]
+                results[position.id] = PositionResult(
+                    position.id, result, error, fingerprints[position.id], now
+                )
+        return {position_id: results[position_id] for position_id in fingerprints}
+
+    async def _bulk_exit_analyses(
+        self,
+        pending: List[Position],
+        chunk_size: int,
+        limit: int
+    ) -> Optional[Dict[str, Evaluation]]:
+        endpoint = "/analysis/exit/batch"
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        evaluated: Dict[str, Evaluation] = {}
+
+        async def send(chunk: List[Position]) -> Any:
+            return await self._request("POST", endpoint, json={"positions": [p.payload() for p in chunk]})
+
+        def record(chunk: List[Position], items: Dict[str, Any]):
+            for position in chunk:
+                analysis, message = items.get(position.id, (None, None))
+                if message is not None:
+                    evaluated[position.id] = (None, OptionsToolsError(message))
+                elif analysis is None:
+                    evaluated[position.id] = (None, missing_result(position))
+                else:
+                    try:
+                        evaluated[position.id] = (self._build(AnalysisResult, analysis, endpoint), None)
+                    except Exception as e:
+                        evaluated[position.id] = (None, e)
+
+        if self._bulk_exit_analysis is None:
+            # Probe with one chunk. Without a bulk endpoint the path is an
+            # ordinary /analysis/exit/{ticker} request for a ticker named
+            # "batch", which can fail in many ways or even succeed, so only a
+            # response matching the chunk's positions proves the endpoint exists.
+            chunk = chunks[0]
+            try:
+                data = await send(chunk)
+            except (DataNotFoundError, ValidationError, httpx.HTTPStatusError) as e:
+                logger.info("No bulk exit analysis endpoint (%s); using per-position requests", e)
+                self._bulk_exit_analysis = False
+                return None
+            except Exception as e:
+                # Transient failure; decide on a later call
+                logger.warning("Bulk exit analysis probe failed (%s); using per-position requests", e)
+                return None
+            try:
+                items = bulk_items(data, chunk)
+            except OptionsToolsError:
+                items = None
+            if items is None or any(position.id not in items for position in chunk):
+                logger.info("Unrecognized bulk exit analysis response; using per-position requests")
+                self._bulk_exit_analysis = False
+                return None
+            self._bulk_exit_analysis = True
+            record(chunk, items)
+            chunks = chunks[1:]
+
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(chunk: List[Position]):
+            async with semaphore:
+                try:
+                    items = bulk_items(await send(chunk), chunk)
+                except Exception as e:
+                    for position in chunk:
+                        evaluated[position.id] = (None, e)
+                    return
+                record(chunk, items)
+
+        await asyncio.gather(*(run(chunk) for chunk in chunks))
+        return evaluated
+
+    async def _single_exit_analyses(self, pending: List[Position], limit: int) -> Dict[str, Evaluation]:
+        evaluated: Dict[str, Evaluation] = {}
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(position: Position):
+            async with semaphore:
+                try:
+                    result = await self.get_exit_analysis(position.ticker, position.entry_price, position.position)
+                    evaluated[position.id] = (result, None)
+                except Exception as e:
+                    evaluated[position.id] = (None, e)
+
+        await asyncio.gather(*(run(position) for position in pending))
+        return evaluated
+
     # Portfolio Methods
     async def optimize_portfolio(
         self,
@@ -185,41 +853,241 @@ class OptionsToolsClient:
         }
         
         data = await self._request("POST", "/portfolio/optimize", json=json_data)
-        return PortfolioOptimization(**data)
+        return self._build(PortfolioOptimization, data, "/portfolio/optimize")
     
+    # Batch Methods
+    async def iter_batch(
+        self,
+        method: str,
+        tickers: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Call a per-ticker method for many tickers, yielding results as they complete.
+
+        Args:
+            method: Name of the client method to call, one of BATCH_METHODS
+            tickers: Tickers to request; duplicates are requested once
+            max_concurrency: Maximum requests in flight (defaults to the client setting)
+            **kwargs: Extra arguments passed to every call
+
+        Yields:
+            BatchResult for each ticker, in completion order. Errors are
+            returned on the result instead of aborting the batch.
+        """
+        if method not in BATCH_METHODS:
+            raise ValueError(f"Unsupported batch method: {method}")
+        fn = getattr(self, method)
+        pending = list(dict.fromkeys(tickers))
+        if not pending:
+            return
+
+        limit = max(1, max_concurrency or self.max_concurrency)
+        queue: asyncio.Queue = asyncio.Queue()
+        remaining = iter(pending)
+
+        async def worker():
+            for ticker in remaining:
+                try:
+                    item = BatchResult(ticker, result=await fn(ticker, **kwargs))
+                except Exception as e:
+                    item = BatchResult(ticker, error=e)
+                queue.put_nowait(item)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(limit, len(pending)))]
+        try:
+            for _ in range(len(pending)):
+                yield await queue.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def batch(
+        self,
+        method: str,
+        tickers: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, BatchResult]:
+        results = {}
+        async for item in self.iter_batch(method, tickers, max_concurrency, **kwargs):
+            results[item.ticker] = item
+        return results
+
+    async def get_options_chains(
+        self,
+        tickers: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, BatchResult]:
+        return await self.batch("get_options_chain", tickers, max_concurrency, **kwargs)
+
+    async def get_options_flows(
+        self,
+        tickers: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, BatchResult]:
+        return await self.batch("get_options_flow", tickers, max_concurrency, **kwargs)
+
+    async def get_entry_analyses(
+        self,
+        tickers: Iterable[str],
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, BatchResult]:
+        return await self.batch("get_entry_analysis", tickers, max_concurrency, **kwargs)
+
     # Utility Methods
     async def health_check(self) -> Dict[str, Any]:
         response = await self.client.get("/health")
         return response.json()
     
-    async def get_api_usage(self) -> Dict[str, Any]:
-        data = await self._request("GET", "/account/usage")
+    async def warm_up(self, connections: int = 1) -> int:
+        """
+        Open pooled connections ahead of the first real request.
+
+        Sends concurrent /health requests so TLS handshakes (and HTTP/2
+        negotiation) happen up front. Failures are logged, not raised.
+
+        Args:
+            connections: Number of connections to open (one is enough for HTTP/2)
+
+        Returns:
+            Number of warm-up requests that succeeded
+        """
+        async def ping() -> bool:
+            try:
+                response = await self.client.get("/health")
+                await response.aread()
+                return True
+            except httpx.HTTPError as e:
+                logger.warning("Connection warm-up failed: %s", e)
+                return False
+
+        results = await asyncio.gather(*(ping() for _ in range(max(1, connections))))
+        return sum(results)
+    
+    async def get_api_usage(self, use_cache: bool = True) -> Dict[str, Any]:
+        data = await self._request("GET", "/account/usage", use_cache=use_cache)
+        # A cached payload may predate requests the scheduler has already counted
+        if self.quota is not None and isinstance(data, dict) and (not use_cache or self.cache is None):
+            self.quota.update(data)
         return data
 
 # Synchronous wrapper for convenience
 class OptionsTools:
+    """
+    Blocking wrapper around OptionsToolsClient.
+
+    All calls are executed on a single background event loop owned by this
+    instance, so the underlying connection pool stays warm between calls.
+    Methods may be called concurrently from any number of threads. Call
+    close() (or use the instance as a context manager) to shut the loop down.
+    """
+
     def __init__(self, api_key: str, **kwargs):
         self._client = OptionsToolsClient(api_key, **kwargs)
-        self._loop = None
-    
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is not None:
+            return loop
+
+        with self._lock:
+            if self._closed:
+                raise OptionsToolsError("Client is closed")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop, ready),
+                    name="options-tools-loop",
+                    daemon=True
+                )
+                thread.start()
+                ready.wait()
+                self._thread = thread
+                self._loop = loop
+                if self._client.warm_connections:
+                    # Runs alongside the first call rather than delaying it
+                    asyncio.run_coroutine_threadsafe(
+                        self._client.warm_up(self._client.warm_connections), loop
+                    )
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
     def _run_async(self, coro):
-        import asyncio
+        if self._closed:
+            coro.close()
+            raise OptionsToolsError("Client is closed")
+
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise OptionsToolsError(
+                "Synchronous OptionsTools methods cannot be called from its own event loop; "
+                "use OptionsToolsClient directly"
+            )
+        # Context variables don't cross to the loop thread; carry the caller's priority over
+        level = current_priority()
+        if level is not None:
+            coro = self._with_priority(coro, level)
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    @staticmethod
+    async def _with_priority(coro, level: str):
+        with request_priority(level):
+            return await coro
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+
+        if loop is None or thread is None:
+            return
         try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-        
-        if loop is None:
-            return asyncio.run(coro)
-        else:
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coro)
-                return future.result()
-    
+            asyncio.run_coroutine_threadsafe(self._client.close(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
     def get_options_chain(self, *args, **kwargs):
         return self._run_async(self._client.get_options_chain(*args, **kwargs))
     
+    def get_options_chain_columnar(self, *args, **kwargs):
+        return self._run_async(self._client.get_options_chain_columnar(*args, **kwargs))
+    
     def get_options_flow(self, *args, **kwargs):
         return self._run_async(self._client.get_options_flow(*args, **kwargs))
     
@@ -229,5 +1097,50 @@ class OptionsTools:
     def get_entry_analysis(self, *args, **kwargs):
         return self._run_async(self._client.get_entry_analysis(*args, **kwargs))
     
+    def get_exit_analysis(self, *args, **kwargs):
+        return self._run_async(self._client.get_exit_analysis(*args, **kwargs))
+
+    def get_exit_analyses(self, *args, **kwargs):
+        return self._run_async(self._client.get_exit_analyses(*args, **kwargs))
+    
     def optimize_portfolio(self, *args, **kwargs):
-        return self._run_async(self._client.optimize_portfolio(*args, **kwargs))
\ No newline at end of file
+        return self._run_async(self._client.optimize_portfolio(*args, **kwargs))
+
+    def iter_batch(self, *args, **kwargs) -> Iterator[BatchResult]:
+        return self._iterate(self._client.iter_batch(*args, **kwargs))
+
+    def iter_sec_filings(self, *args, **kwargs) -> Iterator[SECFiling]:
+        return self._iterate(self._client.iter_sec_filings(*args, **kwargs))
+
+    def watch_options_chain(self, *args, **kwargs) -> Iterator[ChainDiff]:
+        return self._iterate(self._client.watch_options_chain(*args, **kwargs))
+
+    def _iterate(self, agen: AsyncIterator[M]) -> Iterator[M]:
+        # Drive an async generator on the background loop one item at a time
+        async def next_item():
+            return await agen.__anext__()
+
+        try:
+            while True:
+                try:
+                    yield self._run_async(next_item())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._closed:
+                self._run_async(agen.aclose())
+
+    def batch(self, *args, **kwargs):
+        return self._run_async(self._client.batch(*args, **kwargs))
+
+    def get_options_chains(self, *args, **kwargs):
+        return self._run_async(self._client.get_options_chains(*args, **kwargs))
+
+    def get_options_flows(self, *args, **kwargs):
+        return self._run_async(self._client.get_options_flows(*args, **kwargs))
+
+    def get_entry_analyses(self, *args, **kwargs):
+        return self._run_async(self._client.get_entry_analyses(*args, **kwargs))
+
+    def warm_up(self, *args, **kwargs):
+        return self._run_async(self._client.warm_up(*args, **kwargs))
\ No newline at end of file
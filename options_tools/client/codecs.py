@@ -0,0 +1,122 @@
+"""
+Response body encodings and formats.
+
+Decodes JSON with orjson when it is installed, and optionally negotiates
+compact binary formats: MessagePack for any endpoint and Apache Arrow IPC
+streams for options chains. Each codec is only offered to the server when its
+library is importable, and the response Content-Type decides how a body is
+decoded, so a server that ignores the preference still works.
+"""
+
+import functools
+from typing import Any, Dict, List, Optional
+
+from ..utils.serialization import json_loads, json_dumps  # noqa: F401 - re-exported
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+ARROW = "application/vnd.apache.arrow.stream"
+
+RESPONSE_FORMATS = ("json", "msgpack", "arrow")
+
+# Schema metadata key holding the chain's scalar fields in Arrow responses
+ARROW_METADATA_KEY = b"options_tools"
+
+
+# msgpack and pyarrow are imported on first use, not with the client: pyarrow
+# alone adds tens of milliseconds to every cold start
+
+
+@functools.lru_cache(maxsize=None)
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return msgpack
+
+
+@functools.lru_cache(maxsize=None)
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return pyarrow
+
+
+def accept_encoding() -> str:
+    """
+    Content encodings the installed httpx can decode.
+
+    Read from httpx's own decoder table: having brotli or zstandard installed
+    isn't enough, since older httpx releases can't decode zstd at all.
+    """
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:  # pragma: no cover - httpx moved its decoders
+        return "gzip, deflate"
+    return ", ".join(name for name in ("gzip", "deflate", "br", "zstd") if name in SUPPORTED_DECODERS)
+
+
+def accept_header(response_format: str, columnar: bool = False) -> str:
+    """
+    Accept header for a preferred response format.
+
+    Arrow is only requested for endpoints returning an options chain
+    (columnar=True); other endpoints fall back to MessagePack or JSON.
+    """
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(f"Unsupported response format: {response_format}")
+    types: List[str] = []
+    if response_format == "arrow" and columnar and _pyarrow() is not None:
+        types.append(ARROW)
+    if response_format in ("msgpack", "arrow") and _msgpack() is not None:
+        types.append(MSGPACK)
+    if not types:
+        return JSON
+    return ", ".join(types + [f"{JSON};q=0.9"])
+
+
+def _media_type(content_type: Optional[str]) -> str:
+    return (content_type or JSON).split(";", 1)[0].strip().lower()
+
+
+def decode_arrow(content: bytes) -> Dict[str, Any]:
+    """
+    Decode an Arrow IPC stream holding an options chain.
+
+    Returns the chain in its JSON shape, except that "options" is a
+    pyarrow.Table instead of a list of dicts.
+    """
+    pyarrow = _pyarrow()
+    if pyarrow is None:
+        raise ImportError("Decoding Arrow responses requires pyarrow")
+    table = pyarrow.ipc.open_stream(content).read_all()
+    metadata = (table.schema.metadata or {}).get(ARROW_METADATA_KEY)
+    data = json_loads(metadata) if metadata else {}
+    data["options"] = table
+    return data
+
+
+def decode_body(content: bytes, content_type: Optional[str]) -> Any:
+    media_type = _media_type(content_type)
+    if media_type in (MSGPACK, "application/x-msgpack"):
+        msgpack = _msgpack()
+        if msgpack is None:
+            raise ImportError("Decoding MessagePack responses requires msgpack")
+        return msgpack.unpackb(content, raw=False, timestamp=3)
+    if media_type == ARROW:
+        return decode_arrow(content)
+    return json_loads(content)
+
+
+def option_records(options: Any) -> List[Dict[str, Any]]:
+    """Options as a list of dicts, whether they arrived as JSON rows or an Arrow table"""
+    if isinstance(options, list):
+        return options
+    pyarrow = _pyarrow()
+    if pyarrow is not None and isinstance(options, pyarrow.Table):
+        return options.to_pylist()
+    return options
@@ -0,0 +1,139 @@
+"""
+Conditional requests and chain delta updates.
+
+ValidatorStore remembers the ETag / Last-Modified validators and payload of
+recent GET responses. Repeat requests send If-None-Match / If-Modified-Since,
+so an unchanged resource comes back as 304 and is served from the stored copy.
+
+Options chains can additionally be fetched as deltas using RFC 3229 delta
+encoding: the client sends "A-IM: options-delta" and the server may reply
+226 IM Used with only the changed and removed contracts, which are merged
+into the stored chain.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+from ..utils.exceptions import OptionsToolsError
+from .codecs import option_records
+
+DELTA_IM = "options-delta"
+
+ContractKey = Tuple[str, float, str]
+
+
+def contract_key(option: Mapping[str, Any]) -> ContractKey:
+    return (str(option["expiration"])[:10], float(option["strike"]), str(option["type"]).lower()[:1])
+
+
+class _Entry:
+    __slots__ = ("etag", "last_modified", "data", "contracts")
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], data: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.data = data
+        self.contracts: Optional[Dict[ContractKey, Dict[str, Any]]] = None
+
+
+class ValidatorStore:
+    """
+    Bounded LRU store of response validators and payloads.
+
+    Args:
+        maxsize: Number of distinct requests to remember
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.not_modified = 0
+        self.deltas = 0
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def request_headers(self, key: Hashable, delta: bool = False) -> Dict[str, str]:
+        entry = self.get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+            if delta:
+                headers["A-IM"] = DELTA_IM
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def not_modified_data(self, key: Hashable) -> Any:
+        """Payload to serve for a 304 response"""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        self.not_modified += 1
+        return entry.data
+
+    def update(self, key: Hashable, status_code: int, headers: Mapping[str, str], data: Any) -> Any:
+        """
+        Record a successful response and return the payload to hand back.
+
+        A 226 delta response is merged into the stored chain first.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        previous = self.get(key)
+
+        if status_code == 226 and headers.get("IM", "").strip() == DELTA_IM:
+            if previous is None:
+                raise OptionsToolsError("Received a delta response without a stored base chain")
+            data, contracts = self._merge(previous, data)
+            self.deltas += 1
+        else:
+            contracts = None
+
+        if not etag and not last_modified:
+            with self._lock:
+                self._entries.pop(key, None)
+            return data
+
+        entry = _Entry(etag, last_modified, data)
+        entry.contracts = contracts
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return data
+
+    @staticmethod
+    def _merge(base: _Entry, delta: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[ContractKey, Dict[str, Any]]]:
+        contracts = base.contracts
+        if contracts is None:
+            contracts = {contract_key(o): o for o in option_records(base.data.get("options", []))}
+        # Copy so payloads already handed out (or cached) are never mutated
+        contracts = dict(contracts)
+        for removed in delta.get("removed", []):
+            contracts.pop(contract_key(removed), None)
+        for changed in option_records(delta.get("changed", [])):
+            key = contract_key(changed)
+            current = contracts.get(key)
+            contracts[key] = {**current, **changed} if current is not None else changed
+
+        merged = {k: v for k, v in base.data.items() if k != "options"}
+        merged.update((k, v) for k, v in delta.items() if k not in ("changed", "removed"))
+        merged["options"] = list(contracts.values())
+        return merged, contracts
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,142 @@
+"""
+Exit analysis across a book of positions.
+
+A book is sent as concurrent per-position POSTs to /analysis/exit/{ticker},
+or on request in chunks to POST /analysis/exit/batch where the API offers
+that endpoint. Every result carries a fingerprint of the inputs it
+was computed from, so passing a previous run back in re-evaluates only the
+positions that changed.
+"""
+
+import hashlib
+import json
+import time
+from typing import Optional, Dict, Any, List, Iterable, NamedTuple, Tuple, Union
+
+from ..models.responses import AnalysisResult
+from ..utils.exceptions import DataNotFoundError, OptionsToolsError
+
+
+# Outcome of analyzing one position: (result, None) or (None, error)
+Evaluation = Tuple[Optional[AnalysisResult], Optional[Exception]]
+
+
+class Position(NamedTuple):
+    """One open position (or leg) to analyze for exit"""
+    id: str
+    ticker: str
+    entry_price: float
+    position: Dict[str, Any]
+
+    def payload(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "ticker": self.ticker.upper(),
+            "entry_price": self.entry_price,
+            "position": self.position,
+        }
+
+
+class PositionResult(NamedTuple):
+    """Exit analysis of one position: either a result or the error it raised"""
+    id: str
+    result: Optional[AnalysisResult] = None
+    error: Optional[Exception] = None
+    fingerprint: Optional[str] = None
+    evaluated_at: float = 0.0
+    reused: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def as_position(value: Union[Position, Dict[str, Any]]) -> Position:
+    if isinstance(value, Position):
+        return value
+    if isinstance(value, dict):
+        return Position(
+            str(value["id"]), value["ticker"], value["entry_price"], value.get("position") or {}
+        )
+    raise TypeError(f"Expected a Position or dict, got {type(value).__name__}")
+
+
+def position_fingerprint(position: Position) -> str:
+    """Digest of the inputs exit analysis depends on"""
+    inputs = [position.ticker.upper(), position.entry_price, position.position]
+    return hashlib.sha1(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def split_book(
+    positions: Iterable[Union[Position, Dict[str, Any]]],
+    previous: Optional[Dict[str, PositionResult]] = None,
+    max_age: Optional[float] = None
+) -> Tuple[List[Position], Dict[str, str], Dict[str, PositionResult]]:
+    """
+    Sort a book into positions to evaluate and results that can be reused.
+
+    Returns:
+        (positions to evaluate, fingerprint per position id, reused results)
+    """
+    now = time.time()
+    pending: List[Position] = []
+    fingerprints: Dict[str, str] = {}
+    reused: Dict[str, PositionResult] = {}
+    for value in positions:
+        position = as_position(value)
+        if position.id in fingerprints:
+            raise ValueError(f"Duplicate position id: {position.id}")
+        fingerprint = fingerprints[position.id] = position_fingerprint(position)
+        last = previous.get(position.id) if previous else None
+        if (
+            last is not None and last.ok and last.fingerprint == fingerprint
+            and (max_age is None or now - last.evaluated_at <= max_age)
+        ):
+            reused[position.id] = last._replace(reused=True)
+        else:
+            pending.append(position)
+    return pending, fingerprints, reused
+
+
+def bulk_items(data: Any, chunk: List[Position]) -> Dict[str, Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Match a bulk response to the positions of its chunk.
+
+    Accepts a list of results in request order, a list of items carrying
+    their position "id" (with the analysis inline or under "result"/"analysis",
+    or an "error"), or a mapping of position id to analysis.
+    """
+    if isinstance(data, dict) and "results" in data:
+        data = data["results"]
+    if isinstance(data, dict):
+        entries = list(data.items())
+    elif isinstance(data, list):
+        if all(isinstance(item, dict) and "id" in item for item in data):
+            entries = [(item["id"], item) for item in data]
+        elif len(data) == len(chunk):
+            entries = [(position.id, item) for position, item in zip(chunk, data)]
+        else:
+            raise OptionsToolsError(
+                f"Bulk exit analysis returned {len(data)} results for {len(chunk)} positions"
+            )
+    else:
+        raise OptionsToolsError("Unexpected bulk exit analysis response")
+
+    items: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[str]]] = {}
+    for key, item in entries:
+        if not isinstance(item, dict):
+            continue
+        error = item.get("error")
+        if error:
+            message = error.get("message", "Unknown error") if isinstance(error, dict) else str(error)
+            items[str(key)] = (None, message)
+            continue
+        analysis = item.get("result") or item.get("analysis") or item
+        if isinstance(analysis, dict):
+            analysis = {k: v for k, v in analysis.items() if k != "id"}
+        items[str(key)] = (analysis, None)
+    return items
+
+
+def missing_result(position: Position) -> DataNotFoundError:
+    return DataNotFoundError(f"No exit analysis returned for position {position.id}")
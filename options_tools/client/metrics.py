@@ -0,0 +1,238 @@
+"""
+Request instrumentation.
+
+Observers passed to the client (observers=[...]) are notified when a request
+attempt starts and ends, when it is retried, when a response is served from
+the cache, when the rate limiter holds a request back, when a request is
+hedged and when a stale response is served. Every finished attempt is
+described by a RequestEvent carrying its timings, so latency can be exported
+to any metrics system. LatencyHistogram is a built-in observer that
+keeps per-endpoint histograms in process and reports p50/p95/p99.
+"""
+
+import bisect
+import logging
+import math
+import re
+import threading
+from typing import Optional, Dict, List, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Endpoints whose last path segment is a ticker; grouped under one route
+_TICKER_ROUTE = re.compile(
+    r"^(/options/(?:chain|flow)|/sec/(?:filings|company)|/analysis/(?:entry|exit))/[^/]+(/.*)?$"
+)
+
+
+def endpoint_route(endpoint: str) -> str:
+    """Endpoint with the ticker replaced, e.g. /options/chain/SPY -> /options/chain/{ticker}"""
+    match = _TICKER_ROUTE.match(endpoint)
+    if match is None:
+        return endpoint
+    return f"{match.group(1)}/{{ticker}}{match.group(2) or ''}"
+
+
+class RequestEvent:
+    """
+    One finished request attempt.
+
+    Attributes:
+        method: HTTP method
+        endpoint: Path below /api/v1
+        attempt: Zero-based attempt number
+        status: HTTP status, or None if no response was received
+        bytes: Size of the response body
+        queue_wait: Seconds spent waiting on the rate limiter
+        network_time: Seconds from sending the request to receiving the body
+        decode_time: Seconds spent decoding the body
+        error: Exception raised by the attempt, if any
+    """
+
+    __slots__ = (
+        "method", "endpoint", "attempt", "status", "bytes",
+        "queue_wait", "network_time", "decode_time", "error"
+    )
+
+    def __init__(self, method: str, endpoint: str, attempt: int = 0):
+        self.method = method
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.status: Optional[int] = None
+        self.bytes = 0
+        self.queue_wait = 0.0
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.error: Optional[BaseException] = None
+
+    @property
+    def route(self) -> str:
+        return endpoint_route(self.endpoint)
+
+    @property
+    def total_time(self) -> float:
+        return self.queue_wait + self.network_time + self.decode_time
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent({self.method} {self.endpoint} attempt={self.attempt} status={self.status} "
+            f"bytes={self.bytes} network={self.network_time:.4f}s)"
+        )
+
+
+class RequestObserver:
+    """Base class for request observers; override the hooks you need"""
+
+    def on_request_start(self, method: str, endpoint: str, attempt: int):
+        pass
+
+    def on_request_end(self, event: RequestEvent):
+        pass
+
+    def on_retry(self, event: RequestEvent, delay: float):
+        """The attempt described by event failed and will be retried after delay seconds"""
+        pass
+
+    def on_cache_hit(self, method: str, endpoint: str):
+        pass
+
+    def on_rate_limit_wait(self, endpoint: str, seconds: float):
+        pass
+
+    def on_validate(self, endpoint: str, model: str, seconds: float):
+        """A response model was built from decoded data"""
+        pass
+
+    def on_hedge(self, method: str, endpoint: str, delay: float):
+        """A second attempt was sent because the first hadn't answered within delay seconds"""
+        pass
+
+    def on_stale_response(self, method: str, endpoint: str):
+        """An expired cached response was served because the endpoint's circuit is open"""
+        pass
+
+
+def notify(observers: Iterable[RequestObserver], hook: str, *args):
+    """Call a hook on every observer; observer errors are logged, never raised"""
+    for observer in observers:
+        try:
+            getattr(observer, hook)(*args)
+        except Exception:
+            logger.exception("Request observer %r failed in %s", observer, hook)
+
+
+def _bucket_bounds(low: float = 1e-4, high: float = 300.0, growth: float = 1.1) -> List[float]:
+    count = int(math.ceil(math.log(high / low) / math.log(growth)))
+    return [low * growth ** i for i in range(count + 1)]
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "total", "max", "errors")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+
+
+class LatencyHistogram(RequestObserver):
+    """
+    In-process latency histograms per endpoint route.
+
+    Latencies fall into logarithmic buckets growing by 10%, so percentiles are
+    accurate to within 10% while memory stays constant however many requests
+    are recorded.
+
+    Args:
+        metric: Which RequestEvent time to record: "network_time" (default)
+            or "total_time" (including rate limiter wait and decoding)
+    """
+
+    BOUNDS = _bucket_bounds()
+
+    def __init__(self, metric: str = "network_time"):
+        if metric not in ("network_time", "total_time"):
+            raise ValueError(f"Unsupported metric: {metric}")
+        self.metric = metric
+        self.cache_hits: Dict[str, int] = {}
+        self.retries: Dict[str, int] = {}
+        self._histograms: Dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def on_request_end(self, event: RequestEvent):
+        self.record(event.route, getattr(event, self.metric), error=event.error is not None)
+
+    def on_retry(self, event: RequestEvent, delay: float):
+        route = event.route
+        with self._lock:
+            self.retries[route] = self.retries.get(route, 0) + 1
+
+    def on_cache_hit(self, method: str, endpoint: str):
+        route = endpoint_route(endpoint)
+        with self._lock:
+            self.cache_hits[route] = self.cache_hits.get(route, 0) + 1
+
+    def record(self, route: str, seconds: float, error: bool = False):
+        index = min(bisect.bisect_left(self.BOUNDS, seconds), len(self.BOUNDS) - 1)
+        with self._lock:
+            histogram = self._histograms.get(route)
+            if histogram is None:
+                histogram = self._histograms[route] = _Histogram(len(self.BOUNDS))
+            histogram.counts[index] += 1
+            histogram.count += 1
+            histogram.total += seconds
+            histogram.max = max(histogram.max, seconds)
+            if error:
+                histogram.errors += 1
+
+    def percentile(self, route: str, q: float) -> Optional[float]:
+        """Latency (seconds) below which q percent of requests to route fell"""
+        with self._lock:
+            histogram = self._histograms.get(route)
+            if histogram is None or not histogram.count:
+                return None
+            return self._percentile(histogram, q)
+
+    def count(self, route: str) -> int:
+        with self._lock:
+            histogram = self._histograms.get(route)
+            return histogram.count if histogram is not None else 0
+
+    def _percentile(self, histogram: _Histogram, q: float) -> float:
+        rank = max(1, int(math.ceil(histogram.count * q / 100.0)))
+        seen = 0
+        for index, count in enumerate(histogram.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.BOUNDS[index], histogram.max)
+        return histogram.max
+
+    def routes(self) -> List[str]:
+        with self._lock:
+            return sorted(self._histograms)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-route count, errors, mean, max and p50/p95/p99 latency in seconds"""
+        with self._lock:
+            return {
+                route: {
+                    "count": h.count,
+                    "errors": h.errors,
+                    "retries": self.retries.get(route, 0),
+                    "cache_hits": self.cache_hits.get(route, 0),
+                    "mean": h.total / h.count,
+                    "max": h.max,
+                    "p50": self._percentile(h, 50),
+                    "p95": self._percentile(h, 95),
+                    "p99": self._percentile(h, 99),
+                }
+                for route, h in sorted(self._histograms.items()) if h.count
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.cache_hits.clear()
+            self.retries.clear()
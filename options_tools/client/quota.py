@@ -0,0 +1,298 @@
+"""
+Quota-aware request scheduling.
+
+The account's request quota (GET /account/usage) is shared by everything a
+client does. QuotaScheduler tracks how much of it is left and decides, per
+request, whether it may be sent now:
+
+- "high" requests (exit analysis by default) are always sent; the reserve is
+  kept for them.
+- "normal" requests are sent until only the reserve is left, then wait for the
+  quota window to reset.
+- "low" requests (backfills, universe scans) stop earlier still and are spaced
+  out so that what they may use is spread evenly over the rest of the window.
+
+The priority of a request comes from the surrounding request_priority()
+block, falling back to a per-endpoint default:
+
+    >>> with request_priority(LOW):
+    ...     async for item in client.iter_batch("get_sec_filings", universe):
+    ...         ...
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Awaitable, Callable, Iterator, Tuple
+
+from ..utils.exceptions import RateLimitError
+from .rate_limit import _parse_reset
+
+logger = logging.getLogger(__name__)
+
+HIGH = "high"
+NORMAL = "normal"
+LOW = "low"
+PRIORITIES = (HIGH, NORMAL, LOW)
+
+# Default priority of each endpoint family, matched by longest prefix
+DEFAULT_PRIORITIES: Dict[str, str] = {
+    "/analysis/exit": HIGH,
+}
+
+# Requests that never wait on the quota (reading it must always be possible)
+EXEMPT_ENDPOINTS = frozenset(("/account/usage",))
+
+# Keys checked in the usage payload, most specific first
+LIMIT_KEYS = ("requests_limit", "request_limit", "quota_limit", "limit", "quota")
+REMAINING_KEYS = ("requests_remaining", "remaining_requests", "quota_remaining", "remaining")
+USED_KEYS = ("requests_used", "used_requests", "quota_used", "used", "usage")
+RESET_KEYS = ("reset_in", "resets_in", "reset_at", "resets_at", "reset", "period_end")
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("options_tools_priority", default=None)
+
+
+@contextmanager
+def request_priority(level: str) -> Iterator[None]:
+    """Run the requests made inside the block (and tasks started in it) at this priority"""
+    if level not in PRIORITIES:
+        raise ValueError(f"Unknown priority: {level}")
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Optional[str]:
+    """Priority set by the innermost request_priority() block, if any"""
+    return _priority.get()
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _reset_seconds(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _parse_reset(str(value))
+    if not isinstance(value, str):
+        return None
+    seconds = _parse_reset(value)
+    if seconds is not None:
+        return seconds
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _find(data: Dict[str, Any], keys) -> Any:
+    # Usage payloads may nest the counters, e.g. {"requests": {"limit": ...}}
+    scopes = [data] + [value for value in data.values() if isinstance(value, dict)]
+    for key in keys:
+        for scope in scopes:
+            if scope.get(key) is not None and not isinstance(scope[key], dict):
+                return scope[key]
+    return None
+
+
+def parse_usage(data: Dict[str, Any]) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+    Read (limit, remaining, seconds until reset) from a usage payload.
+
+    Any of the three is None when the payload doesn't report it.
+    """
+    limit = _number(_find(data, LIMIT_KEYS))
+    remaining = _number(_find(data, REMAINING_KEYS))
+    if remaining is None and limit is not None:
+        used = _number(_find(data, USED_KEYS))
+        if used is not None:
+            remaining = max(0.0, limit - used)
+    return limit, remaining, _reset_seconds(_find(data, RESET_KEYS))
+
+
+class QuotaScheduler:
+    """
+    Gate requests on the account's remaining quota by priority.
+
+    Args:
+        reserve: Fraction of the quota kept for high-priority requests
+        low_reserve: Fraction of the quota low-priority requests leave untouched
+            (should be at least reserve)
+        refresh_interval: Seconds between usage reads; the remaining quota is
+            estimated locally in between
+        max_wait: Raise RateLimitError instead of waiting longer than this
+            for quota (default: wait for the window to reset)
+        priorities: Endpoint prefix to default priority, merged over
+            DEFAULT_PRIORITIES
+    """
+
+    def __init__(
+        self,
+        reserve: float = 0.1,
+        low_reserve: float = 0.25,
+        refresh_interval: float = 60.0,
+        max_wait: Optional[float] = None,
+        priorities: Optional[Dict[str, str]] = None
+    ):
+        self.reserve = reserve
+        self.low_reserve = max(low_reserve, reserve)
+        self.refresh_interval = refresh_interval
+        self.max_wait = max_wait
+        self.priorities = dict(DEFAULT_PRIORITIES)
+        if priorities:
+            self.priorities.update(priorities)
+
+        self.limit: Optional[float] = None
+        self.remaining: Optional[float] = None
+        self.reset_at: Optional[float] = None
+        self.refreshed_at: Optional[float] = None
+        self.sent: Dict[str, int] = {level: 0 for level in PRIORITIES}
+        self.waited: Dict[str, float] = {level: 0.0 for level in PRIORITIES}
+
+        self._window: Optional[float] = None  # largest remaining seen, standing in for an unreported limit
+        self._stale = False
+        self._next_low = 0.0
+        self._refresh: Optional[Callable[[], Awaitable[Any]]] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._low_lock: Optional[asyncio.Lock] = None
+
+    def bind(self, refresh: Callable[[], Awaitable[Any]]):
+        """Set the coroutine function that re-reads usage (done by the client)"""
+        self._refresh = refresh
+
+    def priority_for(self, endpoint: str) -> str:
+        level = _priority.get()
+        if level is not None:
+            return level
+        best = None
+        for prefix in self.priorities:
+            if endpoint.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.priorities[best] if best is not None else NORMAL
+
+    def update(self, usage: Dict[str, Any]):
+        """Take the remaining quota from a usage payload"""
+        limit, remaining, reset_in = parse_usage(usage)
+        now = time.monotonic()
+        self.refreshed_at = now
+        self._stale = False
+        if remaining is None:
+            logger.debug("Usage payload has no remaining quota; requests are not gated")
+            return
+        self.limit = limit
+        self.remaining = remaining
+        self._window = max(self._window or 0.0, remaining)
+        self.reset_at = now + reset_in if reset_in is not None else None
+
+    def mark_stale(self):
+        """Re-read usage before the next request (e.g. after a 429)"""
+        self._stale = True
+
+    def consume(self, count: float = 1):
+        """Count requests sent without acquire (e.g. hedges) against the local estimate"""
+        if self.remaining is not None:
+            self.remaining = max(0.0, self.remaining - count)
+
+    def _floor(self, level: str) -> float:
+        if level == HIGH:
+            return 0.0
+        base = self.limit or self._window or 0.0
+        return base * (self.reserve if level == NORMAL else self.low_reserve)
+
+    def _until_reset(self, now: float) -> float:
+        if self.reset_at is None:
+            return self.refresh_interval
+        return max(0.0, self.reset_at - now)
+
+    async def _maybe_refresh(self):
+        if self._refresh is None:
+            return
+        now = time.monotonic()
+        due = (
+            self._stale or self.refreshed_at is None
+            or now - self.refreshed_at >= self.refresh_interval
+            or (self.reset_at is not None and now >= self.reset_at)
+        )
+        if not due:
+            return
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if self.refreshed_at is not None and self.refreshed_at > now:
+                return  # refreshed while waiting for the lock
+            try:
+                await self._refresh()
+            except Exception as e:
+                logger.warning("Could not read API usage, keeping the local estimate: %s", e)
+                self.refreshed_at = time.monotonic()
+                self._stale = False
+
+    async def _wait(self, level: str, seconds: float, waited: float):
+        if self.max_wait is not None and waited + seconds > self.max_wait:
+            raise RateLimitError(
+                f"Quota left is reserved for higher-priority requests ({level} request)",
+                retry_after=seconds
+            )
+        await asyncio.sleep(seconds)
+
+    async def acquire(self, endpoint: str) -> float:
+        """Wait until a request to endpoint may be sent; returns the seconds waited"""
+        if endpoint in EXEMPT_ENDPOINTS:
+            return 0.0
+        level = self.priority_for(endpoint)
+        started = time.monotonic()
+        if level == LOW:
+            if self._low_lock is None:
+                self._low_lock = asyncio.Lock()
+            async with self._low_lock:
+                await self._admit(level, started)
+        else:
+            await self._admit(level, started)
+        self.consume()
+        self.sent[level] += 1
+        waited = time.monotonic() - started
+        self.waited[level] += waited
+        return waited
+
+    async def _admit(self, level: str, started: float):
+        while True:
+            await self._maybe_refresh()
+            if self.remaining is None or level == HIGH:
+                return
+            floor = self._floor(level)
+            now = time.monotonic()
+            available = self.remaining - floor
+            if available >= 1:
+                if level != LOW:
+                    return
+                if now >= self._next_low:
+                    # Spread what low-priority work may use over the rest of the window
+                    self._next_low = now + self._until_reset(now) / available
+                    return
+                await self._wait(level, self._next_low - now, now - started)
+                continue
+            # Out of quota for this priority until the window resets
+            await self._wait(level, max(1.0, self._until_reset(now)), now - started)
+            self._stale = True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_in": self._until_reset(time.monotonic()) if self.reset_at is not None else None,
+            "sent": dict(self.sent),
+            "waited": {level: round(seconds, 3) for level, seconds in self.waited.items()},
+        }
@@ -0,0 +1,170 @@
+"""
+Client-side rate limiting and retry backoff.
+
+A single RateLimiter is shared by every request made through a client. It is a
+token bucket whose rate adapts to what the server reports: 429 responses cut
+the rate, successful responses let it recover, and exhausted rate-limit
+headers pause the bucket so queued requests wait instead of failing. Pauses
+for a 429's Retry-After are left to the caller, which only pauses when it is
+going to wait and retry.
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Mapping
+
+# Header names checked for server-side rate limit state, most specific first
+REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter for a zero-based retry attempt"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    # Reset headers are either a delay in seconds or a unix timestamp
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+def _first_header(headers: Mapping[str, str], names) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+class RateLimiter:
+    """
+    Adaptive token bucket limiting requests per second.
+
+    Args:
+        rate: Maximum requests per second, or None for no client-side cap.
+            When set, 429 responses halve the current rate and each successful
+            response recovers it by a fraction of this ceiling.
+        burst: Bucket capacity (defaults to max(1, rate))
+        min_rate: Floor the rate never drops below after 429s
+        recovery: Fraction of the ceiling recovered per successful response
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        min_rate: float = 0.5,
+        recovery: float = 0.05
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.min_rate = min(min_rate, rate) if rate is not None else min_rate
+        self.recovery = recovery
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds until the limiter accepts requests again"""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def _refill(self, now: float):
+        if self.rate is not None:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a request slot; returns the number of seconds spent waiting"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        start = time.monotonic()
+        waited = self._lock.locked()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    waited = True
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                if self.rate is None:
+                    break
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                waited = True
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+        return time.monotonic() - start if waited else 0.0
+
+    def pause(self, seconds: float):
+        """Hold every queued request for at least the given number of seconds"""
+        until = time.monotonic() + max(0.0, seconds)
+        if until > self._paused_until:
+            self._paused_until = until
+
+    def on_response(self, status_code: int, headers: Mapping[str, str], max_pause: Optional[float] = None):
+        """
+        Adapt to a server response.
+
+        Args:
+            status_code: Response status
+            headers: Response headers
+            max_pause: Longest pause an exhausted rate-limit window may impose
+        """
+        if status_code == 429:
+            if self.rate is not None:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._tokens = min(self._tokens, 0.0)
+        elif status_code < 400 and self.rate is not None and self.max_rate is not None:
+            self.rate = min(self.max_rate, self.rate + self.recovery * self.max_rate)
+
+        remaining = _first_header(headers, REMAINING_HEADERS)
+        reset = _first_header(headers, RESET_HEADERS)
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining_count = int(float(remaining))
+        except ValueError:
+            return
+        reset_in = _parse_reset(reset)
+        if reset_in is None:
+            return
+        if remaining_count <= 0:
+            self.pause(reset_in if max_pause is None else min(reset_in, max_pause))
+        elif self.rate is not None and reset_in > 0:
+            # Don't spend the remaining window allowance faster than it resets
+            self.rate = max(self.min_rate, min(self.rate, remaining_count / reset_in))
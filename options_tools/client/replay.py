@@ -0,0 +1,225 @@
+"""
+Record/replay transport.
+
+RecordReplayTransport sits under the client's httpx.AsyncClient (pass it as
+transport=...). In "record" mode requests go to the real server and every
+response is kept; closing the client writes them to a gzip-compressed archive.
+In "replay" mode responses are served from the archive without any network
+access, either as fast as possible or with the latency observed while
+recording. "auto" replays recorded requests and records new ones.
+
+Requests are keyed by method, path, query parameters and body. When the same
+request was recorded several times (e.g. a polled chain), the responses are
+replayed in order and the last one repeats.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..utils.exceptions import ReplayMissError
+
+MODES = ("record", "replay", "auto")
+
+ARCHIVE_VERSION = 1
+
+# Hop-by-hop headers that don't describe the recorded body
+_SKIP_HEADERS = frozenset(("transfer-encoding", "connection", "keep-alive"))
+
+RequestKey = Tuple[str, str, str, str]
+
+
+def request_key(request: httpx.Request) -> RequestKey:
+    """Key identifying equivalent requests: method, path, sorted query and body digest"""
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.url.params.multi_items()))
+    body = request.content
+    digest = hashlib.sha1(body).hexdigest() if body else ""
+    return (request.method, request.url.path, query, digest)
+
+
+class _Recording:
+    __slots__ = ("status", "headers", "body", "latency")
+
+    def __init__(self, status: int, headers: List[Tuple[str, str]], body: bytes, latency: float):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.latency = latency
+
+    def to_json(self, key: RequestKey) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {
+            "key": list(key),
+            "status": self.status,
+            "headers": self.headers,
+            "latency": round(self.latency, 6),
+        }
+        # Keep text bodies readable; anything else (compressed, binary formats) as base64
+        try:
+            entry["text"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["b64"] = base64.b64encode(self.body).decode("ascii")
+        return entry
+
+    @classmethod
+    def from_json(cls, entry: Dict[str, Any]) -> "_Recording":
+        if "text" in entry:
+            body = entry["text"].encode("utf-8")
+        else:
+            body = base64.b64decode(entry["b64"])
+        return cls(entry["status"], [tuple(h) for h in entry["headers"]], body, entry["latency"])
+
+    def response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            content=self.body,
+            request=request,
+            extensions={"replayed": True}
+        )
+
+
+class RecordReplayTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that records responses to, or replays them from, an archive.
+
+    Args:
+        path: Archive file (gzip-compressed JSON lines)
+        mode: "record" (overwrite the archive with this session's responses),
+            "replay" (serve only recorded responses) or "auto" (replay recorded
+            requests, record and append the rest)
+        simulate_latency: When replaying, wait as long as the recorded request took
+        transport: Transport used to reach the server when recording;
+            defaults to httpx.AsyncHTTPTransport()
+
+    Example:
+        >>> transport = RecordReplayTransport("spy.replay.gz", mode="replay")
+        >>> async with OptionsToolsClient("key", transport=transport) as client:
+        ...     chain = await client.get_options_chain("SPY")
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        simulate_latency: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unsupported replay mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self.hits = 0
+        self.recorded = 0
+        self._recordings: Dict[RequestKey, List[_Recording]] = {}
+        self._cursors: Dict[RequestKey, int] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if mode != "record":
+            if os.path.exists(path):
+                self._load()
+            elif mode == "replay":
+                raise FileNotFoundError(f"Replay archive not found: {path}")
+        self._transport = transport
+        if self._transport is None and mode != "replay":
+            self._transport = httpx.AsyncHTTPTransport()
+
+    def __len__(self) -> int:
+        return sum(len(recordings) for recordings in self._recordings.values())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        if self.mode != "record":
+            recording = self._next(key)
+            if recording is not None:
+                self.hits += 1
+                if self.simulate_latency and recording.latency > 0:
+                    await asyncio.sleep(recording.latency)
+                return recording.response(request)
+            if self.mode == "replay":
+                raise ReplayMissError(f"No recorded response for {request.method} {request.url}")
+        return await self._record(key, request)
+
+    def _next(self, key: RequestKey) -> Optional[_Recording]:
+        with self._lock:
+            recordings = self._recordings.get(key)
+            if not recordings:
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = min(cursor + 1, len(recordings) - 1)
+            return recordings[cursor]
+
+    async def _record(self, key: RequestKey, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        skip = _SKIP_HEADERS
+        try:
+            if response.is_stream_consumed:
+                # Already-read responses (e.g. from httpx.MockTransport) only have the decoded body
+                body = response.content
+                skip = skip | {"content-encoding", "content-length"}
+            else:
+                # Raw bytes, so compressed bodies stay compressed in the archive
+                body = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        latency = time.perf_counter() - started
+
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in skip]
+        recording = _Recording(response.status_code, headers, body, latency)
+        with self._lock:
+            recordings = self._recordings.setdefault(key, [])
+            recordings.append(recording)
+            # Keep replay order consistent with what this session has already served
+            self._cursors[key] = len(recordings) - 1
+            self.recorded += 1
+            self._dirty = True
+        return recording.response(request)
+
+    def _load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("version") != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported replay archive version in {self.path}: {header.get('version')}")
+            for line in f:
+                entry = json.loads(line)
+                key = tuple(entry["key"])
+                self._recordings.setdefault(key, []).append(_Recording.from_json(entry))
+
+    def save(self):
+        """Write every recorded response to the archive (done automatically on close)"""
+        with self._lock:
+            entries = [
+                recording.to_json(key)
+                for key, recordings in self._recordings.items()
+                for recording in recordings
+            ]
+            self._dirty = False
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"version": ARCHIVE_VERSION}) + "\n")
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def rewind(self):
+        """Replay every request from its first recorded response again"""
+        with self._lock:
+            self._cursors.clear()
+
+    async def aclose(self):
+        if self._dirty:
+            self.save()
+        if self._transport is not None:
+            await self._transport.aclose()
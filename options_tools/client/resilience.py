@@ -0,0 +1,273 @@
+"""
+Tail-latency and failure controls.
+
+HedgePolicy races a second copy of an idempotent request against a slow first
+one. The hedge is only sent once the first attempt has been outstanding for
+longer than a high percentile of the route's recent latency, so it targets
+stalled connections rather than ordinary slow responses, and a budget caps the
+extra traffic hedging can add.
+
+CircuitBreaker tracks consecutive failures (5xx responses, timeouts and
+connection errors) per endpoint, so one ticker failing doesn't cut off the
+others; it can group endpoints by route instead. Once a circuit trips,
+requests to it fail fast with CircuitOpenError, or are answered from expired
+cache entries, until a probe request succeeds after the recovery time.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional, Dict, Any, Awaitable, Callable, TypeVar
+
+from .metrics import LatencyHistogram, endpoint_route
+
+T = TypeVar("T")
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class HedgePolicy:
+    """
+    When and how often to hedge requests.
+
+    Args:
+        percentile: Latency percentile of the route after which a hedge is sent
+        min_delay: Never hedge sooner than this many seconds
+        max_delay: Never wait longer than this many seconds before hedging
+        initial_delay: Delay used until a route has min_samples latencies
+        min_samples: Responses needed before the route's percentile is trusted
+        budget: Hedges allowed per request, e.g. 0.1 lets at most one request
+            in ten be hedged over time
+        burst: Hedges that may be sent back to back before the budget applies
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.02,
+        max_delay: float = 5.0,
+        initial_delay: float = 1.0,
+        min_samples: int = 20,
+        budget: float = 0.1,
+        burst: int = 5
+    ):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.budget = budget
+        self.burst = burst
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._tokens = float(burst)
+        self._lock = threading.Lock()
+
+    def delay(self, endpoint: str) -> float:
+        """Seconds to wait for a response before hedging a request to endpoint"""
+        route = endpoint_route(endpoint)
+        delay = None
+        if self.latency.count(route) >= self.min_samples:
+            delay = self.latency.percentile(route, self.percentile)
+        if delay is None:
+            delay = self.initial_delay
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedges += 1
+            return True
+
+    def _count_request(self):
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(float(self.burst), self._tokens + self.budget)
+
+    async def run(
+        self,
+        endpoint: str,
+        send: Callable[[bool], Awaitable[T]],
+        usable: Callable[[T], bool] = lambda result: True,
+        on_hedge: Optional[Callable[[float], None]] = None
+    ) -> T:
+        """
+        Run send(False), hedging with send(True) if it is slow.
+
+        The first attempt to return a usable result wins and the other is
+        cancelled. If the winner's result isn't usable (e.g. a 5xx response)
+        or it raises, the other attempt is awaited instead.
+
+        Args:
+            endpoint: Endpoint being requested, used for its route's latency
+            send: Starts one attempt; its argument says whether it is the hedge
+            usable: Whether a result may end the race
+            on_hedge: Called with the delay when a hedge is sent
+        """
+        self._count_request()
+        route = endpoint_route(endpoint)
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(send(False))
+        hedge = None
+        try:
+            delay = self.delay(endpoint)
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._take_token():
+                result = await primary
+                self.latency.record(route, time.perf_counter() - started)
+                return result
+
+            if on_hedge is not None:
+                on_hedge(delay)
+            hedge = asyncio.ensure_future(send(True))
+            pending = {primary, hedge}
+            fallback = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and usable(task.result()):
+                        # A hedge win only bounds the first attempt's latency from below
+                        self.latency.record(route, time.perf_counter() - started)
+                        if task is hedge:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        return task.result()
+                    if fallback is None or fallback.exception() is not None:
+                        fallback = task
+            return fallback.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+            }
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probe_started")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started: Optional[float] = None
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with one circuit per endpoint.
+
+    Args:
+        failure_threshold: Consecutive failures that open a circuit
+        recovery_time: Seconds an open circuit waits before letting a probe
+            request through
+        stale_ttl: Seconds past expiry that cached responses are kept, to be
+            served while a circuit is open (applied to the client's cache)
+        per_route: Share one circuit between all tickers of a route (e.g.
+            /options/chain/{ticker}), so an outage of the whole route is
+            detected sooner, at the cost of one bad ticker also cutting off
+            the others. By default every concrete endpoint
+            (/options/chain/SPY) has its own circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        stale_ttl: float = 300.0,
+        per_route: bool = False
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_time = recovery_time
+        self.stale_ttl = stale_ttl
+        self.per_route = per_route
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def key(self, endpoint: str) -> str:
+        """Name of the circuit guarding endpoint"""
+        return endpoint_route(endpoint) if self.per_route else endpoint
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        key = self.key(endpoint)
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def allow(self, endpoint: str) -> bool:
+        """
+        Whether a request to endpoint may be sent now.
+
+        Once an open circuit's recovery time has passed, one caller at a time
+        is let through as a probe; its outcome closes or reopens the circuit.
+        """
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.get(self.key(endpoint))
+            if circuit is None or circuit.state == CLOSED:
+                return True
+            if now - circuit.opened_at < self.recovery_time:
+                return False
+            # A probe that never reported back (e.g. cancelled) is replaced
+            if circuit.probe_started is not None and now - circuit.probe_started < self.recovery_time:
+                return False
+            circuit.state = HALF_OPEN
+            circuit.probe_started = now
+            return True
+
+    def retry_after(self, endpoint: str) -> Optional[float]:
+        """Seconds until an open circuit admits a probe, or None if closed"""
+        with self._lock:
+            circuit = self._circuits.get(self.key(endpoint))
+            if circuit is None or circuit.state == CLOSED:
+                return None
+            return max(0.0, circuit.opened_at + self.recovery_time - time.monotonic())
+
+    def record_success(self, endpoint: str):
+        # A healthy circuit is the default, so it needn't be kept; this also
+        # bounds the table when every ticker has its own circuit
+        with self._lock:
+            self._circuits.pop(self.key(endpoint), None)
+
+    def record_failure(self, endpoint: str):
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probe_started = None
+
+    def state(self, endpoint: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(self.key(endpoint))
+            return circuit.state if circuit is not None else CLOSED
+
+    def states(self) -> Dict[str, str]:
+        """State of every circuit that has failed since its last success"""
+        with self._lock:
+            return {key: circuit.state for key, circuit in sorted(self._circuits.items())}
+
+    def reset(self, endpoint: Optional[str] = None):
+        """Close the circuit guarding endpoint, or every circuit"""
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(self.key(endpoint), None)
@@ -0,0 +1,35 @@
+"""
+Request coalescing.
+
+Concurrent callers asking for the same key share one in-flight task and all
+receive its result or its exception.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Run at most one task per key at a time and share its outcome"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        # Shield so one caller being cancelled doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every waiter was cancelled
+            task.exception()
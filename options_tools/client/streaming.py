@@ -0,0 +1,262 @@
+"""
+Streaming options flow.
+
+FlowStream subscribes to the flow websocket and yields FlowOrders as they
+arrive, reconnecting and resuming from the last order seen after a dropped
+connection. FlowAggregator keeps rolling-window premium totals up to date
+incrementally as orders are added and expire.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Deque, Set, Tuple, TYPE_CHECKING
+from urllib.parse import urlencode
+
+import websocket
+
+from ..models.responses import FlowOrder, OptionsFlow
+from ..utils.exceptions import OptionsToolsError, AuthenticationError
+from .rate_limit import backoff_delay
+
+if TYPE_CHECKING:
+    from .client import OptionsToolsClient
+
+logger = logging.getLogger(__name__)
+
+# Sentinel pushed onto the queue when the stream ends
+_CLOSED = object()
+
+
+def _order_key(order: FlowOrder) -> Tuple:
+    return (order.timestamp, order.strike, order.expiration, order.type, order.size, order.premium)
+
+
+class FlowAggregator:
+    """
+    Rolling-window flow totals maintained incrementally.
+
+    Args:
+        window: Orders older than this (relative to the newest order) are
+            dropped from the totals. None keeps every order.
+    """
+
+    def __init__(self, window: Optional[timedelta] = timedelta(minutes=15)):
+        self.window = window
+        self.orders: Deque[FlowOrder] = deque()
+        self.total_premium = 0.0
+        self.bullish_premium = 0.0
+        self.bearish_premium = 0.0
+        self.unusual_count = 0
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def _apply(self, order: FlowOrder, sign: int):
+        self.total_premium += sign * order.premium
+        if order.sentiment == "bullish":
+            self.bullish_premium += sign * order.premium
+        elif order.sentiment == "bearish":
+            self.bearish_premium += sign * order.premium
+        if order.is_unusual:
+            self.unusual_count += sign
+
+    def add(self, order: FlowOrder):
+        self.orders.append(order)
+        self._apply(order, 1)
+        self.expire(order.timestamp)
+
+    def expire(self, now: datetime):
+        """Drop orders that fell out of the window ending at now"""
+        if self.window is None:
+            return
+        cutoff = now - self.window
+        while self.orders and self.orders[0].timestamp < cutoff:
+            self._apply(self.orders.popleft(), -1)
+        if not self.orders:
+            # Reset accumulated float drift once the window is empty
+            self.total_premium = self.bullish_premium = self.bearish_premium = 0.0
+            self.unusual_count = 0
+
+    def snapshot(self, ticker: str, timeframe: str = "stream") -> OptionsFlow:
+        return OptionsFlow.model_construct(
+            ticker=ticker,
+            timeframe=timeframe,
+            orders=list(self.orders),
+            total_premium=self.total_premium,
+            bullish_premium=self.bullish_premium,
+            bearish_premium=self.bearish_premium,
+            unusual_count=self.unusual_count
+        )
+
+
+class FlowStream:
+    """
+    Async iterator of FlowOrders for one ticker.
+
+    The websocket is read on a background thread and orders are handed to
+    the event loop, so iteration never blocks the loop. Use as an async
+    context manager (or call close()) to stop the connection.
+
+    Example:
+        >>> async with client.stream_options_flow("SPY") as stream:
+        ...     async for order in stream:
+        ...         print(order.premium, stream.aggregates.total_premium)
+    """
+
+    def __init__(
+        self,
+        client: "OptionsToolsClient",
+        ticker: str,
+        min_premium: Optional[float] = None,
+        unusual_only: bool = False,
+        window: Optional[timedelta] = timedelta(minutes=15),
+        max_reconnects: Optional[int] = None
+    ):
+        self.ticker = ticker.upper()
+        self.aggregates = FlowAggregator(window)
+        self.max_reconnects = max_reconnects
+
+        self._api_key = client.api_key
+        self._timeout = client.timeout
+        self._base = client.base_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+        self._params: Dict[str, Any] = {"unusual_only": str(unusual_only).lower()}
+        if min_premium:
+            self._params["min_premium"] = min_premium
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._ws: Optional[websocket.WebSocket] = None
+        self._last_timestamp: Optional[datetime] = None
+        self._seen_at_last: Set[Tuple] = set()
+        self._resuming = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> FlowOrder:
+        if self._thread is None:
+            self._start()
+        item = await self._queue.get()
+        if item is _CLOSED:
+            self._queue.put_nowait(_CLOSED)
+            raise StopAsyncIteration
+        if isinstance(item, Exception):
+            self._queue.put_nowait(_CLOSED)
+            raise item
+        self.aggregates.add(item)
+        return item
+
+    def _start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"options-tools-flow-{self.ticker}", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+
+    def _url(self) -> str:
+        params = dict(self._params)
+        if self._last_timestamp is not None:
+            params["since"] = self._last_timestamp.isoformat()
+        return f"{self._base}/api/v1/options/flow/{self.ticker}/stream?{urlencode(params)}"
+
+    def _emit(self, item: Any):
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            # The consuming event loop has already been closed
+            self._stop.set()
+
+    def _run(self):
+        failures = 0
+        try:
+            while not self._stop.is_set():
+                try:
+                    self._ws = websocket.create_connection(
+                        self._url(),
+                        header={"X-API-Key": self._api_key},
+                        timeout=self._timeout
+                    )
+                    failures = 0
+                    self._resuming = self._last_timestamp is not None
+                    self._read(self._ws)
+                except websocket.WebSocketBadStatusException as e:
+                    if e.status_code in (401, 403):
+                        self._emit(AuthenticationError("Invalid API key"))
+                        return
+                    failures += 1
+                except (websocket.WebSocketException, OSError):
+                    failures += 1
+                finally:
+                    if self._ws is not None:
+                        self._ws.close()
+                        self._ws = None
+
+                if self._stop.is_set():
+                    break
+                if self.max_reconnects is not None and failures > self.max_reconnects:
+                    self._emit(OptionsToolsError(f"Flow stream for {self.ticker} disconnected"))
+                    return
+                self._stop.wait(backoff_delay(failures, base=1.0))
+        finally:
+            self._emit(_CLOSED)
+
+    def _read(self, ws: websocket.WebSocket):
+        # Short socket timeout so close() is noticed promptly
+        ws.settimeout(1.0)
+        while not self._stop.is_set():
+            try:
+                message = ws.recv()
+            except websocket.WebSocketTimeoutException:
+                continue
+            if not message:
+                return
+            try:
+                payload = json.loads(message)
+                if isinstance(payload, dict):
+                    if payload.get("type") in ("heartbeat", "ping"):
+                        continue
+                    payload = payload.get("data", payload)
+                orders = [FlowOrder(**data) for data in (payload if isinstance(payload, list) else [payload])]
+            except (ValueError, TypeError) as e:
+                logger.warning("Skipping malformed flow message for %s: %s", self.ticker, e)
+                continue
+            for order in orders:
+                if self._is_new(order):
+                    self._emit(order)
+
+    def _is_new(self, order: FlowOrder) -> bool:
+        key = _order_key(order)
+        last = self._last_timestamp
+        if self._resuming:
+            # After a reconnect the server replays from `since`; skip what was already delivered
+            if order.timestamp < last or key in self._seen_at_last:
+                return False
+            if order.timestamp > last:
+                self._resuming = False
+
+        if last is None or order.timestamp > last:
+            self._last_timestamp = order.timestamp
+            self._seen_at_last = {key}
+        elif order.timestamp == last:
+            self._seen_at_last.add(key)
+        return True
@@ -0,0 +1,20 @@
+"""
+MCP (Model Context Protocol) integration.
+
+create_server() builds an MCP server exposing the Options.tools client
+methods as tools with summarized results. Requires the MCP SDK
+(pip install options-tools[mcp]); the summaries work without it.
+"""
+
+from .summaries import (
+    summarize_chain,
+    summarize_flow,
+    summarize_filings,
+    summarize_analysis,
+    summarize_portfolio,
+)
+
+
+def create_server(*args, **kwargs):
+    from .server import create_server
+    return create_server(*args, **kwargs)
@@ -0,0 +1,232 @@
+"""
+MCP tool server for Options.tools.
+
+Every tool call goes through one shared OptionsToolsClient, so concurrent calls
+share its connection pool, response cache, request coalescing and rate
+limiter. Results are summarized (see summaries.py) rather than returned in
+full.
+
+Requires the MCP Python SDK (pip install options-tools[mcp]).
+
+Run over stdio with:
+    OPTIONS_TOOLS_API_KEY=... python -m options_tools.mcp
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from datetime import date
+from typing import Optional, Dict, Any, List
+
+try:
+    from mcp.server.fastmcp import FastMCP
+except ImportError:  # pragma: no cover - optional dependency
+    FastMCP = None
+
+from ..client.client import OptionsToolsClient
+from ..client.singleflight import SingleFlight
+from ..models.responses import OptionsChain
+from .summaries import (
+    summarize_chain, summarize_flow, summarize_filings,
+    summarize_analysis, summarize_portfolio
+)
+
+INSTRUCTIONS = (
+    "Options.tools market data. Tool results are summaries: options chains list "
+    "strikes near the money for the nearest expirations, flows list the largest "
+    "orders. Ask for more strikes or expirations only when needed."
+)
+
+
+def _compact(result: Any) -> str:
+    # Compact JSON text; MCP would otherwise pretty-print the result, costing tokens
+    return json.dumps(result, separators=(",", ":"), default=str)
+
+
+def create_server(
+    api_key: Optional[str] = None,
+    client: Optional[OptionsToolsClient] = None,
+    name: str = "options-tools",
+    **client_kwargs
+) -> "FastMCP":
+    """
+    Build an MCP server exposing the client methods as tools.
+
+    Args:
+        api_key: Options.tools API key (defaults to $OPTIONS_TOOLS_API_KEY)
+        client: Client to share between tool calls; one with caching
+            enabled is created if not given
+        name: Server name reported to MCP clients
+        **client_kwargs: Options for the created OptionsToolsClient
+    """
+    if FastMCP is None:
+        raise ImportError("The MCP server requires the MCP SDK; install it with `pip install options-tools[mcp]`")
+
+    if client is None:
+        api_key = api_key or os.environ.get("OPTIONS_TOOLS_API_KEY")
+        if not api_key:
+            raise ValueError("An API key is required (pass api_key or set OPTIONS_TOOLS_API_KEY)")
+        client_kwargs.setdefault("cache", True)
+        client = OptionsToolsClient(api_key, **client_kwargs)
+
+    # The client deliberately outlives individual MCP sessions (HTTP
+    # transports open one per connection), so it is not closed with them
+    mcp = FastMCP(name, instructions=INSTRUCTIONS)
+    # Parallel calls for one ticker share a single built chain (and its index),
+    # not just the HTTP request the client already coalesces
+    building = SingleFlight()
+
+    async def get_chain(ticker: str) -> OptionsChain:
+        return await building.do(("chain", ticker), lambda: client.get_options_chain(ticker))
+
+    @mcp.tool()
+    async def options_chain(
+        ticker: str,
+        strikes: int = 5,
+        expirations: int = 3,
+        expiration: Optional[str] = None,
+        option_type: Optional[str] = None
+    ) -> str:
+        """
+        Options chain for a ticker, trimmed to strikes near the money.
+
+        Args:
+            ticker: Stock symbol, e.g. SPY
+            strikes: Strikes to include on each side of the spot price
+            expirations: Number of nearest expirations to include
+            expiration: Only this expiration (YYYY-MM-DD)
+            option_type: "call" or "put" to include only one side
+        """
+        chain = await get_chain(ticker.upper())
+        return _compact(summarize_chain(
+            chain, strikes, expirations,
+            date.fromisoformat(expiration) if expiration else None, option_type
+        ))
+
+    @mcp.tool()
+    async def options_chains(tickers: List[str], strikes: int = 3, expirations: int = 1) -> str:
+        """
+        Near-the-money options for several tickers at once.
+
+        Args:
+            tickers: Stock symbols
+            strikes: Strikes to include on each side of the spot price
+            expirations: Number of nearest expirations to include
+        """
+        symbols = list(dict.fromkeys(t.upper() for t in tickers))
+        chains = await asyncio.gather(*(get_chain(t) for t in symbols), return_exceptions=True)
+        result = {}
+        for ticker, chain in zip(symbols, chains):
+            if isinstance(chain, Exception):
+                result[ticker] = {"error": str(chain)}
+            else:
+                result[ticker] = summarize_chain(chain, strikes, expirations)
+        return _compact(result)
+
+    @mcp.tool()
+    async def options_flow(
+        ticker: str,
+        timeframe: str = "1d",
+        min_premium: Optional[float] = None,
+        unusual_only: bool = False,
+        top: int = 10
+    ) -> str:
+        """
+        Options flow totals and the largest orders by premium.
+
+        Args:
+            ticker: Stock symbol
+            timeframe: Lookback window, e.g. 1d
+            min_premium: Ignore orders below this premium
+            unusual_only: Only unusual activity
+            top: Number of largest orders to list
+        """
+        flow = await client.get_options_flow(ticker.upper(), timeframe, min_premium, unusual_only)
+        return _compact(summarize_flow(flow, top))
+
+    @mcp.tool()
+    async def sec_filings(
+        ticker: str,
+        filing_type: Optional[str] = None,
+        limit: int = 10,
+        include_data: bool = False
+    ) -> str:
+        """
+        Recent SEC filings, newest first.
+
+        Args:
+            ticker: Stock symbol
+            filing_type: Only this form type, e.g. 10-K, 10-Q, 8-K
+            limit: Maximum filings to return
+            include_data: Include each filing's parsed data instead of only its section names
+        """
+        filings = await client.get_sec_filings(ticker.upper(), filing_type, limit)
+        return _compact(summarize_filings(filings, include_data))
+
+    @mcp.tool()
+    async def entry_analysis(
+        ticker: str,
+        capital: Optional[float] = None,
+        risk_tolerance: str = "moderate"
+    ) -> str:
+        """
+        Entry signals and recommended action for a ticker.
+
+        Args:
+            ticker: Stock symbol
+            capital: Capital available for the position
+            risk_tolerance: conservative, moderate or aggressive
+        """
+        return _compact(summarize_analysis(await client.get_entry_analysis(ticker.upper(), capital, risk_tolerance)))
+
+    @mcp.tool()
+    async def exit_analysis(ticker: str, entry_price: float, position: Dict[str, Any]) -> str:
+        """
+        Exit signals for an open position.
+
+        Args:
+            ticker: Stock symbol
+            entry_price: Price the position was entered at
+            position: Position details (e.g. quantity, type, strike, expiration)
+        """
+        return _compact(summarize_analysis(await client.get_exit_analysis(ticker.upper(), entry_price, position)))
+
+    @mcp.tool()
+    async def optimize_portfolio(
+        capital: float,
+        tickers: List[str],
+        strategy: str = "balanced",
+        risk_level: str = "moderate"
+    ) -> str:
+        """
+        Suggested allocation and options strategies across tickers.
+
+        Args:
+            capital: Total capital to allocate
+            tickers: Candidate stock symbols
+            strategy: income, growth or balanced
+            risk_level: conservative, moderate or aggressive
+        """
+        result = await client.optimize_portfolio(capital, [t.upper() for t in tickers], strategy, risk_level)
+        return _compact(summarize_portfolio(result))
+
+    @mcp.tool()
+    async def api_usage() -> str:
+        """Current API usage and remaining quota"""
+        return _compact(await client.get_api_usage())
+
+    return mcp
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run the Options.tools MCP server")
+    parser.add_argument("--transport", choices=["stdio", "sse", "streamable-http"], default="stdio")
+    parser.add_argument("--base-url", default=os.environ.get("OPTIONS_TOOLS_BASE_URL", "https://api.options.tools"))
+    parser.add_argument("--rate-limit", type=float, default=None, help="client-side requests per second")
+    args = parser.parse_args(argv)
+    create_server(base_url=args.base_url, rate_limit=args.rate_limit).run(args.transport)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Compact, token-efficient summaries of API responses for MCP tool results.
+
+Full responses can hold thousands of contracts or orders; tools return only
+what an agent usually needs (strikes near the money, the largest orders,
+filing metadata) in a table-like shape with rounded numbers.
+"""
+
+from datetime import date
+from typing import Optional, Dict, Any, List, Sequence
+
+from ..models.responses import (
+    Option, OptionsChain, OptionsFlow, SECFiling,
+    AnalysisResult, PortfolioOptimization
+)
+
+CHAIN_COLUMNS = ("strike", "bid", "ask", "last", "iv", "delta", "gamma", "theta", "vega", "volume", "oi")
+FLOW_COLUMNS = ("time", "type", "strike", "expiration", "size", "premium", "sentiment", "sweep", "unusual")
+
+
+def _round(value: Optional[float], digits: int = 4) -> Optional[float]:
+    return None if value is None else round(value, digits)
+
+
+def _option_row(option: Option) -> List[Any]:
+    return [
+        option.strike, _round(option.bid, 2), _round(option.ask, 2), _round(option.last, 2),
+        _round(option.implied_volatility), _round(option.delta), _round(option.gamma),
+        _round(option.theta), _round(option.vega), option.volume, option.open_interest
+    ]
+
+
+def summarize_chain(
+    chain: OptionsChain,
+    strikes: int = 5,
+    expirations: int = 3,
+    expiration: Optional[date] = None,
+    option_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Contracts near the money for the nearest expirations.
+
+    Args:
+        chain: Full options chain
+        strikes: Strikes to keep on each side of spot
+        expirations: Number of nearest expirations to include
+        expiration: Only this expiration (overrides expirations)
+        option_type: Only calls or puts
+    """
+    index = chain.index
+    selected = [expiration] if expiration else index.expirations[:expirations]
+    types = [option_type.lower()] if option_type else ["call", "put"]
+    groups = []
+    for e in selected:
+        group: Dict[str, Any] = {"expiration": e.isoformat()}
+        for t in types:
+            rows = index.strike_window(chain.spot_price, count=strikes, expiration=e, option_type=t)
+            group[f"{'call' if t.startswith('c') else 'put'}s"] = [_option_row(o) for o in rows]
+        straddle = index.atm_straddle(e, chain.spot_price)
+        if straddle is not None and all(o.ask is not None and o.bid is not None for o in straddle):
+            call, put = straddle
+            group["atm_straddle"] = {
+                "strike": call.strike,
+                "mid": round((call.bid + call.ask + put.bid + put.ask) / 2, 2),
+            }
+        groups.append(group)
+
+    call_volume = sum(o.volume or 0 for o in chain.options if o.type.lower().startswith("c"))
+    put_volume = sum(o.volume or 0 for o in chain.options if not o.type.lower().startswith("c"))
+    return {
+        "ticker": chain.ticker,
+        "spot_price": chain.spot_price,
+        "timestamp": chain.timestamp.isoformat(),
+        "total_contracts": len(chain.options),
+        "expirations_listed": [e.isoformat() for e in index.expirations],
+        "put_call_volume_ratio": round(put_volume / call_volume, 3) if call_volume else None,
+        "columns": list(CHAIN_COLUMNS),
+        "expirations": groups,
+    }
+
+
+def summarize_flow(flow: OptionsFlow, top: int = 10) -> Dict[str, Any]:
+    """Flow totals plus the largest orders by premium"""
+    largest = sorted(flow.orders, key=lambda o: o.premium, reverse=True)[:top]
+    return {
+        "ticker": flow.ticker,
+        "timeframe": flow.timeframe,
+        "order_count": len(flow.orders),
+        "total_premium": round(flow.total_premium, 2),
+        "bullish_premium": round(flow.bullish_premium, 2),
+        "bearish_premium": round(flow.bearish_premium, 2),
+        "unusual_count": flow.unusual_count,
+        "columns": list(FLOW_COLUMNS),
+        "largest_orders": [
+            [
+                o.timestamp.isoformat(), o.type, o.strike, o.expiration.isoformat(), o.size,
+                round(o.premium, 2), o.sentiment, o.is_sweep, o.is_unusual
+            ]
+            for o in largest
+        ],
+    }
+
+
+def summarize_filings(filings: Sequence[SECFiling], include_data: bool = False) -> List[Dict[str, Any]]:
+    """Filing metadata; parsed_data is reduced to its section names unless include_data is set"""
+    result = []
+    for filing in filings:
+        item: Dict[str, Any] = {
+            "filing_type": filing.filing_type,
+            "filing_date": filing.filing_date.isoformat(),
+            "accession_number": filing.accession_number,
+            "url": filing.url,
+        }
+        if include_data:
+            item["parsed_data"] = filing.parsed_data
+        else:
+            item["sections"] = sorted(filing.parsed_data)
+        result.append(item)
+    return result
+
+
+def summarize_analysis(result: AnalysisResult) -> Dict[str, Any]:
+    return {
+        "ticker": result.ticker,
+        "timestamp": result.timestamp.isoformat(),
+        "recommended_action": result.recommended_action,
+        "risk_score": _round(result.risk_score, 2),
+        "expected_return": _round(result.expected_return),
+        "stop_loss": _round(result.stop_loss, 2),
+        "take_profit": _round(result.take_profit, 2),
+        "signals": [
+            {"type": s.type, "strength": round(s.strength, 1), "confidence": round(s.confidence, 3), "reason": s.reason}
+            for s in sorted(result.signals, key=lambda s: s.strength, reverse=True)
+        ],
+    }
+
+
+def summarize_portfolio(result: PortfolioOptimization) -> Dict[str, Any]:
+    return {
+        "total_capital": result.total_capital,
+        "expected_portfolio_return": _round(result.expected_portfolio_return),
+        "portfolio_risk": _round(result.portfolio_risk),
+        "sharpe_ratio": _round(result.sharpe_ratio, 3),
+        "recommendations": [
+            {
+                "ticker": r.ticker,
+                "allocation": _round(r.allocation),
+                "strategy": r.strategy,
+                "expected_return": _round(r.expected_return),
+                "risk": _round(r.risk),
+                "trades": len(r.options_trades),
+            }
+            for r in result.recommendations
+        ],
+    }
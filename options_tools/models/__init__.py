@@ -1 +1,5 @@
-from .responses import *
\ No newline at end of file
+from .responses import *
+from .compact import CompactSECFiling
+
+# ColumnarOptionsChain and diff_chains live in .columnar and .diff; they are
+# not imported here so that loading the models doesn't load numpy
@@ -0,0 +1,260 @@
+"""
+Columnar, NumPy-backed options chain.
+
+ColumnarOptionsChain stores each contract field as a typed array instead of a
+list of Option models. Missing float values are NaN; integer fields keep a
+separate presence mask. Indexing with a slice returns zero-copy views, and
+rows are converted to Option models only when they are accessed.
+
+Requires numpy (pip install options-tools[numpy]).
+"""
+
+from datetime import date, datetime
+from typing import Optional, Dict, Any, List, Iterator, Union, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .responses import Option, OptionsChain
+from .construct import parse_datetime
+
+FLOAT_FIELDS = ("bid", "ask", "last", "implied_volatility", "delta", "gamma", "theta", "vega")
+INT_FIELDS = ("volume", "open_interest")
+COLUMNS = ("strike", "expiration", "is_call") + FLOAT_FIELDS + INT_FIELDS
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "ColumnarOptionsChain requires numpy; install it with `pip install options-tools[numpy]`"
+        )
+
+
+class ColumnarOptionsChain:
+    """
+    Options chain stored as one array per field.
+
+    Attributes:
+        strike: float64 strikes
+        expiration: datetime64[D] expiration dates
+        is_call: bool, True for calls and False for puts
+        bid, ask, last, implied_volatility, delta, gamma, theta, vega:
+            float64, NaN where the value is missing
+        volume, open_interest: int64, 0 where missing (see mask())
+    """
+
+    __slots__ = ("ticker", "spot_price", "timestamp", "_columns", "_masks")
+
+    def __init__(
+        self,
+        ticker: str,
+        spot_price: float,
+        timestamp: datetime,
+        columns: Dict[str, Any],
+        masks: Optional[Dict[str, Any]] = None
+    ):
+        _require_numpy()
+        self.ticker = ticker
+        self.spot_price = spot_price
+        self.timestamp = timestamp
+        self._columns = columns
+        if masks is None:
+            masks = {name: np.ones(len(columns["strike"]), dtype=bool) for name in INT_FIELDS}
+        self._masks = masks
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self) -> int:
+        return len(self._columns["strike"])
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnarOptionsChain(ticker={self.ticker!r}, spot_price={self.spot_price}, "
+            f"timestamp={self.timestamp.isoformat()}, contracts={len(self)})"
+        )
+
+    def __getitem__(self, key) -> Union[Option, "ColumnarOptionsChain"]:
+        """
+        Index rows.
+
+        An integer returns a single Option. A slice returns a chain of views
+        sharing memory with this one; a boolean mask or index array returns a
+        chain with copied rows.
+        """
+        if isinstance(key, (int, np.integer)):
+            return self.option(int(key))
+        return self._take(key)
+
+    def __iter__(self) -> Iterator[Option]:
+        for i in range(len(self)):
+            yield self.option(i)
+
+    def _take(self, key) -> "ColumnarOptionsChain":
+        return ColumnarOptionsChain(
+            self.ticker,
+            self.spot_price,
+            self.timestamp,
+            {name: column[key] for name, column in self._columns.items()},
+            {name: mask[key] for name, mask in self._masks.items()}
+        )
+
+    @property
+    def columns(self) -> Dict[str, Any]:
+        return dict(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.nbytes for c in self._columns.values()) + sum(m.nbytes for m in self._masks.values())
+
+    def mask(self, name: str):
+        """Boolean array that is True where the field has a value"""
+        if name in self._masks:
+            return self._masks[name]
+        column = self._columns[name]
+        if column.dtype.kind == "f":
+            return ~np.isnan(column)
+        return np.ones(len(column), dtype=bool)
+
+    def calls(self) -> "ColumnarOptionsChain":
+        return self._take(self._columns["is_call"])
+
+    def puts(self) -> "ColumnarOptionsChain":
+        return self._take(~self._columns["is_call"])
+
+    def expiring(self, expiration: Union[date, str]) -> "ColumnarOptionsChain":
+        return self._take(self._columns["expiration"] == np.datetime64(expiration, "D"))
+
+    # Conversion to models
+    def option(self, i: int) -> Option:
+        c = self._columns
+        fields: Dict[str, Any] = {
+            "strike": float(c["strike"][i]),
+            "expiration": c["expiration"][i].astype(object),
+            "type": "call" if c["is_call"][i] else "put",
+        }
+        for name in FLOAT_FIELDS:
+            value = float(c[name][i])
+            fields[name] = None if value != value else value
+        for name in INT_FIELDS:
+            fields[name] = int(c[name][i]) if self._masks[name][i] else None
+        return Option.model_construct(**fields)
+
+    def to_options(self) -> List[Option]:
+        c = self._columns
+        strikes = c["strike"].tolist()
+        expirations = c["expiration"].astype(object).tolist()
+        types = ["call" if is_call else "put" for is_call in c["is_call"].tolist()]
+        floats = {
+            name: [None if v != v else v for v in c[name].tolist()] for name in FLOAT_FIELDS
+        }
+        ints = {
+            name: [v if present else None for v, present in zip(c[name].tolist(), self._masks[name].tolist())]
+            for name in INT_FIELDS
+        }
+        options = []
+        for i in range(len(strikes)):
+            fields = {name: values[i] for name, values in floats.items()}
+            fields.update((name, values[i]) for name, values in ints.items())
+            options.append(Option.model_construct(
+                strike=strikes[i], expiration=expirations[i], type=types[i], **fields
+            ))
+        return options
+
+    def to_chain(self) -> OptionsChain:
+        return OptionsChain.model_construct(
+            ticker=self.ticker,
+            spot_price=self.spot_price,
+            timestamp=self.timestamp,
+            options=self.to_options()
+        )
+
+    # Construction
+    @classmethod
+    def from_records(
+        cls,
+        ticker: str,
+        spot_price: float,
+        timestamp: datetime,
+        records: Sequence[Any]
+    ) -> "ColumnarOptionsChain":
+        """Build from a sequence of option dicts or Option models"""
+        _require_numpy()
+        if records and isinstance(records[0], Option):
+            get = getattr
+            expirations = [r.expiration for r in records]
+        else:
+            get = dict.get
+            expirations = [r["expiration"] for r in records]
+
+        columns: Dict[str, Any] = {
+            "strike": np.array([get(r, "strike") for r in records], dtype=np.float64),
+            "expiration": np.array(expirations, dtype="datetime64[D]"),
+            "is_call": np.array([str(get(r, "type")).lower().startswith("c") for r in records], dtype=bool),
+        }
+        for name in FLOAT_FIELDS:
+            # numpy turns None into NaN for float arrays
+            columns[name] = np.array([get(r, name) for r in records], dtype=np.float64)
+        masks = {}
+        for name in INT_FIELDS:
+            values = np.array([get(r, name) for r in records], dtype=np.float64)
+            present = ~np.isnan(values)
+            columns[name] = np.where(present, values, 0).astype(np.int64)
+            masks[name] = present
+        return cls(ticker, float(spot_price), timestamp, columns, masks)
+
+    @classmethod
+    def from_arrow(
+        cls,
+        ticker: str,
+        spot_price: float,
+        timestamp: datetime,
+        table: Any
+    ) -> "ColumnarOptionsChain":
+        """Build from a pyarrow.Table with one column per Option field"""
+        _require_numpy()
+
+        def values(name: str):
+            return np.asarray(table.column(name).to_numpy())
+
+        if "is_call" in table.column_names:
+            is_call = values("is_call").astype(bool)
+        else:
+            is_call = np.char.startswith(np.char.lower(values("type").astype(str)), "c")
+        columns: Dict[str, Any] = {
+            "strike": values("strike").astype(np.float64),
+            "expiration": values("expiration").astype("datetime64[D]"),
+            "is_call": is_call,
+        }
+        for name in FLOAT_FIELDS:
+            # Arrow nulls come through as NaN for float columns
+            columns[name] = values(name).astype(np.float64)
+        masks = {}
+        for name in INT_FIELDS:
+            present = ~np.asarray(table.column(name).is_null().to_numpy())
+            columns[name] = np.where(present, np.nan_to_num(values(name).astype(np.float64)), 0).astype(np.int64)
+            masks[name] = present
+        return cls(ticker, float(spot_price), timestamp, columns, masks)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnarOptionsChain":
+        """Build directly from a decoded API response, skipping model validation"""
+        options = data.get("options") or []
+        build = cls.from_arrow if hasattr(options, "column_names") else cls.from_records
+        return build(
+            data["ticker"],
+            data["spot_price"],
+            parse_datetime(data["timestamp"]),
+            options
+        )
+
+    @classmethod
+    def from_chain(cls, chain: OptionsChain) -> "ColumnarOptionsChain":
+        return cls.from_records(chain.ticker, chain.spot_price, chain.timestamp, chain.options)
@@ -0,0 +1,85 @@
+"""
+Response models with compacted payloads.
+"""
+
+from typing import Any, Dict, Optional
+
+from pydantic import PrivateAttr
+
+from ..utils.serialization import json_loads
+from .responses import SECFiling
+
+
+class _CompactJSON:
+    __slots__ = ("size",)
+
+    def __init__(self, size: int):
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"<{self.size} bytes of JSON>"
+
+
+class CompactSECFiling(SECFiling):
+    """
+    SECFiling that holds parsed_data as compact JSON bytes and expands it the
+    first time it is accessed.
+
+    This is a memory option for holding many filings at once. It costs time
+    instead of saving it: parsed_data has already been decoded with the rest
+    of its page and is encoded again to compact it. In exchange each held
+    filing takes a fraction of the memory, since compact JSON is several times
+    smaller than the dicts and strings it decodes to.
+    """
+
+    _parsed_data_json: Optional[bytes] = PrivateAttr(default=None)
+
+    def compact_parsed_data(self, raw: bytes):
+        """Replace parsed_data with its JSON encoding, expanded again on access"""
+        self.__dict__.pop("parsed_data", None)
+        self._parsed_data_json = raw
+
+    @property
+    def parsed_data_expanded(self) -> bool:
+        return "parsed_data" in self.__dict__
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "parsed_data":
+            return self._expand_parsed_data()
+        return super().__getattr__(name)
+
+    def _expand_parsed_data(self) -> Dict[str, Any]:
+        raw = self._parsed_data_json
+        value = json_loads(raw) if raw is not None else {}
+        self.__dict__["parsed_data"] = value
+        self._parsed_data_json = None
+        return value
+
+    # Serialization, comparison and iteration read __dict__ directly, so expand first
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        self.parsed_data
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        self.parsed_data
+        return super().model_dump_json(**kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        self.parsed_data
+        if isinstance(other, CompactSECFiling):
+            other.parsed_data
+        return super().__eq__(other)
+
+    def __iter__(self):
+        self.parsed_data
+        return super().__iter__()
+
+    def __repr_args__(self):
+        # Shown without expanding: reprs are taken in passing (logging, asyncio, debuggers)
+        yield from super().__repr_args__()
+        if not self.parsed_data_expanded:
+            yield "parsed_data", _CompactJSON(len(self._parsed_data_json or b""))
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        self.parsed_data
+        return super().__getstate__()
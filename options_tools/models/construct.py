@@ -0,0 +1,160 @@
+"""
+Trusted model construction.
+
+construct() builds response models from decoded JSON without running pydantic
+validation. It only performs the conversions the API's JSON encoding needs
+(ISO date and datetime strings, nested models, missing optional fields), so it
+must only be used on data from a trusted server.
+
+Models are assembled by writing pydantic's instance slots directly, which is
+faster than both validation and model_construct(). That layout is internal to
+pydantic, so the fast path is only taken on pydantic 2 releases that have it;
+elsewhere construct() validates instead.
+"""
+
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union, get_args, get_origin
+
+import pydantic
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+class _Plan:
+    __slots__ = ("names", "converters", "missing", "private")
+
+    def __init__(self, model: type):
+        fields = model.model_fields
+        self.names = frozenset(fields)
+        # Only fields whose JSON form differs from the model value need converting
+        self.converters = [
+            (name, convert) for name, convert in
+            ((name, _converter(field.annotation)) for name, field in fields.items())
+            if convert is not None
+        ]
+        self.missing = {
+            name: factory for name, factory in
+            ((name, _missing(field)) for name, field in fields.items())
+            if factory is not None
+        }
+        self.private = model.__private_attributes__
+
+
+_plans: Dict[type, _Plan] = {}
+
+
+def parse_date(value: Any) -> Any:
+    return date.fromisoformat(value[:10]) if isinstance(value, str) else value
+
+
+def parse_datetime(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _converter(annotation: Any) -> Converter:
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        inner = _converter(args[0]) if len(args) == 1 else None
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+    if origin in (list, List):
+        args = get_args(annotation)
+        item = args[0] if args else None
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return lambda values: construct_many(item, values)
+        inner = _converter(item) if item is not None else None
+        if inner is None:
+            return None
+        return lambda values: [inner(value) for value in values]
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return lambda value: construct(annotation, value) if isinstance(value, dict) else value
+        if issubclass(annotation, datetime):
+            return parse_datetime
+        if issubclass(annotation, date):
+            return parse_date
+    return None
+
+
+def _missing(field: Any) -> Optional[Callable[[], Any]]:
+    if not field.is_required():
+        return lambda: field.get_default(call_default_factory=True)
+    if get_origin(field.annotation) is Union and type(None) in get_args(field.annotation):
+        # Required-but-nullable fields the server left out
+        return lambda: None
+    return None
+
+
+def _slot_setters() -> Optional[tuple]:
+    if not pydantic.VERSION.startswith("2."):
+        return None
+    try:
+        return tuple(
+            BaseModel.__dict__[name].__set__
+            for name in ("__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__")
+        )
+    except (KeyError, AttributeError):
+        return None
+
+
+# Setters of pydantic's instance slots, or None where the layout differs
+_SLOT_SETTERS = _slot_setters()
+
+
+def _get_plan(model: type) -> _Plan:
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = _Plan(model)
+    return plan
+
+
+def construct(model: Type[M], data: Dict[str, Any]) -> M:
+    """Build a model from trusted JSON data without validation"""
+    return construct_many(model, [data])[0]
+
+
+def construct_many(model: Type[M], items: List[Dict[str, Any]]) -> List[M]:
+    """Build a list of models of one type, sharing the per-model setup"""
+    if _SLOT_SETTERS is None:
+        return [model.model_validate(data) if isinstance(data, dict) else data for data in items]
+    set_fields_set, set_extra, set_private = _SLOT_SETTERS
+    plan = _get_plan(model)
+    names, converters, private = plan.names, plan.converters, plan.private
+    new = model.__new__
+    set_dict = object.__setattr__
+    result = []
+    for data in items:
+        if not isinstance(data, dict):
+            result.append(data)
+            continue
+        values = dict(data)
+        fields_set = None
+        if len(values) != len(names) or not values.keys() <= names:
+            for name in list(values):
+                if name not in names:
+                    del values[name]
+            fields_set = set(values)
+            for name, factory in plan.missing.items():
+                if name not in values:
+                    values[name] = factory()
+        for name, convert in converters:
+            if name in values:
+                values[name] = convert(values[name])
+
+        # Equivalent to model_construct() without its per-field bookkeeping
+        obj = new(model)
+        set_dict(obj, "__dict__", values)
+        set_fields_set(obj, set(names) if fields_set is None else fields_set)
+        set_extra(obj, None)
+        set_private(obj, {name: attr.get_default() for name, attr in private.items()} if private else None)
+        result.append(obj)
+    return result
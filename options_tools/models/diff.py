@@ -0,0 +1,299 @@
+"""
+Change sets between two snapshots of an options chain.
+
+Contracts are matched by (expiration, strike, type) through a dictionary, so a
+diff costs one pass over each chain. Each contract's compared fields are held
+as a tuple, and unchanged contracts are skipped with a single tuple
+comparison. Two columnar chains are compared a whole column at a time with
+NumPy instead. A ChainState holds this per-snapshot work, so a poller only
+does it once per snapshot.
+"""
+
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Sequence, NamedTuple, Union
+
+from .responses import Option, OptionsChain
+from .index import normalize_type
+
+if TYPE_CHECKING:
+    from .columnar import ColumnarOptionsChain
+
+# Fields compared by default: quotes, activity and Greeks
+DIFF_FIELDS = (
+    "bid", "ask", "last", "volume", "open_interest",
+    "implied_volatility", "delta", "gamma", "theta", "vega"
+)
+
+ContractKey = Tuple[date, float, str]
+
+AnyChain = Union[OptionsChain, "ColumnarOptionsChain"]
+
+
+def contract_key(option: Option) -> ContractKey:
+    return (option.expiration, option.strike, normalize_type(option.type))
+
+
+class ChainState:
+    """
+    One chain's contracts keyed for diffing.
+
+    Args:
+        chain: OptionsChain or ColumnarOptionsChain
+        fields: Contract fields to compare
+    """
+
+    __slots__ = ("ticker", "spot_price", "timestamp", "fields", "_chain", "_rows", "_positions")
+
+    def __init__(self, chain: AnyChain, fields: Sequence[str] = DIFF_FIELDS):
+        self.ticker = chain.ticker
+        self.spot_price = chain.spot_price
+        self.timestamp = chain.timestamp
+        self.fields = tuple(fields)
+        self._chain = chain
+        # Contract key -> (compared values, option); built lazily for columnar chains
+        self._rows: Optional[Dict[ContractKey, Tuple[tuple, Option]]] = None
+        # Contract key -> row number, for columnar chains only
+        self._positions: Optional[Dict[ContractKey, int]] = None
+        # Anything but a row chain is columnar; checked this way round so that
+        # diffing row chains never loads numpy
+        if not isinstance(chain, OptionsChain):
+            keys = zip(
+                chain.expiration.astype(object).tolist(),
+                chain.strike.tolist(),
+                ["call" if is_call else "put" for is_call in chain.is_call.tolist()],
+            )
+            self._positions = {key: i for i, key in enumerate(keys)}
+        else:
+            self._rows = {
+                contract_key(option): (tuple(getattr(option, name) for name in self.fields), option)
+                for option in chain.options
+            }
+
+    @property
+    def columnar(self) -> bool:
+        return self._positions is not None
+
+    @property
+    def rows(self) -> Dict[ContractKey, Tuple[tuple, Any]]:
+        if self._rows is None:
+            chain = self._chain
+            columns = [_column_values(chain, name) for name in self.fields]
+            values = zip(*columns) if columns else iter(lambda: (), None)
+            self._rows = {key: (row, i) for (key, i), row in zip(self._positions.items(), values)}
+        return self._rows
+
+    def keys(self):
+        return self._positions.keys() if self._positions is not None else self._rows.keys()
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def option(self, key: ContractKey) -> Option:
+        if self._positions is not None:
+            return self._chain.option(self._positions[key])
+        return self._rows[key][1]
+
+
+def _column_values(chain: "ColumnarOptionsChain", name: str) -> List[Any]:
+    # One column as Python values, None where missing
+    from .columnar import INT_FIELDS
+    values = chain.columns[name].tolist()
+    if name in INT_FIELDS:
+        return [v if present else None for v, present in zip(values, chain.mask(name).tolist())]
+    return [None if v != v else v for v in values]
+
+
+class ContractChange(NamedTuple):
+    """Fields of one contract that changed, as name -> (old, new)"""
+    key: ContractKey
+    fields: Dict[str, Tuple[Any, Any]]
+
+    @property
+    def expiration(self) -> date:
+        return self.key[0]
+
+    @property
+    def strike(self) -> float:
+        return self.key[1]
+
+    @property
+    def type(self) -> str:
+        return self.key[2]
+
+
+class ChainDiff:
+    """
+    What changed between two snapshots of a chain.
+
+    Attributes:
+        added: Contracts listed in the new chain only
+        removed: Keys of contracts listed in the old chain only
+        changed: Contracts whose compared fields differ
+
+    len() is the number of contracts added, removed or changed.
+    """
+
+    __slots__ = (
+        "ticker", "previous_timestamp", "timestamp", "previous_spot_price",
+        "spot_price", "added", "removed", "changed"
+    )
+
+    def __init__(
+        self,
+        ticker: str,
+        previous_timestamp: Optional[datetime],
+        timestamp: datetime,
+        previous_spot_price: Optional[float],
+        spot_price: float,
+        added: List[Option],
+        removed: List[ContractKey],
+        changed: List[ContractChange]
+    ):
+        self.ticker = ticker
+        self.previous_timestamp = previous_timestamp
+        self.timestamp = timestamp
+        self.previous_spot_price = previous_spot_price
+        self.spot_price = spot_price
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"ChainDiff(ticker={self.ticker!r}, timestamp={self.timestamp.isoformat()}, "
+            f"added={len(self.added)}, removed={len(self.removed)}, changed={len(self.changed)})"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form; contracts are [expiration, strike, type] keys"""
+        def key(k: ContractKey) -> List[Any]:
+            return [k[0].isoformat(), k[1], k[2]]
+
+        return {
+            "ticker": self.ticker,
+            "previous_timestamp": self.previous_timestamp.isoformat() if self.previous_timestamp else None,
+            "timestamp": self.timestamp.isoformat(),
+            "spot_price": [self.previous_spot_price, self.spot_price],
+            "added": [option.model_dump(mode="json") for option in self.added],
+            "removed": [key(k) for k in self.removed],
+            "changed": [
+                {"contract": key(c.key), "fields": {name: list(values) for name, values in c.fields.items()}}
+                for c in self.changed
+            ],
+        }
+
+
+def _significant(old: Any, new: Any, tolerance: float) -> bool:
+    if old is None or new is None:
+        return True
+    return abs(new - old) > tolerance
+
+
+def diff_chains(
+    old: Union[AnyChain, ChainState, None],
+    new: Union[AnyChain, ChainState],
+    fields: Sequence[str] = DIFF_FIELDS,
+    tolerances: Optional[Dict[str, float]] = None
+) -> ChainDiff:
+    """
+    Compare two snapshots of the same chain.
+
+    Args:
+        old: Earlier chain (or its ChainState); None treats every contract as added
+        new: Later chain (or its ChainState)
+        fields: Contract fields to compare (ignored for ChainStates, which
+            carry their own)
+        tolerances: Field name -> absolute change at or below which the field
+            counts as unchanged, e.g. {"implied_volatility": 1e-4}; other
+            fields count any change
+    """
+    if not isinstance(new, ChainState):
+        new = ChainState(new, fields)
+    if old is not None and not isinstance(old, ChainState):
+        old = ChainState(old, new.fields)
+    if old is not None and old.fields != new.fields:
+        raise ValueError("Chain states compare different fields")
+
+    if old is not None and old.columnar and new.columnar:
+        added, removed, changed = _diff_columns(old, new, tolerances or {})
+    else:
+        added, removed, changed = _diff_rows(old, new, tolerances or {})
+
+    return ChainDiff(
+        new.ticker,
+        old.timestamp if old is not None else None,
+        new.timestamp,
+        old.spot_price if old is not None else None,
+        new.spot_price,
+        added,
+        removed,
+        changed
+    )
+
+
+def _diff_rows(old: Optional[ChainState], new: ChainState, tolerances: Dict[str, float]):
+    old_rows = old.rows if old is not None else {}
+    added: List[Option] = []
+    changed: List[ContractChange] = []
+    for key, (values, _) in new.rows.items():
+        previous = old_rows.get(key)
+        if previous is None:
+            added.append(new.option(key))
+            continue
+        before = previous[0]
+        if before == values:
+            continue
+        fields_changed = {}
+        for name, a, b in zip(new.fields, before, values):
+            if a != b and (name not in tolerances or _significant(a, b, tolerances[name])):
+                fields_changed[name] = (a, b)
+        if fields_changed:
+            changed.append(ContractChange(key, fields_changed))
+    removed = [key for key in old_rows if key not in new.rows]
+    return added, removed, changed
+
+
+def _diff_columns(old: ChainState, new: ChainState, tolerances: Dict[str, float]):
+    # Match rows through the key dictionaries, then compare whole columns at once
+    old_positions, new_positions = old._positions, new._positions
+    added = [new.option(key) for key in new_positions if key not in old_positions]
+    removed = [key for key in old_positions if key not in new_positions]
+    matched = [(key, old_positions[key], i) for key, i in new_positions.items() if key in old_positions]
+    if not matched:
+        return added, removed, []
+
+    import numpy as np
+    old_rows = np.fromiter((m[1] for m in matched), dtype=np.int64, count=len(matched))
+    new_rows = np.fromiter((m[2] for m in matched), dtype=np.int64, count=len(matched))
+    old_chain, new_chain = old._chain, new._chain
+    masks = {}
+    for name in new.fields:
+        a = old_chain.columns[name][old_rows]
+        b = new_chain.columns[name][new_rows]
+        a_present = old_chain.mask(name)[old_rows]
+        b_present = new_chain.mask(name)[new_rows]
+        both = a_present & b_present
+        differs = (a_present != b_present) | (both & (a != b))
+        if name in tolerances:
+            differs &= ~(both & (np.abs(b - a) <= tolerances[name]))
+        masks[name] = differs
+
+    changed: List[ContractChange] = []
+    any_change = np.logical_or.reduce(list(masks.values()))
+    for row in np.flatnonzero(any_change).tolist():
+        key, i, j = matched[row]
+        fields_changed = {}
+        for name, differs in masks.items():
+            if differs[row]:
+                fields_changed[name] = (_cell(old_chain, name, i), _cell(new_chain, name, j))
+        changed.append(ContractChange(key, fields_changed))
+    return added, removed, changed
+
+
+def _cell(chain: "ColumnarOptionsChain", name: str, i: int) -> Any:
+    if not chain.mask(name)[i]:
+        return None
+    return chain.columns[name][i].item()
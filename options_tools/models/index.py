@@ -0,0 +1,190 @@
+"""
+Sorted lookup indexes over an options chain.
+
+ChainIndex groups contracts by (expiration, type) with strikes kept sorted, so
+exact lookups are dictionary hits and nearest-strike, nearest-delta and range
+queries are binary searches instead of scans over every contract.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Optional, Dict, List, Tuple, Sequence, Union
+
+from .responses import Option
+
+
+def normalize_type(option_type: str) -> str:
+    return "call" if option_type.lower().startswith("c") else "put"
+
+
+def _nearest(keys: List[float], target: float) -> int:
+    # Position of the key closest to target in a sorted, non-empty list
+    i = bisect_left(keys, target)
+    if i == 0:
+        return 0
+    if i == len(keys):
+        return len(keys) - 1
+    return i if keys[i] - target < target - keys[i - 1] else i - 1
+
+
+class _Group:
+    __slots__ = ("strikes", "options", "deltas", "by_delta")
+
+    def __init__(self, options: List[Option]):
+        options.sort(key=lambda o: o.strike)
+        self.options = options
+        self.strikes = [o.strike for o in options]
+        with_delta = sorted((o for o in options if o.delta is not None), key=lambda o: o.delta)
+        self.by_delta = with_delta
+        self.deltas = [o.delta for o in with_delta]
+
+
+class ChainIndex:
+    """
+    Indexes built once over a list of options.
+
+    Option types are normalized so "call"/"C" and "put"/"P" are interchangeable
+    in every query.
+    """
+
+    def __init__(self, options: Sequence[Option]):
+        self._by_key: Dict[Tuple[date, float, str], Option] = {}
+        grouped: Dict[Tuple[date, str], List[Option]] = {}
+        for option in options:
+            option_type = normalize_type(option.type)
+            self._by_key[(option.expiration, option.strike, option_type)] = option
+            grouped.setdefault((option.expiration, option_type), []).append(option)
+
+        self._groups = {key: _Group(group) for key, group in grouped.items()}
+        self._paired_strikes: Dict[date, List[float]] = {}
+        self.expirations: List[date] = sorted({expiration for expiration, _ in self._groups})
+        self._ordinals = [e.toordinal() for e in self.expirations]
+
+    def _group(self, expiration: date, option_type: str) -> Optional[_Group]:
+        return self._groups.get((expiration, normalize_type(option_type)))
+
+    def get(self, expiration: date, strike: float, option_type: str) -> Optional[Option]:
+        """Exact contract lookup"""
+        return self._by_key.get((expiration, strike, normalize_type(option_type)))
+
+    def strikes(self, expiration: date, option_type: str) -> List[float]:
+        group = self._group(expiration, option_type)
+        return list(group.strikes) if group else []
+
+    def options(self, expiration: date, option_type: str) -> List[Option]:
+        """Contracts for one expiration and type, sorted by strike"""
+        group = self._group(expiration, option_type)
+        return list(group.options) if group else []
+
+    def nearest_strike(self, expiration: date, option_type: str, strike: float) -> Optional[Option]:
+        group = self._group(expiration, option_type)
+        if not group or not group.strikes:
+            return None
+        return group.options[_nearest(group.strikes, strike)]
+
+    def nearest_delta(self, expiration: date, option_type: str, delta: float) -> Optional[Option]:
+        """
+        Contract whose delta is closest to the target.
+
+        For puts a positive target is taken as a magnitude, so 0.30 and -0.30
+        both find the 30-delta put.
+        """
+        option_type = normalize_type(option_type)
+        if option_type == "put" and delta > 0:
+            delta = -delta
+        group = self._group(expiration, option_type)
+        if not group or not group.deltas:
+            return None
+        return group.by_delta[_nearest(group.deltas, delta)]
+
+    def nearest_expiration(
+        self,
+        target: Union[date, int],
+        reference: Optional[date] = None
+    ) -> Optional[date]:
+        """
+        Listed expiration closest to a date, or to a number of days after reference.
+
+        Ties resolve to the earlier expiration.
+        """
+        if not self.expirations:
+            return None
+        if isinstance(target, int):
+            target = (reference or date.today()) + timedelta(days=target)
+        ordinals, day = self._ordinals, target.toordinal()
+        i = bisect_left(ordinals, day)
+        if i == len(ordinals) or (i > 0 and day - ordinals[i - 1] <= ordinals[i] - day):
+            i -= 1
+        return self.expirations[i]
+
+    def expirations_between(self, start: Optional[date] = None, end: Optional[date] = None) -> List[date]:
+        """Listed expirations in [start, end]"""
+        lo = bisect_left(self.expirations, start) if start else 0
+        hi = bisect_right(self.expirations, end) if end else len(self.expirations)
+        return self.expirations[lo:hi]
+
+    def between(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        option_type: Optional[str] = None
+    ) -> List[Option]:
+        """Contracts expiring in [start, end], ordered by expiration then strike"""
+        types = [normalize_type(option_type)] if option_type else ["call", "put"]
+        result = []
+        for expiration in self.expirations_between(start, end):
+            for t in types:
+                group = self._groups.get((expiration, t))
+                if group:
+                    result.extend(group.options)
+        return result
+
+    def strike_window(
+        self,
+        spot: float,
+        count: Optional[int] = None,
+        width: Optional[float] = None,
+        expiration: Optional[date] = None,
+        option_type: Optional[str] = None
+    ) -> List[Option]:
+        """
+        Contracts with strikes around spot.
+
+        Args:
+            spot: Price to centre the window on
+            count: Number of strikes to keep on each side of spot
+            width: Keep strikes within spot +/- width (used when count is not given)
+            expiration: Restrict to one expiration (defaults to all)
+            option_type: Restrict to calls or puts (defaults to both)
+        """
+        expirations = [expiration] if expiration else self.expirations
+        types = [normalize_type(option_type)] if option_type else ["call", "put"]
+        result = []
+        for e in expirations:
+            for t in types:
+                group = self._groups.get((e, t))
+                if not group:
+                    continue
+                if count is not None:
+                    mid = bisect_left(group.strikes, spot)
+                    lo, hi = max(0, mid - count), mid + count
+                elif width is not None:
+                    lo = bisect_left(group.strikes, spot - width)
+                    hi = bisect_right(group.strikes, spot + width)
+                else:
+                    lo, hi = 0, len(group.strikes)
+                result.extend(group.options[lo:hi])
+        return result
+
+    def atm_straddle(self, expiration: date, spot: float) -> Optional[Tuple[Option, Option]]:
+        """Call and put at the listed strike closest to spot that has both legs"""
+        common = self._paired_strikes.get(expiration)
+        if common is None:
+            calls = self._groups.get((expiration, "call"))
+            puts = self._groups.get((expiration, "put"))
+            common = sorted(set(calls.strikes).intersection(puts.strikes)) if calls and puts else []
+            self._paired_strikes[expiration] = common
+        if not common:
+            return None
+        strike = common[_nearest(common, spot)]
+        return self._by_key[(expiration, strike, "call")], self._by_key[(expiration, strike, "put")]
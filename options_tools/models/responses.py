@@ -1,7 +1,10 @@
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, PrivateAttr
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime, date
 
+if TYPE_CHECKING:
+    from .index import ChainIndex
+
 class Option(BaseModel):
     strike: float
     expiration: date
@@ -23,6 +26,31 @@ class OptionsChain(BaseModel):
     timestamp: datetime
     options: List[Option]
 
+    _index: Optional["ChainIndex"] = PrivateAttr(default=None)
+
+    @property
+    def index(self) -> "ChainIndex":
+        """Lookup indexes over options, built on first access (call reindex() after mutating options)"""
+        if self._index is None:
+            from .index import ChainIndex
+            self._index = ChainIndex(self.options)
+        return self._index
+
+    def reindex(self):
+        self._index = None
+
+    def strike_window(
+        self,
+        count: Optional[int] = None,
+        width: Optional[float] = None,
+        expiration: Optional[date] = None,
+        option_type: Optional[str] = None
+    ) -> List[Option]:
+        return self.index.strike_window(self.spot_price, count, width, expiration, option_type)
+
+    def atm_straddle(self, expiration: date) -> Optional[Tuple[Option, Option]]:
+        return self.index.atm_straddle(expiration, self.spot_price)
+
 class FlowOrder(BaseModel):
     timestamp: datetime
     ticker: str
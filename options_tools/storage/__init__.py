@@ -0,0 +1,23 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sec_filings import SECFilingStore
+    from .chain_snapshots import ChainSnapshotStore
+
+# Resolved on first access: ChainSnapshotStore loads numpy
+_LAZY_IMPORTS = {
+    "SECFilingStore": ".sec_filings",
+    "ChainSnapshotStore": ".chain_snapshots",
+}
+
+__all__ = ["SECFilingStore", "ChainSnapshotStore"]
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,249 @@
+"""
+Historical options chain snapshots in memory-mapped columnar files.
+
+Each chain is appended to a partition directory per ticker and UTC date:
+
+    <root>/<TICKER>/<YYYY-MM-DD>/
+        snapshots.bin        one fixed-size record per snapshot
+        strike.bin, ...      one flat little-endian array per column
+        volume.mask.bin, ... presence masks for the integer columns
+
+A snapshot's rows are the slice [offset, offset + count) of every column file.
+Reads memory-map only the requested column files, so a range query touches
+just the pages it returns and every snapshot is a zero-copy view.
+
+Requires numpy (pip install options-tools[numpy]).
+"""
+
+import os
+import threading
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional, Dict, List, Iterator, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from ..models.columnar import ColumnarOptionsChain, COLUMNS, FLOAT_FIELDS, INT_FIELDS, _require_numpy
+from ..models.responses import OptionsChain
+
+COLUMN_DTYPES: Dict[str, str] = {
+    "strike": "<f8",
+    "expiration": "<M8[D]",
+    "is_call": "|b1",
+    **{name: "<f8" for name in FLOAT_FIELDS},
+    **{name: "<i8" for name in INT_FIELDS},
+}
+
+INDEX_DTYPE = [("timestamp", "<i8"), ("spot_price", "<f8"), ("offset", "<i8"), ("count", "<i8")]
+
+INDEX_FILE = "snapshots.bin"
+
+
+def _utc_naive(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _to_ns(value: datetime) -> int:
+    return int(np.datetime64(_utc_naive(value), "ns").astype(np.int64))
+
+
+def _from_ns(value: int) -> datetime:
+    seconds, nanos = divmod(int(value), 1_000_000_000)
+    return datetime.fromtimestamp(seconds, timezone.utc) + timedelta(microseconds=nanos // 1000)
+
+
+def _range_bound(value: Union[datetime, date], end: bool) -> datetime:
+    if isinstance(value, datetime):
+        return _utc_naive(value)
+    return datetime.combine(value, time.max if end else time.min)
+
+
+class _Partition:
+    """One ticker/date directory"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def index(self):
+        path = self.file(INDEX_FILE)
+        if not os.path.exists(path):
+            return np.zeros(0, dtype=INDEX_DTYPE)
+        # Ignore a trailing partial record from an interrupted append
+        count = os.path.getsize(path) // np.dtype(INDEX_DTYPE).itemsize
+        return np.fromfile(path, dtype=INDEX_DTYPE, count=count)
+
+    def column(self, name: str, rows: int, dtype: str):
+        if rows == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self.file(f"{name}.bin"), dtype=dtype, mode="r", shape=(rows,))
+
+
+class ChainSnapshotStore:
+    """
+    Append-only store of options chain snapshots.
+
+    Timestamps are stored in UTC; naive datetimes passed in are taken to be
+    UTC. Appends to one partition are serialized across threads, and across
+    processes where fcntl is available.
+
+    Args:
+        root: Directory holding the partitions, created if missing
+
+    Example:
+        >>> store = ChainSnapshotStore("~/chains")
+        >>> store.append(chain)
+        >>> for snapshot in store.load("SPY", datetime(2025, 1, 15, 14, 30), datetime(2025, 1, 15, 15, 0),
+        ...                            columns=["strike", "bid", "ask"]):
+        ...     print(snapshot.timestamp, snapshot.bid.mean())
+    """
+
+    def __init__(self, root: str):
+        _require_numpy()
+        self.root = os.path.expanduser(root)
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _partition(self, ticker: str, day: date) -> _Partition:
+        return _Partition(os.path.join(self.root, ticker.upper(), day.isoformat()))
+
+    def tickers(self) -> List[str]:
+        return sorted(
+            name for name in os.listdir(self.root)
+            if os.path.isdir(os.path.join(self.root, name))
+        )
+
+    def dates(self, ticker: str) -> List[date]:
+        path = os.path.join(self.root, ticker.upper())
+        if not os.path.isdir(path):
+            return []
+        return sorted(date.fromisoformat(name) for name in os.listdir(path))
+
+    def append(self, chain: Union[OptionsChain, ColumnarOptionsChain], timestamp: Optional[datetime] = None) -> bool:
+        """
+        Store a chain snapshot.
+
+        Returns:
+            False if the partition's latest snapshot already has this timestamp
+            (e.g. the same cached chain appended twice), else True
+        """
+        if isinstance(chain, OptionsChain):
+            chain = ColumnarOptionsChain.from_chain(chain)
+        stamp = _utc_naive(timestamp or chain.timestamp)
+        partition = self._partition(chain.ticker, stamp.date())
+        os.makedirs(partition.path, exist_ok=True)
+
+        with self._lock, open(partition.file(".lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            index = partition.index()
+            ns = _to_ns(stamp)
+            if len(index) and index["timestamp"][-1] == ns:
+                return False
+            offset = int(index["offset"][-1] + index["count"][-1]) if len(index) else 0
+            rows = len(chain)
+
+            arrays = {name: chain.columns[name] for name in COLUMNS}
+            arrays.update((f"{name}.mask", chain.mask(name)) for name in INT_FIELDS)
+            for name, values in arrays.items():
+                dtype = COLUMN_DTYPES.get(name, "|b1")
+                with open(partition.file(f"{name}.bin"), "a+b") as f:
+                    # Drop rows left behind by an append that never reached the index
+                    f.truncate(offset * np.dtype(dtype).itemsize)
+                    f.write(np.ascontiguousarray(values, dtype=dtype).tobytes())
+
+            # The index record is written last, making the snapshot visible to readers
+            record = np.array([(ns, float(chain.spot_price), offset, rows)], dtype=INDEX_DTYPE)
+            with open(partition.file(INDEX_FILE), "a+b") as f:
+                f.truncate(len(index) * record.itemsize)
+                f.write(record.tobytes())
+        return True
+
+    def timestamps(
+        self,
+        ticker: str,
+        start: Union[datetime, date],
+        end: Union[datetime, date]
+    ) -> List[datetime]:
+        """Snapshot times for ticker between start and end (inclusive)"""
+        return [_from_ns(ns) for _, selected, _ in self._select(ticker, start, end) for ns in selected["timestamp"]]
+
+    def _select(self, ticker: str, start: Union[datetime, date], end: Union[datetime, date]):
+        start, end = _range_bound(start, False), _range_bound(end, True)
+        start_ns, end_ns = _to_ns(start), _to_ns(end)
+        day = start.date()
+        while day <= end.date():
+            partition = self._partition(ticker, day)
+            day += timedelta(days=1)
+            if not os.path.isdir(partition.path):
+                continue
+            index = partition.index()
+            selected = index[(index["timestamp"] >= start_ns) & (index["timestamp"] <= end_ns)]
+            if len(selected):
+                yield partition, np.sort(selected, order="timestamp"), index
+
+    def iter_snapshots(
+        self,
+        ticker: str,
+        start: Union[datetime, date],
+        end: Union[datetime, date],
+        columns: Optional[Sequence[str]] = None
+    ) -> Iterator[ColumnarOptionsChain]:
+        """
+        Yield snapshots between start and end (inclusive) in time order.
+
+        Args:
+            ticker: Stock symbol
+            start: First time (or date) to include
+            end: Last time (or date) to include
+            columns: Columns to load (default: all). strike is always loaded.
+        """
+        names = list(COLUMNS) if columns is None else ["strike"] + [c for c in columns if c != "strike"]
+        unknown = [name for name in names if name not in COLUMN_DTYPES]
+        if unknown:
+            raise ValueError(f"Unknown chain columns: {', '.join(unknown)}")
+
+        for partition, selected, index in self._select(ticker, start, end):
+            rows = int(index["offset"][-1] + index["count"][-1])
+            mapped = {name: partition.column(name, rows, COLUMN_DTYPES[name]) for name in names}
+            masks = {
+                name: partition.column(f"{name}.mask", rows, "|b1") for name in INT_FIELDS if name in mapped
+            }
+            for ns, spot_price, offset, count in selected.tolist():
+                window = slice(offset, offset + count)
+                yield ColumnarOptionsChain(
+                    ticker.upper(),
+                    spot_price,
+                    _from_ns(ns),
+                    {name: column[window] for name, column in mapped.items()},
+                    {name: mask[window] for name, mask in masks.items()}
+                )
+
+    def load(
+        self,
+        ticker: str,
+        start: Union[datetime, date],
+        end: Union[datetime, date],
+        columns: Optional[Sequence[str]] = None
+    ) -> List[ColumnarOptionsChain]:
+        """Snapshots between start and end (inclusive); see iter_snapshots"""
+        return list(self.iter_snapshots(ticker, start, end, columns))
+
+    def latest(self, ticker: str, columns: Optional[Sequence[str]] = None) -> Optional[ColumnarOptionsChain]:
+        """Most recent stored snapshot for ticker"""
+        for day in reversed(self.dates(ticker)):
+            snapshots = self.load(ticker, day, day, columns)
+            if snapshots:
+                return snapshots[-1]
+        return None
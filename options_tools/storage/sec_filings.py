@@ -0,0 +1,166 @@
+"""
+Persistent SQLite store for SEC filings.
+
+Filings never change once published, so they are kept by accession number and
+only filings newer than what is already stored need to be fetched. The
+database runs in WAL mode so several worker processes can share one file.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import date
+from typing import Optional, Dict, Any, List, Iterable, Set, Union
+
+from ..models.responses import SECFiling
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS filings (
+    accession_number TEXT PRIMARY KEY,
+    ticker TEXT NOT NULL,
+    filing_type TEXT NOT NULL,
+    filing_date TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_filings_ticker_date
+    ON filings (ticker, filing_type, filing_date);
+CREATE TABLE IF NOT EXISTS coverage (
+    ticker TEXT NOT NULL,
+    filing_type TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    PRIMARY KEY (ticker, filing_type)
+);
+"""
+
+# Coverage key used when filings of every type were requested
+ALL_TYPES = "*"
+
+
+class SECFilingStore:
+    """
+    On-disk store of SEC filings keyed by accession number.
+
+    Args:
+        path: SQLite database file, created if missing
+        timeout: Seconds to wait on a lock held by another process
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self.path = os.path.expanduser(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections can't cross threads or forks, so keep one per thread and pid
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @staticmethod
+    def _type_filter(filing_type: Optional[str]):
+        if filing_type:
+            return " AND filing_type = ?", (filing_type,)
+        return "", ()
+
+    def latest_filing_date(self, ticker: str, filing_type: Optional[str] = None) -> Optional[date]:
+        clause, args = self._type_filter(filing_type)
+        row = self._connect().execute(
+            f"SELECT MAX(filing_date) FROM filings WHERE ticker = ?{clause}",
+            (ticker.upper(),) + args
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row and row[0] else None
+
+    def known_accessions(self, ticker: str) -> Set[str]:
+        rows = self._connect().execute(
+            "SELECT accession_number FROM filings WHERE ticker = ?", (ticker.upper(),)
+        )
+        return {row[0] for row in rows}
+
+    def coverage(self, ticker: str, filing_type: Optional[str] = None) -> int:
+        """Deepest history (number of filings) fetched in full for this ticker and type"""
+        row = self._connect().execute(
+            "SELECT depth FROM coverage WHERE ticker = ? AND filing_type = ?",
+            (ticker.upper(), filing_type or ALL_TYPES)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def mark_coverage(self, ticker: str, filing_type: Optional[str], depth: int):
+        self._connect().execute(
+            "INSERT INTO coverage (ticker, filing_type, depth) VALUES (?, ?, ?) "
+            "ON CONFLICT (ticker, filing_type) DO UPDATE SET depth = MAX(depth, excluded.depth)",
+            (ticker.upper(), filing_type or ALL_TYPES, depth)
+        )
+
+    def add(self, filings: Iterable[Union[SECFiling, Dict[str, Any]]]) -> int:
+        """Store filings, ignoring accession numbers already present; returns rows inserted"""
+        rows = []
+        for filing in filings:
+            if isinstance(filing, SECFiling):
+                filing = filing.model_dump(mode="json")
+            rows.append((
+                filing["accession_number"],
+                str(filing["ticker"]).upper(),
+                filing["filing_type"],
+                str(filing["filing_date"]),
+                json.dumps(filing, separators=(",", ":"), default=str)
+            ))
+        if not rows:
+            return 0
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO filings "
+                "(accession_number, ticker, filing_type, filing_date, data) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            inserted = conn.total_changes - before
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return inserted
+
+    @staticmethod
+    def _load(data: str) -> SECFiling:
+        # Rows were validated before they were stored, so skip re-validation
+        fields = json.loads(data)
+        fields["filing_date"] = date.fromisoformat(fields["filing_date"])
+        return SECFiling.model_construct(**fields)
+
+    def get(self, accession_number: str) -> Optional[SECFiling]:
+        row = self._connect().execute(
+            "SELECT data FROM filings WHERE accession_number = ?", (accession_number,)
+        ).fetchone()
+        return self._load(row[0]) if row else None
+
+    def list(
+        self,
+        ticker: str,
+        filing_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[SECFiling]:
+        """Stored filings for a ticker, newest first"""
+        clause, args = self._type_filter(filing_type)
+        query = f"SELECT data FROM filings WHERE ticker = ?{clause} ORDER BY filing_date DESC, accession_number DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        rows = self._connect().execute(query, (ticker.upper(),) + args)
+        return [self._load(row[0]) for row in rows]
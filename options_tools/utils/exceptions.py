@@ -1,3 +1,5 @@
+from typing import Optional
+
 class OptionsToolsError(Exception):
     """Base exception for Options.tools API errors"""
     pass
@@ -8,7 +10,9 @@ class AuthenticationError(OptionsToolsError):
 
 class RateLimitError(OptionsToolsError):
     """Raised when rate limit is exceeded"""
-    pass
+    def __init__(self, message: str = "Rate limit exceeded", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 class ValidationError(OptionsToolsError):
     """Raised when request validation fails"""
@@ -24,4 +28,14 @@ class ServerError(OptionsToolsError):
 
 class NetworkError(OptionsToolsError):
     """Raised when network request fails"""
-    pass
\ No newline at end of file
+    pass
+
+class ReplayMissError(OptionsToolsError):
+    """Raised when a replayed request has no recorded response"""
+    pass
+
+class CircuitOpenError(OptionsToolsError):
+    """Raised when an endpoint's circuit breaker is open"""
+    def __init__(self, message: str = "Circuit open", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
\ No newline at end of file
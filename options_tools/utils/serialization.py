@@ -0,0 +1,25 @@
+"""
+JSON encoding shared by the client and the models.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def json_loads(content: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, separators=(",", ":"), default=str).encode()
@@ -33,7 +33,13 @@ setup(
         "python-dateutil>=2.8.2",
     ],
     extras_require={
-        "mcp": ["anthropic-mcp>=0.1.0"],
+        "mcp": ["mcp>=1.2,<2"],
+        "numpy": ["numpy>=1.21"],
+        "fast": ["orjson>=3.9"],
+        "compression": ["httpx[brotli,zstd]>=0.27.0"],
+        "http2": ["httpx[http2]>=0.26.0"],
+        "msgpack": ["msgpack>=1.0.0"],
+        "arrow": ["pyarrow>=14.0.0", "numpy>=1.21"],
         "dev": [
             "pytest>=7.4.0",
             "pytest-asyncio>=0.23.0",
@@ -41,6 +47,11 @@ setup(
             "mypy>=1.8.0",
         ]
     },
+    entry_points={
+        "console_scripts": [
+            "options-tools-mcp=options_tools.mcp.server:main",
+        ],
+    },
     keywords="options trading finance api stocks derivatives sec filings market-data",
     project_urls={
         "Documentation": "https://docs.options.tools",
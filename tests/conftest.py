@@ -0,0 +1,34 @@
+import httpx
+import pytest
+
+from options_tools import OptionsToolsClient
+
+
+@pytest.fixture
+def make_client():
+    """Build a client whose requests are answered by handler(request) -> httpx.Response"""
+    def factory(handler, **kwargs):
+        kwargs.setdefault("cache", False)
+        return OptionsToolsClient("test-key", transport=httpx.MockTransport(handler), **kwargs)
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    # Retries are exercised for their outcome, not their timing
+    monkeypatch.setattr("options_tools.client.client.backoff_delay", lambda attempt: 0.0)
+
+
+def envelope(data, status=200, **kwargs):
+    return httpx.Response(status, json={"status": "success", "data": data}, **kwargs)
+
+
+def contract(strike, option_type, **overrides):
+    """One option contract as the API returns it"""
+    data = {
+        "strike": strike, "expiration": "2025-01-17", "type": option_type,
+        "bid": 1.0, "ask": 1.2, "last": 1.1, "volume": 10, "open_interest": 100,
+        "implied_volatility": 0.3, "delta": 0.5, "gamma": 0.01, "theta": -0.02, "vega": 0.1,
+    }
+    data.update(overrides)
+    return data
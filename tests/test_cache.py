@@ -0,0 +1,94 @@
+import asyncio
+
+from options_tools import ResponseCache
+from options_tools.client import cache as cache_module
+from options_tools.client.cache import MISSING
+
+from conftest import envelope
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def fake_clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+def test_entries_expire_per_endpoint(monkeypatch):
+    clock = fake_clock(monkeypatch)
+    cache = ResponseCache(ttls={"/options/chain": 5, "/sec/filings": 60})
+    chain = cache.make_key("GET", "/options/chain/SPY", {"ticker": "SPY"})
+    filings = cache.make_key("GET", "/sec/filings/SPY")
+    cache.set(chain, "chain")
+    cache.set(filings, "filings")
+    clock.now += 10
+    assert cache.get(chain) is MISSING
+    assert cache.get(filings) == "filings"
+
+
+def test_params_normalized_into_key():
+    assert ResponseCache.make_key("get", "/x", {"b": 1, "a": True}) == ResponseCache.make_key("GET", "/x", {"a": "true", "b": "1"})
+
+
+def test_lru_eviction():
+    cache = ResponseCache(maxsize=2)
+    keys = [cache.make_key("GET", f"/options/chain/{t}") for t in ("A", "B", "C")]
+    cache.set(keys[0], 0)
+    cache.set(keys[1], 1)
+    cache.get(keys[0])
+    cache.set(keys[2], 2)
+    assert cache.get(keys[1]) is MISSING
+    assert cache.get(keys[0]) == 0
+    assert cache.evictions == 1
+
+
+def test_zero_ttl_not_cached():
+    cache = ResponseCache(ttls={"/options/flow": 0})
+    key = cache.make_key("GET", "/options/flow/SPY")
+    cache.set(key, "flow")
+    assert len(cache) == 0
+
+
+def test_stale_entries_kept_for_stale_ttl(monkeypatch):
+    clock = fake_clock(monkeypatch)
+    cache = ResponseCache(stale_ttl=30)
+    key = cache.make_key("GET", "/options/chain/SPY")
+    cache.set(key, "chain")
+    clock.now += 10
+    assert cache.get(key) is MISSING
+    assert cache.get_stale(key) == "chain"
+    clock.now += 30
+    assert cache.get_stale(key) is MISSING
+
+
+def test_invalidate_by_prefix():
+    cache = ResponseCache()
+    for ticker in ("SPY", "QQQ"):
+        cache.set(cache.make_key("GET", f"/options/chain/{ticker}"), ticker)
+    assert cache.invalidate("/options/chain/SPY") == 1
+    assert len(cache) == 1
+
+
+def test_client_serves_repeat_from_cache(make_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return envelope({"remaining": 10})
+
+    async def main():
+        async with make_client(handler, cache=True) as client:
+            first = await client.get_api_usage()
+            second = await client.get_api_usage()
+            fresh = await client.get_api_usage(use_cache=False)
+            return first, second, fresh
+
+    assert asyncio.run(main()) == ({"remaining": 10},) * 3
+    assert len(requests) == 2
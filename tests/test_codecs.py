@@ -0,0 +1,80 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from options_tools.client import codecs
+from options_tools.client.codecs import accept_encoding, accept_header, decode_body
+
+from conftest import envelope
+
+
+def test_accept_encoding_follows_httpx_decoders(monkeypatch):
+    monkeypatch.setattr("httpx._decoders.SUPPORTED_DECODERS", {"identity": None, "gzip": None, "deflate": None})
+    assert accept_encoding() == "gzip, deflate"
+    monkeypatch.setattr(
+        "httpx._decoders.SUPPORTED_DECODERS",
+        {"identity": None, "gzip": None, "deflate": None, "br": None, "zstd": None}
+    )
+    assert accept_encoding() == "gzip, deflate, br, zstd"
+
+
+def test_advertised_encodings_are_decodable(make_client):
+    payload = {"status": "healthy"}
+
+    def handler(request):
+        encodings = [e.strip() for e in request.headers["Accept-Encoding"].split(",")]
+        for name in encodings:
+            assert name in httpx._decoders.SUPPORTED_DECODERS
+        body = gzip.compress(json.dumps({"data": payload}).encode())
+        return httpx.Response(200, content=body, headers={"Content-Encoding": "gzip"})
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.get_api_usage(use_cache=False)
+
+    assert asyncio.run(main()) == payload
+
+
+def test_accept_header_json_by_default():
+    assert accept_header("json") == "application/json"
+    assert accept_header("json", columnar=True) == "application/json"
+
+
+def test_accept_header_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        accept_header("xml")
+
+
+@pytest.mark.skipif(codecs._msgpack() is None, reason="msgpack not installed")
+def test_msgpack_negotiated_and_decoded(make_client):
+    import msgpack
+
+    def handler(request):
+        assert request.headers["Accept"].startswith("application/msgpack")
+        body = msgpack.packb({"status": "success", "data": {"status": "healthy"}})
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/msgpack"})
+
+    async def main():
+        async with make_client(handler, response_format="msgpack") as client:
+            return await client.get_api_usage(use_cache=False)
+
+    assert asyncio.run(main()) == {"status": "healthy"}
+
+
+def test_json_served_when_binary_format_ignored(make_client):
+    def handler(request):
+        return envelope({"status": "healthy"})
+
+    async def main():
+        async with make_client(handler, response_format="msgpack") as client:
+            return await client.get_api_usage(use_cache=False)
+
+    assert asyncio.run(main()) == {"status": "healthy"}
+
+
+def test_decode_body_by_content_type():
+    assert decode_body(b'{"a": 1}', "application/json; charset=utf-8") == {"a": 1}
+    assert decode_body(b'{"a": 1}', None) == {"a": 1}
@@ -0,0 +1,77 @@
+import asyncio
+
+import httpx
+
+from conftest import contract, envelope
+
+
+CHAIN = {
+    "ticker": "SPY",
+    "spot_price": 470.5,
+    "timestamp": "2025-01-15T15:30:00Z",
+    "options": [contract(470.0, "call", bid=1.0), contract(470.0, "put", bid=1.0), contract(475.0, "call", bid=0.5)],
+}
+
+
+def poll(client, times, **kwargs):
+    async def main():
+        async with client:
+            return [await client.get_options_chain("SPY", use_cache=False, **kwargs) for _ in range(times)]
+    return asyncio.run(main())
+
+
+def test_not_modified_served_from_store(make_client):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return envelope(CHAIN, headers={"ETag": '"v1"'})
+
+    client = make_client(handler, conditional_requests=True)
+    first, second = poll(client, 2)
+    assert seen == [None, '"v1"']
+    assert second == first
+    assert client.validators.not_modified == 1
+
+
+def test_delta_merged_into_stored_chain(make_client):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("A-IM"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            delta = {
+                "timestamp": "2025-01-15T15:31:00Z",
+                "changed": [{"strike": 470.0, "expiration": "2025-01-17", "type": "call", "bid": 1.5}],
+                "removed": [{"strike": 475.0, "expiration": "2025-01-17", "type": "call"}],
+            }
+            return envelope(delta, status=226, headers={"ETag": '"v2"', "IM": "options-delta"})
+        return envelope(CHAIN, headers={"ETag": '"v1"'})
+
+    first, second = poll(make_client(handler, conditional_requests=True), 2, delta=True)
+    assert seen == [None, "options-delta"]
+    assert len(second.options) == 2
+    call = next(o for o in second.options if o.type == "call")
+    assert call.bid == 1.5 and call.ask == 1.2
+    assert second.timestamp.minute == 31
+    # The first chain handed out is left untouched
+    assert len(first.options) == 3
+
+
+def test_304_after_eviction_refetches(make_client):
+    seen = []
+    clients = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match"):
+            clients[0].validators.clear()  # evicted while the request was in flight
+            return httpx.Response(304)
+        return envelope(CHAIN, headers={"ETag": '"v1"'})
+
+    clients.append(make_client(handler, conditional_requests=True))
+    first, second = poll(clients[0], 2)
+    assert seen == [None, '"v1"', None]
+    assert second == first
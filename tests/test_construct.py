@@ -0,0 +1,78 @@
+import asyncio
+
+from options_tools.models import AnalysisResult, OptionsChain, OptionsFlow, CompactSECFiling
+from options_tools.models.construct import construct
+
+from conftest import contract, envelope
+
+
+CHAIN = {
+    "ticker": "SPY",
+    "spot_price": 470.5,
+    "timestamp": "2025-01-15T15:30:00Z",
+    "options": [contract(470.0, "call"), contract(470.0, "put", bid=None, volume=None)],
+}
+
+
+def test_chain_matches_validation():
+    built = construct(OptionsChain, CHAIN)
+    assert built == OptionsChain.model_validate(CHAIN)
+    assert built.model_fields_set == set(CHAIN)
+    assert built.options[0].model_fields_set == set(CHAIN["options"][0])
+
+
+def test_nested_models_and_dates():
+    flow = {
+        "ticker": "SPY", "timeframe": "1d", "total_premium": 1e6, "bullish_premium": 6e5,
+        "bearish_premium": 4e5, "unusual_count": 1,
+        "orders": [{
+            "timestamp": "2025-01-15T15:30:00+00:00", "ticker": "SPY", "strike": 470.0,
+            "expiration": "2025-01-17", "type": "call", "size": 100, "premium": 1e6,
+            "is_sweep": True, "is_unusual": True, "sentiment": "bullish",
+        }],
+    }
+    assert construct(OptionsFlow, flow) == OptionsFlow.model_validate(flow)
+
+
+def test_missing_nullable_and_extra_fields():
+    data = {
+        "ticker": "SPY", "timestamp": "2025-01-15T15:30:00Z", "signals": [],
+        "recommended_action": "hold", "risk_score": 40.0, "expected_return": 0.05,
+        "served_by": "edge-1",
+    }
+    built = construct(AnalysisResult, data)
+    assert built.stop_loss is None and built.take_profit is None
+    assert "served_by" not in built.model_dump()
+    assert built.model_fields_set == set(data) - {"served_by"}
+
+
+def test_private_attributes_initialised():
+    built = construct(OptionsChain, CHAIN)
+    assert built.strike_window(count=1)[0].strike == 470.0
+    filing = construct(CompactSECFiling, {
+        "ticker": "AAPL", "filing_type": "10-K", "filing_date": "2025-01-15",
+        "accession_number": "1", "url": "u", "parsed_data": {"a": 1},
+    })
+    assert filing.parsed_data_expanded and filing.parsed_data == {"a": 1}
+
+
+def test_trusted_client_builds_same_models(make_client):
+    def handler(request):
+        return envelope(CHAIN)
+
+    async def fetch(trust_server):
+        async with make_client(handler, trust_server=trust_server) as client:
+            return await client.get_options_chain("SPY")
+
+    assert asyncio.run(fetch(True)) == asyncio.run(fetch(False))
+
+
+def test_fields_set_not_shared():
+    first, second = construct(OptionsChain, CHAIN).options
+    assert first.model_fields_set is not second.model_fields_set
+
+
+def test_falls_back_to_validation(monkeypatch):
+    monkeypatch.setattr("options_tools.models.construct._SLOT_SETTERS", None)
+    built = construct(OptionsChain, CHAIN)
+    assert built == OptionsChain.model_validate(CHAIN)
@@ -0,0 +1,78 @@
+from datetime import date
+
+import pytest
+
+from options_tools import diff_chains
+from options_tools.models import OptionsChain
+from options_tools.models.diff import ChainState
+
+from conftest import contract
+
+
+def chain(options, timestamp="2025-01-15T15:30:00Z"):
+    return OptionsChain.model_validate(
+        {"ticker": "SPY", "spot_price": 470.5, "timestamp": timestamp, "options": options}
+    )
+
+
+OLD = chain([contract(470, "call"), contract(470, "put"), contract(475, "call")])
+NEW = chain(
+    [
+        contract(470, "call", bid=1.1, volume=12),
+        contract(470, "put"),
+        contract(480, "call"),
+    ],
+    timestamp="2025-01-15T15:31:00Z",
+)
+
+
+def test_added_removed_changed():
+    diff = diff_chains(OLD, NEW)
+    assert [(o.strike, o.type) for o in diff.added] == [(480, "call")]
+    assert diff.removed == [(date(2025, 1, 17), 475, "call")]
+    assert len(diff.changed) == 1
+    change = diff.changed[0]
+    assert (change.strike, change.type) == (470, "call")
+    assert change.fields == {"bid": (1.0, 1.1), "volume": (10, 12)}
+    assert len(diff) == 3
+
+
+def test_identical_chains_empty():
+    assert not diff_chains(OLD, OLD)
+
+
+def test_initial_snapshot_all_added():
+    diff = diff_chains(None, OLD)
+    assert len(diff.added) == 3 and diff.previous_timestamp is None
+
+
+def test_tolerances():
+    diff = diff_chains(OLD, NEW, tolerances={"bid": 0.2})
+    assert diff.changed[0].fields == {"volume": (10, 12)}
+
+
+def test_missing_values_count_as_changes():
+    diff = diff_chains(OLD, chain([contract(470, "call", bid=None)]), tolerances={"bid": 10})
+    assert diff.changed[0].fields == {"bid": (1.0, None)}
+
+
+def test_states_must_compare_same_fields():
+    with pytest.raises(ValueError):
+        diff_chains(ChainState(OLD, ("bid",)), ChainState(NEW, ("ask",)))
+
+
+def test_to_dict():
+    data = diff_chains(OLD, NEW).to_dict()
+    assert data["removed"] == [["2025-01-17", 475, "call"]]
+    assert data["changed"][0]["fields"]["bid"] == [1.0, 1.1]
+
+
+def test_columnar_matches_rows():
+    pytest.importorskip("numpy")
+    from options_tools.models.columnar import ColumnarOptionsChain
+
+    rows = diff_chains(OLD, NEW)
+    columns = diff_chains(ColumnarOptionsChain.from_chain(OLD), ColumnarOptionsChain.from_chain(NEW))
+    assert [o.strike for o in columns.added] == [o.strike for o in rows.added]
+    assert columns.removed == rows.removed
+    assert [(c.key, c.fields) for c in columns.changed] == [(c.key, c.fields) for c in rows.changed]
@@ -0,0 +1,13 @@
+import subprocess
+import sys
+
+
+def test_client_import_skips_optional_extras():
+    # numpy, pyarrow and msgpack are only needed by columnar chains, snapshots
+    # and binary formats, so a plain client import must not pay for them
+    code = (
+        "import sys, options_tools.client.client, options_tools.models, options_tools.storage; "
+        "print(sorted(m for m in ('numpy', 'pyarrow', 'msgpack') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,89 @@
+import asyncio
+
+from conftest import envelope
+
+
+def filings(start, count):
+    return [
+        {
+            "ticker": "AAPL",
+            "filing_type": "10-K",
+            "filing_date": "2025-01-15",
+            "accession_number": f"0000320193-25-{i:06d}",
+            "url": f"https://www.sec.gov/{i}",
+            "parsed_data": {"item": i},
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def collect(client, **kwargs):
+    async def main():
+        async with client:
+            return [filing async for filing in client.iter_sec_filings("AAPL", **kwargs)]
+    # A paging loop that never ends fails the test instead of hanging it
+    return asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+
+def test_pages_until_short_page(make_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        return envelope(filings(offset, max(0, min(limit, 25 - offset))))
+
+    result = collect(make_client(handler), page_size=10)
+    assert [f.parsed_data["item"] for f in result] == list(range(25))
+    assert len(requests) == 3
+
+
+def test_stops_when_server_ignores_offset(make_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return envelope(filings(0, int(request.url.params["limit"])))
+
+    result = collect(make_client(handler), page_size=5)
+    assert len(result) == 5
+    assert len(requests) == 2
+
+
+def test_skips_filings_shifted_onto_next_page(make_client):
+    def handler(request):
+        offset = int(request.url.params["offset"])
+        # A filing published after the first page pushes everything down by one
+        start = offset - 1 if offset else 0
+        return envelope(filings(start, max(0, min(5, 12 - start))))
+
+    result = collect(make_client(handler), page_size=5)
+    numbers = [f.accession_number for f in result]
+    assert len(numbers) == len(set(numbers)) == 12
+
+
+def test_max_filings(make_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        offset = int(request.url.params["offset"])
+        return envelope(filings(offset, int(request.url.params["limit"])))
+
+    result = collect(make_client(handler), page_size=10, max_filings=15)
+    assert len(result) == 15
+    assert [int(r.url.params["limit"]) for r in requests] == [10, 5]
+
+
+def test_compact_filings_match_plain_ones(make_client):
+    def handler(request):
+        offset = int(request.url.params["offset"])
+        return envelope(filings(offset, max(0, min(10, 3 - offset))))
+
+    plain = collect(make_client(handler))
+    compact = collect(make_client(handler), compact_parsed_data=True)
+    assert not any(f.parsed_data_expanded for f in compact)
+    assert "parsed_data=<" in repr(compact[0]) and not compact[0].parsed_data_expanded
+    assert [dict(f) for f in compact] == [dict(f) for f in plain]
+    assert all(f.parsed_data_expanded for f in compact)
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from options_tools import QuotaScheduler, RateLimitError, request_priority
+from options_tools.client.quota import HIGH, LOW, NORMAL, parse_usage
+
+from conftest import envelope
+
+
+def test_parse_usage_shapes():
+    assert parse_usage({"requests_limit": 100, "requests_remaining": 40, "reset_in": 60}) == (100, 40, 60)
+    assert parse_usage({"requests": {"limit": 100, "used": 70}}) == (100, 30, None)
+    assert parse_usage({"plan": "free"}) == (None, None, None)
+
+
+def test_priority_from_endpoint_and_context():
+    scheduler = QuotaScheduler()
+    assert scheduler.priority_for("/analysis/exit/SPY") == HIGH
+    assert scheduler.priority_for("/options/chain/SPY") == NORMAL
+    with request_priority(LOW):
+        assert scheduler.priority_for("/analysis/exit/SPY") == LOW
+    with pytest.raises(ValueError):
+        with request_priority("urgent"):
+            pass
+
+
+def acquire(scheduler, endpoint, level=None):
+    async def main():
+        if level is None:
+            return await scheduler.acquire(endpoint)
+        with request_priority(level):
+            return await scheduler.acquire(endpoint)
+    return asyncio.run(main())
+
+
+def test_reserve_kept_for_high_priority():
+    scheduler = QuotaScheduler(reserve=0.1, max_wait=0)
+    scheduler.update({"limit": 100, "remaining": 10, "reset_in": 60})
+    with pytest.raises(RateLimitError) as excinfo:
+        acquire(scheduler, "/options/chain/SPY")
+    assert 59 < excinfo.value.retry_after <= 60
+    assert acquire(scheduler, "/analysis/exit/SPY") < 0.1
+    assert scheduler.remaining == 9
+    assert scheduler.sent[HIGH] == 1
+
+
+def test_low_priority_spread_over_window():
+    scheduler = QuotaScheduler(reserve=0.1, low_reserve=0.25, max_wait=1)
+    scheduler.update({"limit": 100, "remaining": 50, "reset_in": 100})
+    acquire(scheduler, "/sec/filings/AAPL", LOW)
+    # 25 requests may be spent over 100 s, so the next one is due in about 4 s
+    with pytest.raises(RateLimitError) as excinfo:
+        acquire(scheduler, "/sec/filings/MSFT", LOW)
+    assert 3.5 < excinfo.value.retry_after <= 4.0
+    assert acquire(scheduler, "/options/chain/SPY") < 0.1
+
+
+def test_usage_endpoint_never_waits():
+    scheduler = QuotaScheduler(max_wait=0)
+    scheduler.update({"limit": 100, "remaining": 0})
+    assert acquire(scheduler, "/account/usage") == 0
+
+
+def test_client_reads_usage_before_sending(make_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path.endswith("/account/usage"):
+            return envelope({"limit": 100, "remaining": 5, "reset_in": 60})
+        return envelope({"ok": True})
+
+    async def main():
+        quota = QuotaScheduler(max_wait=0)
+        async with make_client(handler, quota=quota) as client:
+            with pytest.raises(RateLimitError):
+                await client.get_options_chain("SPY")
+            return quota
+
+    quota = asyncio.run(main())
+    assert requests == ["/api/v1/account/usage"]
+    assert quota.remaining == 5
@@ -0,0 +1,64 @@
+import asyncio
+
+import httpx
+import pytest
+
+from options_tools import OptionsToolsClient, RecordReplayTransport, ReplayMissError
+
+from conftest import envelope
+
+
+def usage_calls(transport, times):
+    async def main():
+        async with OptionsToolsClient("test-key", transport=transport, cache=False) as client:
+            return [await client.get_api_usage(use_cache=False) for _ in range(times)]
+    return asyncio.run(main())
+
+
+def counting_server():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return envelope({"remaining": 100 - len(requests)})
+    return httpx.MockTransport(handler), requests
+
+
+def test_record_then_replay_offline(tmp_path):
+    path = str(tmp_path / "session.replay.gz")
+    server, requests = counting_server()
+    recorded = usage_calls(RecordReplayTransport(path, mode="record", transport=server), 2)
+    assert len(requests) == 2
+
+    replayed = usage_calls(RecordReplayTransport(path, mode="replay"), 3)
+    # Repeats replay in recorded order, then the last response repeats
+    assert replayed == recorded + recorded[-1:]
+    assert len(requests) == 2
+
+
+def test_replay_miss_raises(tmp_path):
+    path = str(tmp_path / "session.replay.gz")
+    server, _ = counting_server()
+    usage_calls(RecordReplayTransport(path, mode="record", transport=server), 1)
+
+    async def main():
+        transport = RecordReplayTransport(path, mode="replay")
+        async with OptionsToolsClient("test-key", transport=transport, cache=False) as client:
+            await client.get_api_usage(use_cache=False)
+            await client.get_options_chain("SPY")
+
+    with pytest.raises(ReplayMissError):
+        asyncio.run(main())
+
+
+def test_auto_mode_records_only_new_requests(tmp_path):
+    path = str(tmp_path / "session.replay.gz")
+    server, requests = counting_server()
+    usage_calls(RecordReplayTransport(path, mode="auto", transport=server), 1)
+    usage_calls(RecordReplayTransport(path, mode="auto", transport=server), 1)
+    assert len(requests) == 1
+
+
+def test_missing_archive_in_replay_mode(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        RecordReplayTransport(str(tmp_path / "absent.gz"), mode="replay")
@@ -0,0 +1,110 @@
+import asyncio
+
+import httpx
+import pytest
+
+from options_tools import CircuitBreaker, CircuitOpenError, ResponseCache
+from options_tools.client import resilience
+from options_tools.client.resilience import CLOSED, HALF_OPEN, OPEN
+from options_tools.utils.exceptions import ServerError
+
+from conftest import envelope
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(resilience, "time", clock)
+    return clock
+
+
+def test_opens_after_threshold_and_recovers(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_time=30)
+    endpoint = "/options/chain/SPY"
+    for _ in range(2):
+        breaker.record_failure(endpoint)
+    assert breaker.allow(endpoint)
+    breaker.record_failure(endpoint)
+    assert breaker.state(endpoint) == OPEN
+    assert not breaker.allow(endpoint)
+    assert breaker.retry_after(endpoint) == 30
+
+    clock.now += 30
+    assert breaker.allow(endpoint)
+    assert breaker.state(endpoint) == HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow(endpoint)
+    breaker.record_success(endpoint)
+    assert breaker.state(endpoint) == CLOSED
+    assert breaker.states() == {}
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=30)
+    breaker.record_failure("/x")
+    clock.now += 30
+    assert breaker.allow("/x")
+    breaker.record_failure("/x")
+    assert breaker.state("/x") == OPEN
+    assert not breaker.allow("/x")
+
+
+def test_circuits_per_endpoint_or_route(clock):
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure("/options/chain/BAD")
+    assert not breaker.allow("/options/chain/BAD")
+    assert breaker.allow("/options/chain/SPY")
+
+    grouped = CircuitBreaker(failure_threshold=1, per_route=True)
+    grouped.record_failure("/options/chain/BAD")
+    assert not grouped.allow("/options/chain/SPY")
+
+
+def test_client_fails_fast_then_serves_stale(make_client):
+    responses = iter([envelope({"remaining": 10})] + [httpx.Response(503)] * 10)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return next(responses)
+
+    cache = ResponseCache(ttls={"/account/usage": 0.01})
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+
+    async def main():
+        async with make_client(handler, cache=cache, circuit_breaker=breaker, max_retries=1) as client:
+            fresh = await client.get_api_usage()
+            await asyncio.sleep(0.02)
+            with pytest.raises(ServerError):
+                await client.get_api_usage()
+            # The second failure opens the circuit, so the stale copy is served
+            stale = await client.get_api_usage()
+            sent = len(requests)
+            again = await client.get_api_usage()
+            return fresh, stale, again, sent
+
+    fresh, stale, again, sent = asyncio.run(main())
+    assert stale == again == fresh
+    assert len(requests) == sent
+
+
+def test_open_circuit_without_cache_raises(make_client):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=60)
+
+    async def main():
+        async with make_client(lambda request: httpx.Response(503), circuit_breaker=breaker, max_retries=1) as client:
+            with pytest.raises(ServerError):
+                await client.get_api_usage(use_cache=False)
+            await client.get_api_usage(use_cache=False)
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        asyncio.run(main())
+    assert excinfo.value.retry_after > 0
@@ -0,0 +1,88 @@
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from options_tools import AuthenticationError, RateLimitError
+from options_tools.client.rate_limit import RateLimiter, parse_retry_after
+from options_tools.utils.exceptions import ServerError
+
+from conftest import envelope
+
+
+def usage(client):
+    async def main():
+        async with client:
+            return await client.get_api_usage(use_cache=False)
+    return asyncio.run(main())
+
+
+def sequence(*responses):
+    requests = []
+    pending = iter(responses)
+
+    def handler(request):
+        requests.append(request)
+        return next(pending)
+    return handler, requests
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+
+def test_429_retried_after_retry_after(make_client):
+    handler, requests = sequence(
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        envelope({"remaining": 10}),
+    )
+    assert usage(make_client(handler)) == {"remaining": 10}
+    assert len(requests) == 2
+
+
+def test_long_retry_after_raises_without_pausing(make_client):
+    handler, requests = sequence(httpx.Response(429, headers={"Retry-After": "3600"}))
+    client = make_client(handler, max_rate_limit_wait=5)
+    with pytest.raises(RateLimitError) as excinfo:
+        usage(client)
+    assert excinfo.value.retry_after == 3600
+    assert len(requests) == 1
+    assert client.rate_limiter.paused_for == 0
+
+
+def test_5xx_retried_then_raised(make_client):
+    handler, requests = sequence(httpx.Response(502), envelope({"ok": True}))
+    assert usage(make_client(handler)) == {"ok": True}
+
+    handler, requests = sequence(*[httpx.Response(503)] * 3)
+    with pytest.raises(ServerError):
+        usage(make_client(handler, max_retries=3))
+    assert len(requests) == 3
+
+
+def test_auth_error_not_retried(make_client):
+    handler, requests = sequence(httpx.Response(401))
+    with pytest.raises(AuthenticationError):
+        usage(make_client(handler))
+    assert len(requests) == 1
+
+
+def test_exhausted_window_pauses_limiter():
+    limiter = RateLimiter()
+    limiter.on_response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "60"}, max_pause=2)
+    assert 1 < limiter.paused_for <= 2
+
+
+def test_429_halves_rate():
+    limiter = RateLimiter(rate=10)
+    limiter.on_response(429, {})
+    assert limiter.rate == 5
+    limiter.on_response(200, {})
+    assert limiter.rate == 5.5
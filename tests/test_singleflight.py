@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import pytest
+
+from options_tools.client.singleflight import SingleFlight
+from options_tools.utils.exceptions import ServerError
+
+from conftest import envelope
+
+
+def test_identical_requests_share_one_call(make_client):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return envelope({"remaining": 10})
+
+    async def main():
+        async with make_client(handler) as client:
+            same = [client.get_api_usage(use_cache=False) for _ in range(5)]
+            return await asyncio.gather(*same)
+
+    assert asyncio.run(main()) == [{"remaining": 10}] * 5
+    assert len(requests) == 1
+
+
+def test_coalescing_can_be_disabled(make_client):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return envelope({"remaining": 10})
+
+    async def main():
+        async with make_client(handler, coalesce_requests=False) as client:
+            await asyncio.gather(*[client.get_api_usage(use_cache=False) for _ in range(3)])
+
+    asyncio.run(main())
+    assert len(requests) == 3
+
+
+def test_errors_reach_every_caller(make_client):
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(500)
+
+    async def main():
+        async with make_client(handler, max_retries=1) as client:
+            return await asyncio.gather(
+                *[client.get_api_usage(use_cache=False) for _ in range(3)], return_exceptions=True
+            )
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ServerError) for result in results)
+
+
+def test_cancelled_caller_leaves_others_waiting():
+    async def main():
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("key", fetch))
+        second = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == "done"
+        assert len(calls) == 1
+        assert len(flight) == 0
+
+    asyncio.run(main())
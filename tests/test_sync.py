@@ -0,0 +1,48 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from options_tools import OptionsTools, OptionsToolsError
+
+from conftest import contract, envelope
+
+
+def chain_server(requests):
+    def handler(request):
+        requests.append(threading.current_thread().name)
+        ticker = request.url.path.rsplit("/", 1)[1]
+        if ticker == "BAD":
+            return httpx.Response(404, json={"detail": "Unknown ticker"})
+        return envelope({
+            "ticker": ticker, "spot_price": 100.0, "timestamp": "2025-01-15T15:30:00Z",
+            "options": [contract(100, "call")],
+        })
+    return httpx.MockTransport(handler)
+
+
+def test_calls_from_many_threads_share_one_loop():
+    requests = []
+    with OptionsTools("test-key", transport=chain_server(requests)) as client:
+        with ThreadPoolExecutor(8) as pool:
+            chains = list(pool.map(lambda t: client.get_options_chain(t, use_cache=False), ["SPY"] * 16))
+    assert all(chain.ticker == "SPY" for chain in chains)
+    assert set(requests) == {"options-tools-loop"}
+
+
+def test_batch_reports_each_ticker():
+    with OptionsTools("test-key", transport=chain_server([]), max_retries=1) as client:
+        results = client.get_options_chains(["SPY", "BAD", "QQQ"], max_concurrency=2)
+    assert set(results) == {"SPY", "BAD", "QQQ"}
+    assert results["SPY"].ok and results["QQQ"].result.ticker == "QQQ"
+    assert not results["BAD"].ok
+
+
+def test_closed_client_rejects_calls():
+    client = OptionsTools("test-key", transport=chain_server([]))
+    client.get_options_chain("SPY")
+    client.close()
+    client.close()
+    with pytest.raises(OptionsToolsError):
+        client.get_options_chain("SPY")
@@ -0,0 +1,71 @@
+import asyncio
+
+import httpx
+import pytest
+
+from options_tools import AuthenticationError, ValidationError
+
+from conftest import envelope
+
+
+def chain(bid=1.0):
+    return {
+        "ticker": "SPY",
+        "spot_price": 470.5,
+        "timestamp": "2025-01-15T15:30:00Z",
+        "options": [{
+            "strike": 470.0, "expiration": "2025-01-17", "type": "call",
+            "bid": bid, "ask": 1.2, "last": 1.1, "volume": 10, "open_interest": 100,
+            "implied_volatility": 0.3, "delta": 0.5, "gamma": 0.01, "theta": -0.02, "vega": 0.1,
+        }],
+    }
+
+
+def watch(client, limit):
+    async def main():
+        diffs = []
+        async with client:
+            async for diff in client.watch_options_chain("SPY", interval=0):
+                diffs.append(diff)
+                if len(diffs) == limit:
+                    break
+        return diffs
+    return asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+
+def test_yields_only_changes(make_client):
+    bids = iter([1.0, 1.0, 1.0, 1.5])
+
+    def handler(request):
+        return envelope(chain(next(bids)))
+
+    initial, change = watch(make_client(handler), 2)
+    assert len(initial.added) == 1
+    assert change.changed[0].fields == {"bid": (1.0, 1.5)}
+
+
+def test_transient_errors_are_skipped(make_client):
+    responses = iter([
+        envelope(chain(1.0)),
+        httpx.Response(503),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        envelope(chain(2.0)),
+    ])
+
+    def handler(request):
+        return next(responses)
+
+    initial, change = watch(make_client(handler, max_retries=1), 2)
+    # Diffed against the last chain received before the failed polls
+    assert change.changed[0].fields == {"bid": (1.0, 2.0)}
+
+
+@pytest.mark.parametrize("status, error", [(401, AuthenticationError), (422, ValidationError)])
+def test_permanent_errors_end_the_watch(make_client, status, error):
+    responses = iter([envelope(chain()), httpx.Response(status, json={"detail": "bad"})])
+
+    def handler(request):
+        return next(responses)
+
+    with pytest.raises(error):
+        watch(make_client(handler, max_retries=1), 10)